@@ -1,20 +1,456 @@
 import sys
+import time
+
+STARTED = time.perf_counter()  # Soğuk başlangıç ölçümünün referansı
+STARTUP_BUDGET_MS = 500  # --measure-startup: pencere gösterilene kadar izin verilen süre
+GUI_FLAGS = ("--measure-startup",)
+
+
+def wants_cli(argv):
+    """Argümanlar komut satırı alt komutu mu? (Qt seçenekleri tek tire ile başlar)"""
+    return bool(argv) and (not argv[0].startswith("-") or argv[0].startswith("--") and argv[0] not in GUI_FLAGS)
+
+
+# Alt komutlar (encode, decode, bench, serve, ...) Qt yüklenmeden çalışır
+if __name__ == "__main__" and wants_cli(sys.argv[1:]):
+    from hamming_secded.cli import main as cli_main
+    sys.exit(cli_main(sys.argv[1:]))
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, 
-    QLabel, QLineEdit, QPushButton, QTextEdit, QListWidget, 
-    QMessageBox, QSpinBox, QGroupBox, QGridLayout, QFrame,
-    QScrollArea, QSizePolicy, QListWidgetItem, QStatusBar, QShortcut
+    QLabel, QLineEdit, QPushButton, QTableView, QHeaderView, QAbstractItemView, 
+    QMessageBox, QSpinBox, QComboBox, QGroupBox,
+    QScrollArea, QStatusBar, QShortcut, QFileDialog
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QPixmap, QPainter, QColor, QPen, QBrush, QKeySequence, QClipboard
-import math
-import time
+from PyQt5.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex, QEvent, QRect, QThread, pyqtSignal
+from PyQt5.QtGui import QFont, QPainter, QColor, QPen, QBrush, QKeySequence
+from PyQt5.QtWidgets import QToolTip
+
+from hamming_secded import telemetry
+from hamming_secded import (
+    Codec, CodeState, CLEAN, CORRECTED, SECDED_BIT, DOUBLE, MAX_WIDTH, HAMMING, HSIAO, pack, unpack,
+)
+from hamming_secded.bank import MemoryBank, MappedBank, ENTRY_CORRECTABLE, ENTRY_UNCORRECTABLE
+from hamming_secded.scrub import Scrubber, DEFAULT_CPU_SHARE
+
+TELEMETRY_INTERVAL = 500  # Durum çubuğundaki telemetri özetinin yenilenme aralığı (ms)
+BANK_FILE_FILTER = "Bellek Bankası (*.hsbank);;Tüm Dosyalar (*)"
+
+# Düğme renkleri: rol -> (arka plan, üzerine gelince, basılınca, dolgu, yazı boyutu);
+# tarama düğmesinde üçüncü renk basılı (açık) durumun rengidir
+BUTTON_STYLES = {
+    "encode": ("#16a085", "#138d75", "#117a65", "12px 25px", 15),
+    "save": ("#2471a3", "#1f618d", "#1a5276", "12px 20px", 14),
+    "error": ("#e74c3c", "#c0392b", "#a93226", "10px 20px", 14),
+    "correct": ("#27ae60", "#229954", "#1e8449", "10px 20px", 14),
+    "read": ("#3498db", "#2980b9", "#21618c", "10px 15px", 13),
+    "delete": ("#e67e22", "#d35400", "#ba4a00", "10px 15px", 13),
+    "clear": ("#8e44ad", "#7d3c98", "#6c3483", "10px 15px", 13),
+    "file": ("#34495e", "#2c3e50", "#1b2631", "10px 15px", 13),
+    "scrub": ("#7f8c8d", "#707b7c", "#16a085", "10px 15px", 13),
+}
+
+# Renk açıklama etiketleri: rol -> (dolgu, kenar)
+LEGEND_STYLES = {
+    "legend-data": ("#2ecc71", "#27ae60"),
+    "legend-parity": ("#3498db", "#2980b9"),
+    "legend-secded": ("#9b59b6", "#8e44ad"),
+    "legend-single": ("#e74c3c", "#c0392b"),
+    "legend-double": ("#f39c12", "#e67e22"),
+}
+
+BASE_STYLESHEET = """
+QMainWindow {
+    background-color: #ecf0f1;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #bdc3c7;
+    border-radius: 8px;
+    margin-top: 10px;
+    padding-top: 10px;
+    background-color: white;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 8px 0 8px;
+    color: #2c3e50;
+    background-color: white;
+}
+QPushButton {
+    color: white;
+    border: none;
+    padding: 10px 20px;
+    font-size: 14px;
+    border-radius: 6px;
+    font-weight: bold;
+}
+QLineEdit, QSpinBox {
+    padding: 8px;
+    border: 2px solid #bdc3c7;
+    border-radius: 4px;
+    font-size: 14px;
+    background-color: white;
+    color: black;
+}
+QLineEdit:focus, QSpinBox:focus {
+    border-color: #3498db;
+}
+QTableView {
+    border: 2px solid #bdc3c7;
+    border-radius: 4px;
+    background-color: white;
+    color: black;
+    font-family: 'Courier New', monospace;
+    font-size: 12px;
+}
+QTableView::item {
+    padding: 5px;
+    border-bottom: 1px solid #ecf0f1;
+}
+QTableView::item:selected {
+    background-color: #3498db;
+    color: white;
+}
+QTableView::item:hover {
+    background-color: #ebf3fd;
+    color: black;
+}
+QLabel {
+    color: #2c3e50;
+}
+QLabel[role="title"] {
+    color: #2c3e50;
+    margin: 10px;
+}
+QLabel[role="hint"] {
+    color: #7f8c8d;
+    font-size: 11px;
+    font-style: italic;
+}
+QLabel[role="muted"] {
+    color: #7f8c8d;
+}
+"""
+
+
+def build_stylesheet():
+    """Pencerenin tek stil sayfası: temel kurallar + rol başına düğme ve etiket kuralları"""
+    rules = [BASE_STYLESHEET]
+    for role, (color, hover, pressed, padding, size) in BUTTON_STYLES.items():
+        selector = f'QPushButton[role="{role}"]'
+        state = ":checked" if role == "scrub" else ":pressed"
+        rules.append(f"{selector} {{ background-color: {color}; padding: {padding}; font-size: {size}px; }}\n"
+                     f"{selector}:hover {{ background-color: {hover}; }}\n"
+                     f"{selector}{state} {{ background-color: {pressed}; }}")
+    for role, (fill, border) in LEGEND_STYLES.items():
+        rules.append(f'QLabel[role="{role}"] {{ background-color: {fill}; color: white; border: 2px solid {border}; '
+                     f"border-radius: 4px; padding: 5px; font-weight: bold; }}")
+    return "\n".join(rules)
+
+
+class BitStripWidget(QWidget):
+    """Kod bitlerini tek bir widget üzerinde çizen görselleştirme
+
+    Her bit için ayrı widget oluşturmak yerine hücreler paintEvent içinde
+    çizilir; yalnızca görünen alandaki hücreler boyanır ve tooltip fare
+    konumundan hesaplanır.
+    """
+    
+    CELL = 40  # Bit kutusu boyutu
+    PITCH = 50  # Hücreler arası mesafe
+    MARGIN = 10
+    LABEL_HEIGHT = 20
+    
+    # (dolgu, kenar) renkleri
+    DATA_COLORS = ("#2ecc71", "#27ae60")
+    PARITY_COLORS = ("#3498db", "#2980b9")
+    SECDED_COLORS = ("#9b59b6", "#8e44ad")
+    SINGLE_ERROR_COLORS = ("#e74c3c", "#c0392b")
+    DOUBLE_ERROR_COLORS = ("#f39c12", "#e67e22")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.code = None
+        self.error_positions = set()
+        self.parity_positions = frozenset()
+        self.secded_index = -1  # SEC-DED bitinin indeksi (Hsiao kodunda yok)
+        self.bit_font = QFont("Courier New", 16, QFont.Bold)
+        self.pos_font = QFont("Arial", 10)
+        self.brushes = {}
+        self.pens = {}
+        for colors in (self.DATA_COLORS, self.PARITY_COLORS, self.SECDED_COLORS,
+                       self.SINGLE_ERROR_COLORS, self.DOUBLE_ERROR_COLORS):
+            self.brushes[colors] = QBrush(QColor(colors[0]))
+            self.pens[colors] = QPen(QColor(colors[1]), 2)
+        self.setMouseTracking(True)
+    
+    def set_code(self, code, error_positions=(), codec=None):
+        """Gösterilecek kodu ve hatalı bitleri ayarlama (None: temizle)"""
+        self.code = None if code is None else list(code)
+        self.error_positions = set(error_positions)
+        if code is None:
+            self.parity_positions = frozenset()
+            self.secded_index = -1
+            self.setMinimumSize(0, 0)
+        else:
+            if codec is None:
+                codec = Codec.for_code_length(len(code))
+            self.parity_positions = codec.parity_positions
+            self.secded_index = len(code) - 1 if codec.secded_bit else -1
+            self.setMinimumSize(2 * self.MARGIN + len(code) * self.PITCH,
+                                2 * self.MARGIN + self.CELL + self.LABEL_HEIGHT)
+        self.update()
+    
+    def cell_rect(self, i):
+        """i. bitin kutusunun dikdörtgeni"""
+        top = max(self.MARGIN, (self.height() - self.CELL - self.LABEL_HEIGHT) // 2)
+        return QRect(self.MARGIN + i * self.PITCH + (self.PITCH - self.CELL) // 2, top,
+                     self.CELL, self.CELL)
+    
+    def cell_at(self, x):
+        """x koordinatındaki bitin indeksi (yoksa -1)"""
+        if self.code is None:
+            return -1
+        i = (x - self.MARGIN) // self.PITCH
+        return i if 0 <= i < len(self.code) else -1
+    
+    def cell_colors(self, i):
+        """Renk belirleme"""
+        if i in self.error_positions:
+            if len(self.error_positions) == 1:
+                return self.SINGLE_ERROR_COLORS  # Kırmızı - tek hata
+            return self.DOUBLE_ERROR_COLORS  # Sarı - çift hata
+        if i == self.secded_index:
+            return self.SECDED_COLORS  # SEC-DED biti
+        if i in self.parity_positions:
+            return self.PARITY_COLORS  # Parity biti
+        return self.DATA_COLORS  # Veri biti
+    
+    def update_cell(self, i):
+        """Yalnızca i. hücreyi yeniden boyama"""
+        rect = self.cell_rect(i)
+        self.update(rect.x() - 2, 0, rect.width() + 4, self.height())
+    
+    def flip_bit(self, i):
+        """i. biti ters çevirip hatalı işaretleme; yalnızca etkilenen hücreleri boyar"""
+        self.code[i] ^= 1
+        was_single = len(self.error_positions) == 1
+        self.error_positions.add(i)
+        if was_single and len(self.error_positions) > 1:
+            # Tek hatadan çift hataya geçiş: önceki hücrenin rengi de değişir
+            for j in self.error_positions:
+                self.update_cell(j)
+        else:
+            self.update_cell(i)
+    
+    def paintEvent(self, event):
+        if self.code is None:
+            return
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Yalnızca boyanması gereken alandaki hücreler
+        exposed = event.rect()
+        first = max(0, (exposed.left() - self.MARGIN) // self.PITCH)
+        last = min(len(self.code) - 1, (exposed.right() - self.MARGIN) // self.PITCH)
+        
+        for i in range(first, last + 1):
+            rect = self.cell_rect(i)
+            colors = self.cell_colors(i)
+            painter.setPen(self.pens[colors])
+            painter.setBrush(self.brushes[colors])
+            painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 4, 4)
+            
+            # Bit değeri
+            painter.setPen(Qt.white)
+            painter.setFont(self.bit_font)
+            painter.drawText(rect, Qt.AlignCenter, str(self.code[i]))
+            
+            # Pozisyon numarası
+            painter.setPen(QColor("#2c3e50"))
+            painter.setFont(self.pos_font)
+            label_rect = QRect(self.MARGIN + i * self.PITCH, rect.bottom() + 2, self.PITCH, self.LABEL_HEIGHT)
+            painter.drawText(label_rect, Qt.AlignCenter, str(i + 1))
+    
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            i = self.cell_at(event.pos().x())
+            if i < 0 or not self.cell_rect(i).adjusted(0, 0, 0, self.LABEL_HEIGHT).contains(event.pos()):
+                QToolTip.hideText()
+                event.ignore()
+                return True
+            
+            # Tooltip
+            if i == self.secded_index:
+                text = "SEC-DED Parity (overall parity biti)"
+            elif i in self.parity_positions:
+                text = "Parity biti"
+            else:
+                text = "Veri biti"
+            QToolTip.showText(event.globalPos(), f"{text} - Pozisyon {i + 1}", self)
+            return True
+        return super().event(event)
+
+
+class ScrubThread(QThread):
+    """Bellek bankasını arka planda tarayan iş parçacığı
+
+    Tarama ``hamming_secded.scrub.Scrubber`` ile yapılır; ilerleme en fazla
+    ``PROGRESS_INTERVAL`` saniyede bir, düzeltilen ve düzeltilemeyen
+    kayıtlar ise bulundukları parçadan sonra sinyal olarak gönderilir.
+    """
+    
+    PROGRESS_INTERVAL = 0.1
+    
+    progress = pyqtSignal(int, int, int)  # (taranan, toplam, tamamlanan geçiş)
+    corrected = pyqtSignal(list)  # Yerinde düzeltilen satırlar
+    flagged = pyqtSignal(list)  # Düzeltilemeyen satırlar
+    
+    def __init__(self, bank, rate=None, cpu_share=None, parent=None):
+        super().__init__(parent)
+        self.scrubber = Scrubber(bank, rate, cpu_share)
+        self.last_progress = 0.0
+    
+    def stop(self):
+        """Taramayı durdurma ve iş parçacığının bitmesini bekleme"""
+        self.scrubber.stop()
+        self.wait()
+    
+    def report(self, step):
+        if step.corrected:
+            self.corrected.emit(step.corrected)
+        if step.uncorrectable:
+            self.flagged.emit(step.uncorrectable)
+        finished = step.stop == step.total
+        now = time.monotonic()
+        if finished or now - self.last_progress >= self.PROGRESS_INTERVAL:
+            self.last_progress = now
+            self.progress.emit(step.stop, step.total, self.scrubber.passes + finished)
+    
+    def run(self):
+        # Durum dizini ilk kez burada kurulur; tarama onu güncel tutar
+        self.scrubber.bank.status_index()
+        self.scrubber.run(self.report)
+
+
+class MemoryBankModel(QAbstractListModel):
+    """Bellek bankası üzerinde liste modeli (satırlar görüntülendikçe biçimlenir)
+
+    Satır renkleri bankanın durum dizininden okunur (dizin kurulmuşsa).
+    ``set_filter`` ile yalnızca bir sınıftaki kayıtlar gösterilir; bu
+    durumda satırlar dizinden alınan banka indeksleridir ve metotlar
+    satır değil banka indeksi alır.
+    """
+    
+    ENTRY_COLORS = {
+        ENTRY_CORRECTABLE: QColor("#d6eaf8"),  # Tek bit hatalı kayıtlar
+        ENTRY_UNCORRECTABLE: QColor("#fdebd0"),  # Düzeltilemeyen kayıtlar
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.bank = None
+        self.kind = None  # Gösterilen kayıt sınıfı (None: hepsi)
+        self.rows = None  # Süzgeç açıkken gösterilen banka indeksleri
+    
+    def set_bank(self, bank):
+        """Gösterilen bankayı değiştirme"""
+        self.beginResetModel()
+        self.bank = bank
+        self.rows = self.find_rows()
+        self.endResetModel()
+    
+    def set_filter(self, kind):
+        """Yalnızca ``kind`` sınıfındaki kayıtları gösterme (None: hepsi)"""
+        self.beginResetModel()
+        self.kind = kind
+        self.rows = self.find_rows()
+        self.endResetModel()
+    
+    def find_rows(self):
+        if self.kind is None or self.bank is None:
+            return None
+        return self.bank.status_index().find(self.kind)
+    
+    def refilter(self):
+        """Süzgeç açıksa gösterilen kayıtları dizinden yenileme"""
+        if self.kind is not None:
+            self.set_filter(self.kind)
+    
+    def bank_index(self, row):
+        """Satırın banka indeksi"""
+        return self.rows[row] if self.rows is not None else row
+    
+    def refresh_rows(self, indices):
+        """Kayıtların yeniden çizilmesi (ör. tarayıcı yerinde düzelttiğinde)"""
+        if self.rows is not None:
+            self.refilter()
+            return
+        count = self.rowCount()
+        for row in indices:
+            if row < count:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.bank is None:
+            return 0
+        return len(self.rows) if self.rows is not None else len(self.bank)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.BackgroundRole:
+            statuses = self.bank.status_index(build=False)
+            if statuses is None:
+                return None
+            return self.ENTRY_COLORS.get(statuses.kind(self.bank_index(index.row())))
+        if role != Qt.DisplayRole:
+            return None
+        word = self.bank.read(self.bank_index(index.row()))
+        data = format(self.bank.codec.extract_int(word), f"0{self.bank.width}b")
+        code_str = format(word, f"0{self.bank.length}b")
+        return f"Veri: {data} | Kod: {code_str}"
+    
+    def append(self, word):
+        """Bankaya kod ekleme; banka indeksini döndürür"""
+        if self.rows is not None:
+            index = self.bank.append(word)
+            self.refilter()
+            return index
+        row = len(self.bank)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.bank.append(word)
+        self.endInsertRows()
+        return row
+    
+    def write(self, index, word):
+        """Banka kaydını güncelleme"""
+        self.bank.write(index, word)
+        self.refresh_rows([index])
+    
+    def delete(self, index):
+        """Banka kaydını silme"""
+        if self.rows is not None:
+            self.bank.delete(index)
+            self.refilter()
+            return
+        self.beginRemoveRows(QModelIndex(), index, index)
+        self.bank.delete(index)
+        self.endRemoveRows()
+
 
 class HammingSimulator(QMainWindow):
     def __init__(self):
         super().__init__()
         self.active_code = None
+        self.active_state = None  # Aktif kodun artımlı sendrom durumu
         self.error_positions = set()
+        self.memory_bank = None
+        self.scrub_thread = None
         self.clipboard = QApplication.clipboard()
         self.init_ui()
         self.setup_shortcuts()
@@ -24,6 +460,10 @@ class HammingSimulator(QMainWindow):
         self.setWindowTitle("Hamming SEC-DED Kodlayıcı - BLM230 Bilgisayar Mimarisi")
         self.setGeometry(100, 100, 1200, 800)
         
+        # Tek stil sayfası, widget'lar oluşturulmadan önce uygulanır; böylece
+        # her widget yalnızca bir kez biçimlenir
+        self.setStyleSheet(build_stylesheet())
+        
         # Ana widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -33,7 +473,7 @@ class HammingSimulator(QMainWindow):
         title_label = QLabel("Hamming SEC-DED Kodlayıcı")
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setFont(QFont("Arial", 24, QFont.Bold))
-        title_label.setStyleSheet("color: #2c3e50; margin: 10px;")
+        title_label.setProperty("role", "title")
         main_layout.addWidget(title_label)
         
         # Veri giriş paneli
@@ -51,69 +491,6 @@ class HammingSimulator(QMainWindow):
         # Renk açıklama paneli
         self.setup_legend_panel(main_layout)
         
-        # Stil ayarları
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ecf0f1;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #2c3e50;
-                background-color: white;
-            }
-            QPushButton {
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QLineEdit, QSpinBox {
-                padding: 8px;
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-                font-size: 14px;
-                background-color: white;
-                color: black;
-            }
-            QLineEdit:focus, QSpinBox:focus {
-                border-color: #3498db;
-            }
-            QListWidget {
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-                background-color: white;
-                color: black;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #ecf0f1;
-            }
-            QListWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QListWidget::item:hover {
-                background-color: #ebf3fd;
-                color: black;
-            }
-            QLabel {
-                color: #2c3e50;
-            }
-        """)
     
     def setup_input_panel(self, main_layout):
         """Veri giriş paneli kurulumu"""
@@ -122,8 +499,8 @@ class HammingSimulator(QMainWindow):
         
         input_layout.addWidget(QLabel("Binary Veri:"))
         
-        self.data_input = QLineEdit("8, 16 veya 32 bitlik veri giriniz!")
-        self.data_input.setPlaceholderText("8, 16 veya 32 bitlik binary veri")
+        self.data_input = QLineEdit("8, 16, 32, 64... bitlik veri giriniz!")
+        self.data_input.setPlaceholderText("1-4096 bitlik binary veri (8, 16, 32, 64...)")
         self.data_input.setFont(QFont("Courier New", 12))
         input_layout.addWidget(self.data_input)
         
@@ -131,48 +508,25 @@ class HammingSimulator(QMainWindow):
         self.data_input.focusInEvent = self.input_focus_in
         self.data_input.focusOutEvent = self.input_focus_out
         
+        # Kod ailesi seçimi
+        input_layout.addWidget(QLabel("Kod:"))
+        self.family_combo = QComboBox()
+        self.family_combo.addItem("Hamming", HAMMING)
+        self.family_combo.addItem("Hsiao", HSIAO)
+        self.family_combo.setToolTip("Hamming: parity 2'nin kuvveti pozisyonlarda + SEC-DED biti\n"
+                                     "Hsiao: tek ağırlıklı sütunlar, kontrol bitleri sonda")
+        input_layout.addWidget(self.family_combo)
+        
         self.encode_btn = QPushButton("Kodla")
         self.encode_btn.clicked.connect(self.encode_data)
         # Yeşil-mavi renk - kodlama (ana işlem)
-        self.encode_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #16a085;
-                color: white;
-                border: none;
-                padding: 12px 25px;
-                font-size: 15px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #138d75;
-            }
-            QPushButton:pressed {
-                background-color: #117a65;
-            }
-        """)
+        self.encode_btn.setProperty("role", "encode")
         input_layout.addWidget(self.encode_btn)
         
         self.save_to_memory_btn = QPushButton("Belleğe Kaydet")
         self.save_to_memory_btn.clicked.connect(self.save_to_memory)
         # Koyu mavi renk - kaydetme
-        self.save_to_memory_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2471a3;
-                color: white;
-                border: none;
-                padding: 12px 20px;
-                font-size: 14px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1f618d;
-            }
-            QPushButton:pressed {
-                background-color: #1a5276;
-            }
-        """)
+        self.save_to_memory_btn.setProperty("role", "save")
         input_layout.addWidget(self.save_to_memory_btn)
         
         main_layout.addWidget(input_group)
@@ -190,10 +544,8 @@ class HammingSimulator(QMainWindow):
         scroll_area.setMinimumHeight(120)
         scroll_area.setMaximumHeight(150)
         
-        self.bits_widget = QWidget()
-        self.bits_layout = QHBoxLayout(self.bits_widget)
-        self.bits_layout.setSpacing(5)
-        scroll_area.setWidget(self.bits_widget)
+        self.bit_strip = BitStripWidget()
+        scroll_area.setWidget(self.bit_strip)
         
         viz_layout.addWidget(scroll_area)
         main_layout.addWidget(viz_group)
@@ -212,45 +564,13 @@ class HammingSimulator(QMainWindow):
         self.add_error_btn = QPushButton("Hata Ekle")
         self.add_error_btn.clicked.connect(self.add_error)
         # Kırmızı renk - hata ekleme
-        self.add_error_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
+        self.add_error_btn.setProperty("role", "error")
         error_layout.addWidget(self.add_error_btn)
         
         self.correct_btn = QPushButton("Düzelt")
         self.correct_btn.clicked.connect(self.correct_errors)
         # Yeşil renk - düzeltme
-        self.correct_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:pressed {
-                background-color: #1e8449;
-            }
-        """)
+        self.correct_btn.setProperty("role", "correct")
         error_layout.addWidget(self.correct_btn)
         
         main_layout.addWidget(error_group)
@@ -260,10 +580,37 @@ class HammingSimulator(QMainWindow):
         memory_group = QGroupBox("Bellek")
         memory_layout = QVBoxLayout(memory_group)
         
+        # Kayıt süzgeci ve sayıları bankanın durum dizininden okunur
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Göster:"))
+        self.memory_filter_combo = QComboBox()
+        self.memory_filter_combo.addItem("Tümü", None)
+        self.memory_filter_combo.addItem("Düzeltilebilir", ENTRY_CORRECTABLE)
+        self.memory_filter_combo.addItem("Düzeltilemez", ENTRY_UNCORRECTABLE)
+        self.memory_filter_combo.currentIndexChanged.connect(self.filter_memory)
+        filter_layout.addWidget(self.memory_filter_combo)
+        self.memory_counts_label = QLabel("")
+        self.memory_counts_label.setProperty("role", "muted")
+        filter_layout.addWidget(self.memory_counts_label)
+        filter_layout.addStretch()
+        memory_layout.addLayout(filter_layout)
+        
         # Memory list
-        self.memory_list = QListWidget()
+        # Tek sütunlu tablo: sabit satır yüksekliği sayesinde açılış ve kaydırma
+        # maliyeti kayıt sayısından bağımsızdır
+        self.memory_model = MemoryBankModel(self)
+        self.memory_list = QTableView()
+        self.memory_list.setModel(self.memory_model)
+        self.memory_list.horizontalHeader().hide()
+        self.memory_list.horizontalHeader().setStretchLastSection(True)
+        self.memory_list.verticalHeader().hide()
+        self.memory_list.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.memory_list.verticalHeader().setDefaultSectionSize(26)
+        self.memory_list.setShowGrid(False)
+        self.memory_list.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.memory_list.setSelectionMode(QAbstractItemView.SingleSelection)
         self.memory_list.setMaximumHeight(200)
-        self.memory_list.itemDoubleClicked.connect(self.read_from_memory)
+        self.memory_list.doubleClicked.connect(self.read_from_memory)
         memory_layout.addWidget(self.memory_list)
         
         # Memory buttons
@@ -272,70 +619,53 @@ class HammingSimulator(QMainWindow):
         self.read_memory_btn = QPushButton("Bellekten Oku")
         self.read_memory_btn.clicked.connect(self.read_from_memory)
         # Mavi renk - okuma
-        self.read_memory_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 10px 15px;
-                font-size: 13px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        self.read_memory_btn.setProperty("role", "read")
         memory_btn_layout.addWidget(self.read_memory_btn)
         
         self.delete_memory_btn = QPushButton("Bellekten Sil")
         self.delete_memory_btn.clicked.connect(self.delete_from_memory)
         # Turuncu renk - silme
-        self.delete_memory_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e67e22;
-                color: white;
-                border: none;
-                padding: 10px 15px;
-                font-size: 13px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #d35400;
-            }
-            QPushButton:pressed {
-                background-color: #ba4a00;
-            }
-        """)
+        self.delete_memory_btn.setProperty("role", "delete")
         memory_btn_layout.addWidget(self.delete_memory_btn)
         
         self.clear_all_btn = QPushButton("Tümünü Temizle")
         self.clear_all_btn.clicked.connect(self.clear_all)
         # Mor renk - tümünü temizle
-        self.clear_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8e44ad;
-                color: white;
-                border: none;
-                padding: 10px 15px;
-                font-size: 13px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7d3c98;
-            }
-            QPushButton:pressed {
-                background-color: #6c3483;
-            }
-        """)
+        self.clear_all_btn.setProperty("role", "clear")
         memory_btn_layout.addWidget(self.clear_all_btn)
         
+        # Dosyaya kaydedilen banka eşlenmiş olarak açık kalır; sonraki kayıtlar dosyaya eklenir
+        self.save_bank_btn = QPushButton("Dosyaya Kaydet")
+        self.save_bank_btn.clicked.connect(self.save_bank_file)
+        self.open_bank_btn = QPushButton("Dosyadan Aç")
+        self.open_bank_btn.clicked.connect(self.open_bank_file)
+        # Lacivert renk - dosya işlemleri
+        for button in (self.save_bank_btn, self.open_bank_btn):
+            button.setProperty("role", "file")
+            memory_btn_layout.addWidget(button)
+        
         memory_layout.addLayout(memory_btn_layout)
+        
+        # Arka plan taraması: hız 0 ise CPU payı ile sınırlanır
+        scrub_layout = QHBoxLayout()
+        scrub_layout.addWidget(QLabel("Tarama hızı:"))
+        self.scrub_rate_spin = QSpinBox()
+        self.scrub_rate_spin.setRange(0, 10_000_000)
+        self.scrub_rate_spin.setSingleStep(1000)
+        self.scrub_rate_spin.setSuffix(" kelime/sn")
+        self.scrub_rate_spin.setSpecialValueText(f"CPU %{DEFAULT_CPU_SHARE * 100:.0f}")
+        self.scrub_rate_spin.valueChanged.connect(self.restart_scrub)
+        scrub_layout.addWidget(self.scrub_rate_spin)
+        
+        self.scrub_btn = QPushButton("Taramayı Başlat")
+        self.scrub_btn.setCheckable(True)
+        self.scrub_btn.toggled.connect(self.toggle_scrub)
+        # Gri renk - tarama
+        self.scrub_btn.setProperty("role", "scrub")
+        scrub_layout.addWidget(self.scrub_btn)
+        scrub_layout.addStretch()
+        
+        memory_layout.addLayout(scrub_layout)
         main_layout.addWidget(memory_group)
     
     def setup_legend_panel(self, main_layout):
@@ -345,32 +675,32 @@ class HammingSimulator(QMainWindow):
         
         # Veri biti
         data_label = QLabel("Veri Biti")
-        data_label.setStyleSheet("background-color: #2ecc71; color: white; border: 2px solid #27ae60; border-radius: 4px; padding: 5px; font-weight: bold;")
+        data_label.setProperty("role", "legend-data")
         legend_layout.addWidget(data_label)
         
         # Parity biti
         parity_label = QLabel("Parity Biti")
-        parity_label.setStyleSheet("background-color: #3498db; color: white; border: 2px solid #2980b9; border-radius: 4px; padding: 5px; font-weight: bold;")
+        parity_label.setProperty("role", "legend-parity")
         legend_layout.addWidget(parity_label)
         
         # SEC-DED biti
         secded_label = QLabel("SEC-DED Biti")
-        secded_label.setStyleSheet("background-color: #9b59b6; color: white; border: 2px solid #8e44ad; border-radius: 4px; padding: 5px; font-weight: bold;")
+        secded_label.setProperty("role", "legend-secded")
         legend_layout.addWidget(secded_label)
         
         # Tek hata
         single_error_label = QLabel("Tek Hata")
-        single_error_label.setStyleSheet("background-color: #e74c3c; color: white; border: 2px solid #c0392b; border-radius: 4px; padding: 5px; font-weight: bold;")
+        single_error_label.setProperty("role", "legend-single")
         legend_layout.addWidget(single_error_label)
         
         # Çift hata
         double_error_label = QLabel("Çift Hata")
-        double_error_label.setStyleSheet("background-color: #f39c12; color: white; border: 2px solid #e67e22; border-radius: 4px; padding: 5px; font-weight: bold;")
+        double_error_label.setProperty("role", "legend-double")
         legend_layout.addWidget(double_error_label)
         
         # Klavye kısayolları
         shortcuts_label = QLabel("Kısayollar: Ctrl+N: Temizle | Ctrl+C: Kopyala | Ctrl+V: Yapıştır | F5: Yenile | Del: Sil")
-        shortcuts_label.setStyleSheet("color: #7f8c8d; font-size: 11px; font-style: italic;")
+        shortcuts_label.setProperty("role", "hint")
         shortcuts_label.setAlignment(Qt.AlignCenter)
         shortcuts_label.setWordWrap(True)
         
@@ -410,22 +740,49 @@ class HammingSimulator(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Hamming SEC-DED Simülatörü Hazır - Binary veri girin ve kodlayın")
+        
+        # Tarama ilerlemesi kalıcı olarak sağda gösterilir
+        self.scrub_label = QLabel("")
+        self.status_bar.addPermanentWidget(self.scrub_label)
+        self.scrub_stats = {"corrected": 0, "flagged": 0}
+        
+        # Telemetri özeti (toplama açıksa) periyodik olarak güncellenir
+        self.telemetry_label = QLabel("")
+        self.telemetry_label.setProperty("role", "muted")
+        self.status_bar.addPermanentWidget(self.telemetry_label)
+        self.telemetry_timer = QTimer(self)
+        self.telemetry_timer.timeout.connect(self.update_telemetry)
+        if telemetry.enabled:
+            self.telemetry_timer.start(TELEMETRY_INTERVAL)
+    
+    def update_telemetry(self):
+        """Telemetri sayaçlarını durum çubuğunda gösterme"""
+        metrics = telemetry.METRICS
+        decodes = metrics.counter("decodes_total")
+        corrected = metrics.counter("decodes_total", status="corrected")
+        corrected += metrics.counter("decodes_total", status="secded-bit")
+        uncorrectable = metrics.counter("decodes_total", status="double")
+        latency = metrics.mean_latency("decode")
+        text = (f"Kodlama: {metrics.counter('encodes_total')} | Çözme: {decodes} | Düzeltilen: {corrected} | "
+                f"Düzeltilemez: {uncorrectable} | Ort. çözme: {latency * 1e6:.1f} µs")
+        if text != self.telemetry_label.text():
+            self.telemetry_label.setText(text)
     
     def input_focus_in(self, event):
         """Giriş alanına odaklanınca"""
-        if self.data_input.text() == "8, 16 veya 32 bitlik veri giriniz!":
+        if self.data_input.text() == "8, 16, 32, 64... bitlik veri giriniz!":
             self.data_input.setText("")
         super(QLineEdit, self.data_input).focusInEvent(event)
     
     def input_focus_out(self, event):
         """Giriş alanından çıkınca"""
         if self.data_input.text().strip() == "":
-            self.data_input.setText("8, 16 veya 32 bitlik veri giriniz!")
+            self.data_input.setText("8, 16, 32, 64... bitlik veri giriniz!")
         super(QLineEdit, self.data_input).focusOutEvent(event)
     
     def validate_input(self, data):
         """Giriş verisi kontrolü"""
-        if data == "8, 16 veya 32 bitlik veri giriniz!":
+        if data == "8, 16, 32, 64... bitlik veri giriniz!":
             QMessageBox.warning(self, "Hatalı Girdi", "Veri girmediniz!")
             self.status_bar.showMessage("Hata: Veri girilmedi", 3000)
             return False
@@ -438,159 +795,23 @@ class HammingSimulator(QMainWindow):
             self.status_bar.showMessage("Hata: Geçersiz karakter", 3000)
             return False
         
-        if len(data) not in [8, 16, 32]:
-            QMessageBox.warning(self, "Hatalı Uzunluk", f"Lütfen 8, 16 veya 32 bitlik veri giriniz! (Mevcut: {len(data)} bit)")
+        if not 1 <= len(data) <= MAX_WIDTH:
+            QMessageBox.warning(self, "Hatalı Uzunluk", f"Lütfen 1-{MAX_WIDTH} bit arası veri giriniz! (Mevcut: {len(data)} bit)")
             self.status_bar.showMessage(f"Hata: Geçersiz uzunluk ({len(data)} bit)", 3000)
             return False
             
         self.status_bar.showMessage(f"Geçerli {len(data)} bitlik veri doğrulandı", 2000)
         return True
     
-    def calculate_hamming_code(self, data):
-        """Hamming SEC-DED kodu hesaplama"""
-        k = len(data)  # Veri uzunluğu
-        r = 0  # Parity bit sayısı
-        
-        # Gerekli parity bit sayısını bulma: 2^r >= k + r + 1
-        while (1 << r) < k + r + 1:
-            r += 1
-        
-        n = k + r  # Toplam bit sayısı (SEC-DED hariç)
-        code = [0] * n
-        
-        # Veri bitlerini yerleştirme (2'nin kuvveti olmayan pozisyonlara)
-        data_idx = 0
-        for i in range(1, n + 1):
-            if (i & (i - 1)) != 0:  # 2'nin kuvveti değilse
-                code[i - 1] = int(data[data_idx])
-                data_idx += 1
-        
-        # Parity bitlerini hesaplama
-        for i in range(r):
-            parity_pos = 1 << i  # 2^i
-            parity = 0
-            
-            for j in range(1, n + 1):
-                if (j & parity_pos) != 0 and j != parity_pos:
-                    parity ^= code[j - 1]
-            
-            code[parity_pos - 1] = parity
-        
-        # SEC-DED için genel parity biti ekleme
-        secded_code = code + [0]
-        overall_parity = 0
-        for bit in code:
-            overall_parity ^= bit
-        secded_code[-1] = overall_parity
-        
-        return secded_code
-    
-    def get_parity_positions(self, total_bits):
-        """Parity bit pozisyonlarını belirleme"""
-        parity_positions = set()
-        
-        # 2'nin kuvvetleri parity bitleri
-        i = 1
-        while i < total_bits:
-            parity_positions.add(i - 1)  # 0-indexed
-            i <<= 1
-        
-        # Son bit SEC-DED parity biti
-        parity_positions.add(total_bits - 1)
-        
-        return parity_positions
-    
-    def extract_data_from_code(self, code):
-        """Koddan orijinal veriyi çıkarma"""
-        data = ""
-        for i in range(1, len(code)):
-            if (i & (i - 1)) != 0 and i != len(code):  # Veri biti
-                data += str(code[i - 1])
-        return data
-    
     def update_bit_visualization(self, code):
         """Bit görselleştirmesini güncelleme"""
-        # Eski widget'ları temizle
-        for i in reversed(range(self.bits_layout.count())):
-            self.bits_layout.itemAt(i).widget().setParent(None)
-        
-        if code is None:
-            return
-        
-        parity_positions = self.get_parity_positions(len(code))
-        
-        for i, bit in enumerate(code):
-            # Bit container
-            bit_container = QWidget()
-            bit_layout = QVBoxLayout(bit_container)
-            bit_layout.setContentsMargins(2, 2, 2, 2)
-            bit_layout.setSpacing(2)
-            
-            # Bit değeri
-            bit_label = QLabel(str(bit))
-            bit_label.setAlignment(Qt.AlignCenter)
-            bit_label.setFont(QFont("Courier New", 16, QFont.Bold))
-            bit_label.setFixedSize(40, 40)
-            
-            # Renk belirleme
-            if i in self.error_positions:
-                if len(self.error_positions) == 1:
-                    bit_label.setStyleSheet("background-color: #e74c3c; color: white; border: 2px solid #c0392b; border-radius: 4px;")  # Kırmızı - tek hata
-                else:
-                    bit_label.setStyleSheet("background-color: #f39c12; color: white; border: 2px solid #e67e22; border-radius: 4px;")  # Sarı - çift hata
-            elif i in parity_positions:
-                if i == len(code) - 1:  # SEC-DED biti
-                    bit_label.setStyleSheet("background-color: #9b59b6; color: white; border: 2px solid #8e44ad; border-radius: 4px;")
-                else:  # Parity biti
-                    bit_label.setStyleSheet("background-color: #3498db; color: white; border: 2px solid #2980b9; border-radius: 4px;")
-            else:  # Veri biti
-                bit_label.setStyleSheet("background-color: #2ecc71; color: white; border: 2px solid #27ae60; border-radius: 4px;")
-            
-            # Tooltip
-            if i == len(code) - 1:
-                bit_label.setToolTip("SEC-DED Parity (overall parity biti)")
-            elif i in parity_positions:
-                bit_label.setToolTip("Parity biti")
-            else:
-                bit_label.setToolTip("Veri biti")
-            
-            # Pozisyon numarası
-            pos_label = QLabel(str(i + 1))
-            pos_label.setAlignment(Qt.AlignCenter)
-            pos_label.setFont(QFont("Arial", 10))
-            pos_label.setFixedHeight(20)
-            
-            bit_layout.addWidget(bit_label)
-            bit_layout.addWidget(pos_label)
-            
-            self.bits_layout.addWidget(bit_container)
-        
-        # Güncelleme
-        self.bits_widget.update()
+        codec = self.active_state.codec if self.active_state is not None else None
+        self.bit_strip.set_code(code, self.error_positions, codec)
     
-    def calculate_syndrome(self, code):
-        """Sendrom hesaplama"""
-        if not code or len(code) <= 1:
-            return 0
-        
-        n = len(code) - 1  # SEC-DED biti hariç
-        r = 0
-        while (1 << r) < n + 1:
-            r += 1
-        
-        syndrome = 0
-        for i in range(r):
-            parity_pos = 1 << i
-            parity = 0
-            
-            for j in range(1, n + 1):
-                if (j & parity_pos) != 0:
-                    parity ^= code[j - 1]
-            
-            if parity != 0:
-                syndrome += parity_pos
-        
-        return syndrome
+    def set_active_code(self, codec, word):
+        """Aktif kodu paketli kelimeden ayarlama (sendrom durumu ile birlikte)"""
+        self.active_state = CodeState(codec, word)
+        self.active_code = unpack(word, codec.length)
     
     def encode_data(self):
         """Veriyi kodlama"""
@@ -603,8 +824,9 @@ class HammingSimulator(QMainWindow):
             return
         
         try:
-            hamming_code = self.calculate_hamming_code(clean_data)
-            self.active_code = hamming_code[:]
+            codec = Codec(len(clean_data), self.family_combo.currentData())
+            self.set_active_code(codec, codec.encode_int(pack(clean_data)))
+            hamming_code = self.active_code
             self.error_positions.clear()
             
             # Error position spinner range ayarlama
@@ -614,10 +836,11 @@ class HammingSimulator(QMainWindow):
             self.update_bit_visualization(hamming_code)
             
             # Giriş alanını temizle
-            self.data_input.setText("8, 16 veya 32 bitlik veri giriniz!")
+            self.data_input.setText("8, 16, 32, 64... bitlik veri giriniz!")
             
             # Status mesajı
-            self.status_bar.showMessage(f"Kodlama başarılı! {len(clean_data)} bit veri → {len(hamming_code)} bit kod", 3000)
+            self.status_bar.showMessage(f"Kodlama başarılı! {len(clean_data)} bit veri → {len(hamming_code)} bit "
+                                        f"{self.family_combo.currentText()} kodu", 3000)
             
         except Exception as e:
             QMessageBox.critical(self, "Kodlama Hatası", f"Kodlama sırasında hata oluştu: {str(e)}")
@@ -634,12 +857,13 @@ class HammingSimulator(QMainWindow):
             QMessageBox.warning(self, "Uyarı", f"Pozisyon 1 ile {len(self.active_code)} arasında olmalı!")
             return
         
-        # Biti ters çevir
-        self.active_code[pos - 1] = 1 - self.active_code[pos - 1]
+        # Biti ters çevir: sendrom ve parity artımlı güncellenir
+        self.active_state.flip(pos)
+        self.active_code[pos - 1] ^= 1
         self.error_positions.add(pos - 1)
         
-        # Görselleştirmeyi güncelle
-        self.update_bit_visualization(self.active_code)
+        # Yalnızca değişen hücreyi yeniden boya
+        self.bit_strip.flip_bit(pos - 1)
         
         # Status güncelle
         self.status_bar.showMessage(f"Pozisyon {pos}'da hata eklendi", 2000)
@@ -650,43 +874,30 @@ class HammingSimulator(QMainWindow):
             QMessageBox.warning(self, "Uyarı", "Önce bir kod seçmelisiniz!")
             return
         
-        syndrome = self.calculate_syndrome(self.active_code)
-        
-        # Overall parity hesaplama
-        overall_parity = 0
-        for bit in self.active_code:
-            overall_parity ^= bit
+        # Sendrom hata eklenirken artımlı tutuldu; yeniden hesaplanmaz
+        result = self.active_state.correct()
         
         # Hata analizi
-        if syndrome == 0 and overall_parity == 0:
+        if result.status == CLEAN:
             # Hata yok
             self.error_positions.clear()
             QMessageBox.information(self, "Bilgi", "Kodda hata bulunamadı!")
             self.status_bar.showMessage("Hata bulunamadı", 2000)
             
-        elif syndrome == 0 and overall_parity == 1:
-            # SEC-DED biti hatası veya çift hata
-            QMessageBox.information(self, "Bilgi", "Sadece SEC-DED parity bitinde hata var veya çift hata (düzeltilemez)!")
-            self.status_bar.showMessage("SEC-DED hata veya çift hata", 3000)
+        elif result.status in (CORRECTED, SECDED_BIT):
+            # Tek bit hatası (SEC-DED biti dahil) - düzeltilebilir
+            self.active_code[result.position - 1] ^= 1
+            self.error_positions.clear()
+            
+            # Bellek güncellemesi
+            current_row = self.current_memory_row()
+            if current_row >= 0 and self.bank_accepts(self.active_state.codec):
+                self.memory_model.write(current_row, result.code)
+                self.update_memory_counts()
             
-        elif syndrome > 0 and overall_parity == 1:
-            # Tek bit hatası - düzeltilebilir
-            error_pos = syndrome - 1
-            if 0 <= error_pos < len(self.active_code):
-                self.active_code[error_pos] = 1 - self.active_code[error_pos]
-                self.error_positions.clear()
-                
-                # Bellek güncellemesi
-                current_row = self.memory_list.currentRow()
-                if current_row >= 0:
-                    data = self.extract_data_from_code(self.active_code)
-                    code_str = ''.join(map(str, self.active_code))
-                    new_text = f"Veri: {data} | Kod: {code_str}"
-                    self.memory_list.item(current_row).setText(new_text)
-                
-                QMessageBox.information(self, "Düzeltildi", 
-                                      f"Hatalı bit {syndrome}. pozisyonda bulundu, düzeltildi!")
-                self.status_bar.showMessage(f"Pozisyon {syndrome}'daki hata düzeltildi", 3000)
+            QMessageBox.information(self, "Düzeltildi", 
+                                  f"Hatalı bit {result.position}. pozisyonda bulundu, düzeltildi!")
+            self.status_bar.showMessage(f"Pozisyon {result.position}'daki hata düzeltildi", 3000)
             
         else:
             # Çift hata
@@ -702,60 +913,57 @@ class HammingSimulator(QMainWindow):
             QMessageBox.warning(self, "Uyarı", "Önce bir kod üretmelisiniz!")
             return
         
-        data = self.extract_data_from_code(self.active_code)
-        code_str = ''.join(map(str, self.active_code))
+        # Bellek tek bir kelime genişliğine ve kod ailesine sahiptir; boşken ilk kayda uyar
+        codec = self.active_state.codec
+        if self.memory_bank is None or (len(self.memory_bank) == 0 and not self.bank_accepts(codec)):
+            self.set_memory_bank(MemoryBank(codec.width, codec.family))
+        elif not self.bank_accepts(codec):
+            QMessageBox.warning(self, "Uyarı", f"Bellek {self.memory_bank.width} bitlik {self.memory_bank.family} "
+                                               "kodları için ayrılmış! Farklı kod kaydetmek için önce belleği boşaltın.")
+            return
         
-        display_text = f"Veri: {data} | Kod: {code_str}"
-        self.memory_list.addItem(display_text)
+        self.memory_model.append(self.active_state.word)
+        self.update_memory_counts()
         
         # Belleğe kaydettikten sonra çalışma alanını temizle
         self.active_code = None
+        self.active_state = None
         self.error_positions.clear()
         
         # Görselleştirmeyi temizle
-        for i in reversed(range(self.bits_layout.count())):
-            self.bits_layout.itemAt(i).widget().setParent(None)
+        self.bit_strip.set_code(None)
         
         # Input alanını temizle
-        self.data_input.setText("8, 16 veya 32 bitlik veri giriniz!")
+        self.data_input.setText("8, 16, 32, 64... bitlik veri giriniz!")
         
         self.status_bar.showMessage("Kod belleğe kaydedildi ve çalışma alanı temizlendi", 3000)
     
     def read_from_memory(self):
         """Bellekten okuma"""
-        current_row = self.memory_list.currentRow()
+        current_row = self.current_memory_row()
         if current_row < 0:
             QMessageBox.warning(self, "Uyarı", "Bellekten bir kod seçmelisiniz!")
             return
         
-        item_text = self.memory_list.item(current_row).text()
-        
-        # Kod kısmını çıkarma
         try:
-            parts = item_text.split("| Kod: ")
-            if len(parts) != 2:
-                QMessageBox.warning(self, "Hata", "Kod formatı bozuk!")
-                return
-            
-            code_str = parts[1].strip()
-            code = [int(c) for c in code_str]
+            word = self.memory_bank.read(current_row)
+            code = unpack(word, self.memory_bank.length)
             
             # Hata kontrolü
             self.error_positions.clear()
-            syndrome = self.calculate_syndrome(code)
-            overall_parity = sum(code) % 2
+            result = self.memory_bank.codec.decode_int(word)
             
-            if syndrome > 0 and overall_parity == 1:
-                # Tek hata
-                self.error_positions.add(syndrome - 1)
-            elif (syndrome > 0 and overall_parity == 0) or (syndrome == 0 and overall_parity == 1):
+            if result.status in (CORRECTED, SECDED_BIT):
+                # Tek hata (SEC-DED biti dahil)
+                self.error_positions.add(result.position - 1)
+            elif result.status == DOUBLE:
                 # Çift hata - tüm bitleri sarıya boyama
                 for i in range(len(code)):
                     self.error_positions.add(i)
                 QMessageBox.warning(self, "Çift Hata", 
                                   "Çift hata tespit edildi! Hatalı bitlerin yeri belirlenemedi. Kod düzeltilemez.")
             
-            self.active_code = code[:]
+            self.set_active_code(self.memory_bank.codec, word)
             self.error_position_spin.setRange(1, len(code))
             self.update_bit_visualization(code)
             self.status_bar.showMessage("Bellekten kod okundu", 2000)
@@ -764,32 +972,113 @@ class HammingSimulator(QMainWindow):
             QMessageBox.warning(self, "Hata", f"Kod okunamadı: {str(e)}")
             self.status_bar.showMessage("Kod okuma hatası", 3000)
     
+    def set_memory_bank(self, bank):
+        """Gösterilen bellek bankasını değiştirme (eski dosya bankası kapatılır)"""
+        self.stop_scrub()
+        old_bank = self.memory_bank
+        self.memory_bank = bank
+        self.memory_filter_combo.setCurrentIndex(0)  # Yeni bankada süzgeç kapalı başlar
+        self.memory_model.set_bank(bank)
+        if isinstance(old_bank, MappedBank) and old_bank is not bank:
+            old_bank.close()
+        self.update_memory_counts()
+        if self.scrub_btn.isChecked():
+            self.start_scrub()
+    
+    def filter_memory(self):
+        """Bellek listesini seçilen kayıt sınıfına göre süzme"""
+        kind = self.memory_filter_combo.currentData()
+        if kind is not None and self.memory_bank is not None and self.memory_bank.status_index(build=False) is None:
+            # Dizin ilk kez kuruluyor: banka bir kez baştan sona çözülür
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                self.memory_bank.status_index()
+            finally:
+                QApplication.restoreOverrideCursor()
+        self.memory_model.set_filter(kind)
+        self.update_memory_counts()
+    
+    def update_memory_counts(self):
+        """Kayıt sınıflarının sayılarını gösterme (dizin kurulmuşsa)"""
+        statuses = self.memory_bank.status_index(build=False) if self.memory_bank is not None else None
+        text = ""
+        if statuses is not None:
+            counts = statuses.counts()
+            text = (f"Temiz: {counts['clean']} | Düzeltilebilir: {counts['correctable']} | "
+                    f"Düzeltilemez: {counts['uncorrectable']}")
+        self.memory_counts_label.setText(text)
+    
+    def save_bank_file(self):
+        """Bellek bankasını dosyaya kaydetme; banka bu dosya üzerinden açık kalır"""
+        if self.memory_bank is None:
+            QMessageBox.warning(self, "Uyarı", "Kaydedilecek bellek yok!")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Belleği Kaydet", "", BANK_FILE_FILTER)
+        if not path:
+            return
+        try:
+            self.memory_bank.save(path)
+            if not (isinstance(self.memory_bank, MappedBank) and self.memory_bank.path == path):
+                self.set_memory_bank(MappedBank.open(path))
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Hata", f"Bellek kaydedilemedi: {e}")
+            return
+        self.status_bar.showMessage(f"Bellek {path} dosyasına kaydedildi; yeni kayıtlar dosyaya eklenecek", 3000)
+    
+    def open_bank_file(self):
+        """Banka dosyasını eşleyerek açma (kayıtlar gerektikçe okunur)"""
+        path, _ = QFileDialog.getOpenFileName(self, "Bellek Aç", "", BANK_FILE_FILTER)
+        if not path:
+            return
+        try:
+            bank = MappedBank.open(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Hata", f"Bellek dosyası açılamadı: {e}")
+            return
+        self.set_memory_bank(bank)
+        self.bit_strip.set_code(None)
+        self.active_code = None
+        self.active_state = None
+        self.error_positions.clear()
+        self.status_bar.showMessage(f"{path}: {len(bank)} kayıt, {bank.width} bit {bank.family}", 3000)
+    
+    def bank_accepts(self, codec):
+        """Kodun bellek bankasının genişliğine ve kod ailesine uyması"""
+        bank = self.memory_bank
+        return bank is not None and bank.length == codec.length and bank.family == codec.family
+    
+    def current_memory_row(self):
+        """Seçili satırın banka indeksi (seçim yoksa -1)"""
+        index = self.memory_list.currentIndex()
+        return self.memory_model.bank_index(index.row()) if index.isValid() else -1
+    
     def delete_from_memory(self):
         """Bellekten silme"""
-        current_row = self.memory_list.currentRow()
+        current_row = self.current_memory_row()
         if current_row < 0:
             QMessageBox.warning(self, "Uyarı", "Önce silmek istediğiniz kodu seçin!")
             return
         
-        self.memory_list.takeItem(current_row)
+        self.memory_model.delete(current_row)
+        self.update_memory_counts()
         
         # Görselleştirmeyi temizle
-        for i in reversed(range(self.bits_layout.count())):
-            self.bits_layout.itemAt(i).widget().setParent(None)
+        self.bit_strip.set_code(None)
         
         self.active_code = None
+        self.active_state = None
         self.error_positions.clear()
         self.status_bar.showMessage("Bellek kaydı silindi", 2000)
     
     def clear_all(self):
         """Tüm verileri temizle"""
         self.active_code = None
+        self.active_state = None
         self.error_positions.clear()
-        self.data_input.setText("8, 16 veya 32 bitlik veri giriniz!")
+        self.data_input.setText("8, 16, 32, 64... bitlik veri giriniz!")
         
         # Görselleştirmeyi temizle
-        for i in reversed(range(self.bits_layout.count())):
-            self.bits_layout.itemAt(i).widget().setParent(None)
+        self.bit_strip.set_code(None)
         
         self.status_bar.showMessage("Tüm veriler temizlendi", 2000)
     
@@ -824,6 +1113,64 @@ class HammingSimulator(QMainWindow):
         self.data_input.setFocus()
         self.status_bar.showMessage("Kod input alanına yapıştırıldı", 2000)
     
+    def toggle_scrub(self, checked):
+        """Arka plan taramasını başlatma/durdurma"""
+        self.scrub_btn.setText("Taramayı Durdur" if checked else "Taramayı Başlat")
+        if checked:
+            self.scrub_stats = {"corrected": 0, "flagged": 0}
+            self.start_scrub()
+        else:
+            self.stop_scrub()
+            self.scrub_label.setText("")
+    
+    def start_scrub(self):
+        """Bellek bankası için tarama iş parçacığını başlatma"""
+        if self.memory_bank is None:
+            self.scrub_label.setText("Tarama: bellek boş")
+            return
+        rate = self.scrub_rate_spin.value() or None
+        self.scrub_thread = ScrubThread(self.memory_bank, rate=rate, parent=self)
+        self.scrub_thread.progress.connect(self.scrub_progress)
+        self.scrub_thread.corrected.connect(self.scrub_corrected)
+        self.scrub_thread.flagged.connect(self.scrub_flagged)
+        self.scrub_thread.start(QThread.LowPriority)
+    
+    def stop_scrub(self):
+        """Tarama iş parçacığını durdurma"""
+        if self.scrub_thread is not None:
+            self.scrub_thread.stop()
+            self.scrub_thread = None
+    
+    def restart_scrub(self):
+        """Banka veya hız değişince taramayı yeni ayarlarla yeniden başlatma"""
+        if self.scrub_btn.isChecked():
+            self.stop_scrub()
+            self.start_scrub()
+    
+    def scrub_progress(self, done, total, passes):
+        stats = self.scrub_stats
+        self.scrub_label.setText(f"Tarama: {done}/{total} ({passes}. geçiş) | "
+                                 f"Düzeltilen: {stats['corrected']} | Düzeltilemez: {stats['flagged']}")
+    
+    def scrub_corrected(self, rows):
+        self.scrub_stats["corrected"] += len(rows)
+        self.memory_model.refresh_rows(rows)
+        self.update_memory_counts()
+    
+    def scrub_flagged(self, rows):
+        # Sinyal kuyrukta beklerken kayıtlar değişmiş olabilir; sayı dizinden okunur
+        statuses = self.memory_bank.status_index(build=False)
+        if statuses is not None:
+            self.scrub_stats["flagged"] = statuses.count(ENTRY_UNCORRECTABLE)
+        self.memory_model.refresh_rows(rows)
+        self.update_memory_counts()
+    
+    def closeEvent(self, event):
+        self.stop_scrub()
+        if isinstance(self.memory_bank, MappedBank):
+            self.memory_bank.close()
+        super().closeEvent(event)
+    
     def refresh_visualization(self):
         """Görselleştirmeyi yenile"""
         if self.active_code is not None:
@@ -834,6 +1181,8 @@ class HammingSimulator(QMainWindow):
 
 def main():
     """Ana fonksiyon"""
+    # Arayüz işlemleri insan hızında olduğundan telemetri her zaman toplanır
+    telemetry.enable()
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     
@@ -845,6 +1194,13 @@ def main():
     window = HammingSimulator()
     window.show()
     
+    if "--measure-startup" in sys.argv:
+        # İlk çizim bitene kadar geçen süreyi ölçüp bütçeyle karşılaştırma
+        app.processEvents()
+        elapsed = (time.perf_counter() - STARTED) * 1000
+        print(f"Başlangıç süresi: {elapsed:.1f} ms (bütçe: {STARTUP_BUDGET_MS} ms)")
+        sys.exit(0 if elapsed <= STARTUP_BUDGET_MS else 1)
+    
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
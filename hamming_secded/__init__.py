@@ -0,0 +1,14 @@
+"""Hamming SEC-DED kodlama kütüphanesi (PyQt5 gerektirmez)"""
+from .codec import (
+    CLEAN, CORRECTED, SECDED_BIT, DOUBLE, STATUS_NAMES, MAX_WIDTH,
+    HAMMING, HSIAO, FAMILIES,
+    Codec, CodecTables, CodeState, DecodeResult, HsiaoTables, clean_bits, get_tables, pack,
+    parity_bit_count, unpack,
+)
+
+__all__ = [
+    "CLEAN", "CORRECTED", "SECDED_BIT", "DOUBLE", "STATUS_NAMES", "MAX_WIDTH",
+    "HAMMING", "HSIAO", "FAMILIES",
+    "Codec", "CodecTables", "CodeState", "DecodeResult", "HsiaoTables", "clean_bits", "get_tables", "pack",
+    "parity_bit_count", "unpack",
+]
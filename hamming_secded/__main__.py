@@ -0,0 +1,6 @@
+"""python -m hamming_secded"""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,783 @@
+"""Paketli kod kelimelerini tutan kompakt bellek bankası
+
+Banka dosyası biçimi: sabit ``BANK_HEADER`` başlığı (sihirli değer, sürüm,
+kod ailesi, genişlik, kayıt sayısı) ve ardından art arda big-endian kod
+kelimeleri. Dosya ``MappedBank`` ile ``mmap`` üzerinden açılır; kayıtlar
+ancak dokunuldukça diske/bellekten okunur. ``SharedBank`` aynı yerleşimi
+süreçler arası paylaşılan bellekte tutar. ``InterleavedBank`` kayıtları
+serpiştirilmiş çerçevelerde tutarak komşu hücre patlamalarını düzeltir.
+
+``status_index`` kayıt başına temiz/düzeltilebilir/düzeltilemez sınıfını ve
+sendrom dağılımını tutan ``StatusIndex``'i döndürür; dizin bir kez
+kurulduktan sonra bankayı değiştiren her işlemde artımlı güncellenir.
+"""
+import mmap
+import os
+import struct
+import threading
+import time
+
+from . import telemetry
+from .codec import Codec, CLEAN, CORRECTED, SECDED_BIT, HAMMING, FAMILIES
+from .interleave import cell as interleave_cell, check_depth, deinterleave_bytes, frame_size, interleave, \
+    interleave_bytes
+
+MAX_BATCH_LENGTH = 64  # Toplu (NumPy) taramanın desteklediği en uzun kod
+
+BANK_MAGIC = b"HSBK"
+BANK_VERSION = 1
+BANK_HEADER = struct.Struct(">4sBBHQ")  # sihirli değer, sürüm, kod ailesi, genişlik, kayıt sayısı
+BANK_COUNT = struct.Struct(">Q")  # Başlıktaki kayıt sayısı alanı
+COUNT_OFFSET = BANK_HEADER.size - BANK_COUNT.size
+MIN_CAPACITY = 1024  # Dosya büyütülürken ayrılan en az kayıt
+SHARD_RECORDS = 4096  # Paylaşılan bankada bir kilidin koruduğu ardışık kayıt sayısı
+DEFAULT_SHARDS = 64  # Paylaşılan bankadaki kilit sayısı (parçalar kilitlere döngüsel dağılır)
+INDEX_CHUNK = 1 << 14  # Durum dizini kurulurken bir kilit alımında çözülen kayıt
+
+# Durum dizinindeki kayıt sınıfları (SECDED_BIT, tarama eşlik bitini yeniden yazdığı için düzeltilebilir sayılır)
+ENTRY_CLEAN, ENTRY_CORRECTABLE, ENTRY_UNCORRECTABLE = 0, 1, 2
+ENTRY_NAMES = ("clean", "correctable", "uncorrectable")
+
+
+def entry_kind(status):
+    """Kod çözme durumundan kayıt sınıfı"""
+    if status == CLEAN:
+        return ENTRY_CLEAN
+    return ENTRY_CORRECTABLE if status in (CORRECTED, SECDED_BIT) else ENTRY_UNCORRECTABLE
+
+
+class StatusIndex:
+    """Kayıt başına sınıf dizisi ve temiz olmayan kayıtların sendrom dağılımı
+
+    ``kinds`` kayıt başına bir byte tutar (O(1) sorgu). Temiz olmayan
+    kayıtlar ayrıca sınıf ve sendrom kümelerinde durur; bu yüzden
+    listeleme, süzme ve sayma banka boyuyla değil sonuç sayısıyla
+    orantılıdır. Silmede kümelerdeki indeksler kaydırılır.
+
+    Dizin kurulurken yalnızca kayıtların bir öneğini kapsar (``complete``
+    False); önekteki değişiklikler izlenir, kalanlar kuruldukça okunur.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.complete = False
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.kinds = bytearray()
+            self.members = {ENTRY_CORRECTABLE: set(), ENTRY_UNCORRECTABLE: set()}
+            self.syndromes = {}  # temiz olmayan kayıt -> sendrom
+            self.by_syndrome = {}  # sendrom -> kayıt kümesi
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def _remove(self, index):
+        kind = self.kinds[index]
+        if kind != ENTRY_CLEAN:
+            self.members[kind].discard(index)
+            syndrome = self.syndromes.pop(index)
+            group = self.by_syndrome[syndrome]
+            group.discard(index)
+            if not group:
+                del self.by_syndrome[syndrome]
+
+    def set(self, index, kind, syndrome=0):
+        """Kaydın sınıfını güncelleme (``index == len(self)`` ise sona ekleme)"""
+        with self.lock:
+            if index == len(self.kinds):
+                self.kinds.append(ENTRY_CLEAN)
+            self._remove(index)
+            self.kinds[index] = kind
+            if kind != ENTRY_CLEAN:
+                self.members[kind].add(index)
+                self.syndromes[index] = syndrome
+                self.by_syndrome.setdefault(syndrome, set()).add(index)
+
+    def delete(self, index):
+        """Kaydı çıkarma; sonraki indeksler bir azalır"""
+        with self.lock:
+            self._remove(index)
+            del self.kinds[index]
+            self.members = {kind: {i - (i > index) for i in group} for kind, group in self.members.items()}
+            self.syndromes = {i - (i > index): syndrome for i, syndrome in self.syndromes.items()}
+            self.by_syndrome = {syndrome: {i - (i > index) for i in group}
+                                for syndrome, group in self.by_syndrome.items()}
+
+    def kind(self, index):
+        """Kaydın sınıfı (``ENTRY_*``)"""
+        return self.kinds[index]
+
+    def syndrome(self, index):
+        """Kaydın sendromu (temiz kayıtlarda 0)"""
+        return self.syndromes.get(index, 0)
+
+    def find(self, kind=None, syndrome=None):
+        """Temiz olmayan kayıtların sıralı indeksleri (sınıfa ve/veya sendroma göre süzülmüş)"""
+        with self.lock:
+            if syndrome is not None:
+                found = set(self.by_syndrome.get(syndrome, ()))
+                if kind is not None:
+                    found &= self.members.get(kind, set())
+            elif kind is not None:
+                found = set(self.members.get(kind, ()))
+            else:
+                found = set(self.syndromes)
+        return sorted(found)
+
+    def count(self, kind):
+        with self.lock:
+            if kind == ENTRY_CLEAN:
+                return len(self.kinds) - len(self.syndromes)
+            return len(self.members[kind])
+
+    def counts(self):
+        """Sınıf adı -> kayıt sayısı"""
+        return {name: self.count(kind) for kind, name in enumerate(ENTRY_NAMES)}
+
+    def histogram(self):
+        """Sendrom -> temiz olmayan kayıt sayısı"""
+        with self.lock:
+            return {syndrome: len(group) for syndrome, group in sorted(self.by_syndrome.items())}
+
+
+class MemoryBank:
+    """Sabit genişlikte SEC-DED kod kelimelerini yoğun olarak tutan bellek
+
+    Her kayıt ``record_size`` byte'lık big-endian bir kod kelimesidir
+    (``Codec.encode_int`` yerleşimi); kayıtlar tek bir ``bytearray`` içinde
+    art arda durur. Okuma, yazma ve bit çevirme O(1)'dir; silme sonraki
+    kayıtları tek bir bellek kaydırmasıyla öne çeker.
+
+    Değiştiren işlemler ``lock`` altında çalışır; böylece arka plan
+    taraması (``scrub``) arayüzün ekleme/silme işlemleriyle yarışmaz.
+    """
+
+    def __init__(self, width, family=HAMMING):
+        self.codec = Codec(width, family)
+        self.family = self.codec.family
+        self.width = self.codec.width
+        self.length = self.codec.length
+        self.record_size = (self.length + 7) // 8
+        self.data = bytearray()
+        self.lock = threading.RLock()
+        self.statuses = None  # StatusIndex; ilk ``status_index`` çağrısında kurulur
+
+    def __len__(self):
+        return len(self.data) // self.record_size
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.read(i)
+
+    def _index(self, index):
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f"Bellek indeksi {index} geçersiz ({count} kayıt)")
+        return index
+
+    def _offset(self, index):
+        return self._index(index) * self.record_size
+
+    def _records(self, start, stop):
+        """``start:stop`` kayıtlarının art arda big-endian byte'ları"""
+        return bytes(self.data[start * self.record_size:stop * self.record_size])
+
+    def _check_word(self, word):
+        if word >> self.length:
+            raise ValueError(f"Kod {self.length} bitten uzun")
+
+    def record_lock(self, index):
+        """``index`` kaydını koruyan kilit (tek süreçli bankada ``lock``)"""
+        return self.lock
+
+    def read(self, index):
+        """Paketli kod kelimesini okuma"""
+        with self.record_lock(index):
+            offset = self._offset(index)
+            return int.from_bytes(self.data[offset:offset + self.record_size], "big")
+
+    def write(self, index, word):
+        """Paketli kod kelimesini yazma"""
+        self._check_word(word)
+        with self.record_lock(index):
+            offset = self._offset(index)
+            self.data[offset:offset + self.record_size] = word.to_bytes(self.record_size, "big")
+            self._track(offset // self.record_size, word)
+
+    def append(self, word):
+        """Kod kelimesini sona ekleme; kaydın indeksini döndürür"""
+        self._check_word(word)
+        with self.lock:
+            self.data += word.to_bytes(self.record_size, "big")
+            self._track(len(self) - 1, word)
+            return len(self) - 1
+
+    def store(self, value):
+        """Paketli veriyi kodlayıp sona ekleme"""
+        return self.append(self.codec.encode_int(value))
+
+    def flip(self, index, position):
+        """Kaydın ``position``. bitini (1-indexed) ters çevirme"""
+        if not 1 <= position <= self.length:
+            raise ValueError(f"Pozisyon 1 ile {self.length} arasında olmalı!")
+        bit = self.length - position
+        with self.record_lock(index):
+            offset = self._offset(index) + self.record_size - 1 - bit // 8
+            self.data[offset] ^= 1 << (bit % 8)
+            self._track(offset // self.record_size)
+
+    def cell(self, index, position):
+        """Kaydın ``position``. bitinin fiziksel hücre numarası (hücreler kayıt sırasıyla dizilir)"""
+        return self._index(index) * self.length + position - 1
+
+    def cell_record(self, cell):
+        """Fiziksel hücre -> (kayıt indeksi, pozisyon)"""
+        index, offset = divmod(cell, self.length)
+        return index, offset + 1
+
+    def cell_count(self):
+        """Fiziksel hücre sayısı (dolgu hücreleri dahil)"""
+        return len(self) * self.length
+
+    def flip_burst(self, index, position, length):
+        """Kaydın ``position``. bitinden başlayan ``length`` komşu hücreyi çevirme
+
+        Etkilenen kayıt indekslerini döndürür; banka sonunu aşan hücreler ve
+        kayda ait olmayan dolgu hücreleri atlanır.
+        """
+        if not 1 <= position <= self.length or length < 1:
+            raise ValueError(f"Pozisyon 1 ile {self.length} arasında, uzunluk pozitif olmalı!")
+        touched = set()
+        with self.lock:
+            first = self.cell(index, position)
+            for cell in range(first, min(first + length, self.cell_count())):
+                record, bit = self.cell_record(cell)
+                if record >= len(self):
+                    continue  # Son çerçevenin boş yuvası
+                self.flip(record, bit)
+                touched.add(record)
+        return sorted(touched)
+
+    def delete(self, index):
+        """Kaydı silme"""
+        with self.lock:
+            offset = self._offset(index)
+            del self.data[offset:offset + self.record_size]
+            self._track_delete(offset // self.record_size)
+
+    def clear(self):
+        """Tüm kayıtları silme"""
+        with self.lock:
+            self.data = bytearray()
+            self._track_clear()
+
+    def save(self, path):
+        """Bankayı dosyaya yazma (``MappedBank.open`` ile açılabilir)"""
+        with self.lock, open(path, "wb") as f:
+            count = len(self)
+            f.write(bank_header(self.codec, count))
+            f.write(self.data[:count * self.record_size])
+
+    def _classify(self, word):
+        """Kelimenin (kayıt sınıfı, sendrom) çifti (telemetriye sayılmaz)"""
+        codec = self.codec
+        syndrome = codec.syndrome_int(word)
+        status = codec.classify(syndrome, word.bit_count() & 1 if codec.secded_bit else 0)
+        return entry_kind(status), syndrome
+
+    def _track(self, index, word=None):
+        """Durum dizini varsa kaydın sınıfını güncelleme (kilit altında çağrılır)
+
+        Kurulmakta olan dizinin öneğinden sonraki kayıtlar atlanır; onlar
+        kurulum sırasında okunur.
+        """
+        statuses = self.statuses
+        if statuses is not None and index <= len(statuses):
+            statuses.set(index, *self._classify(self.read(index) if word is None else word))
+
+    def _track_delete(self, index):
+        statuses = self.statuses
+        if statuses is not None and index < len(statuses):
+            statuses.delete(index)
+
+    def _track_clear(self):
+        if self.statuses is not None:
+            self.statuses.clear()
+
+    def status_index(self, build=True):
+        """Kayıt durum dizini (``StatusIndex``)
+
+        İlk çağrıda banka bir kez baştan sona çözülür (``INDEX_CHUNK``
+        kayıtlık parçalar halinde, kilit parçalar arasında bırakılır); sonra
+        dizin her yazma, ekleme, bit çevirme, silme ve taramada artımlı
+        güncellenir. ``build`` False ise dizin tamamlanmamışsa None döner.
+        """
+        statuses = self.statuses
+        if statuses is not None and statuses.complete:
+            return statuses
+        if not build:
+            return None
+        with self.lock:
+            if self.statuses is None:
+                self.statuses = StatusIndex()
+            statuses = self.statuses
+        while not statuses.complete:
+            with self.lock:
+                start, count = len(statuses), len(self)
+                if start >= count:
+                    statuses.complete = True
+                    break
+                raw = self._records(start, min(start + INDEX_CHUNK, count))
+                kinds = [entry_kind(status) for status in self._decode_records(raw)[0]]
+                statuses.kinds += bytes(len(kinds))
+                for i, kind in enumerate(kinds):
+                    if kind != ENTRY_CLEAN:
+                        word = int.from_bytes(raw[i * self.record_size:(i + 1) * self.record_size], "big")
+                        statuses.set(start + i, *self._classify(word))
+        return statuses
+
+    def decode(self, index):
+        """Kaydı çözme (bellekteki kayıt değiştirilmez)"""
+        return self.codec.decode_int(self.read(index))
+
+    def correct(self, index):
+        """Kaydı çözme ve tek bit hatasını (SEC-DED biti dahil) yerinde düzeltme"""
+        with self.record_lock(index):
+            result = self.decode(index)
+            if result.status == CORRECTED or result.status == SECDED_BIT:
+                self.write(index, result.code)
+        return result
+
+    def scrub(self, start=0, stop=None):
+        """``start:stop`` kayıtlarını tarama ve tek bit hatalarını yerinde düzeltme
+
+        Yalnızca genel eşlik biti bozuk kayıtlarda (``SECDED_BIT``) eşlik
+        biti yeniden yazılır. (düzeltilen indeksler, düzeltilemeyen
+        indeksler) döndürür. Kod 64 bite sığıyorsa ve NumPy varsa aralık tek
+        bir ``decode_batch`` çağrısıyla çözülür.
+        """
+        began = time.perf_counter() if telemetry.enabled else None
+        with self.record_lock(start):
+            count = len(self)
+            stop = count if stop is None else min(stop, count)
+            if start >= stop:
+                return [], []
+            raw = self._records(start, stop)
+            decoded = self._decode_records(raw)
+
+            # Dizinde temiz olmayan ama şimdi temiz çözülen kayıtlar (ör. başka yoldan onarılmış)
+            previous = self.statuses.kinds[start:stop] if self.statuses is not None else b""
+            if previous.count(ENTRY_CLEAN) != len(previous):
+                for i, kind in enumerate(previous):
+                    if kind != ENTRY_CLEAN and decoded[0][i] == CLEAN:
+                        self.statuses.set(start + i, ENTRY_CLEAN)
+
+            corrected, uncorrectable = [], []
+            for i, (status, code) in enumerate(zip(*decoded)):
+                if status == CORRECTED or status == SECDED_BIT:
+                    corrected.append(start + i)
+                    self.write(start + i, int(code))
+                elif status != CLEAN:
+                    uncorrectable.append(start + i)
+                    self._track(start + i)
+        if began is not None:
+            telemetry.METRICS.observe("scrub", time.perf_counter() - began)
+        return corrected, uncorrectable
+
+    def _decode_records(self, raw):
+        """Art arda kayıtları çözme: (durumlar, düzeltilmiş kodlar)"""
+        decoded = self._scrub_batch(raw)
+        if decoded is None:
+            results = [self.codec.decode_int(int.from_bytes(raw[i:i + self.record_size], "big"))
+                       for i in range(0, len(raw), self.record_size)]
+            decoded = [r.status for r in results], [r.code for r in results]
+        return decoded
+
+    def _scrub_batch(self, raw):
+        """Toplu kod çözme ile (durumlar, kodlar) (NumPy yoksa veya kod uzunsa None)"""
+        if self.length > MAX_BATCH_LENGTH:
+            return None
+        try:
+            import numpy as np
+            from .batch import rows_to_words
+        except ImportError:
+            return None
+        rows = np.frombuffer(raw, dtype=np.uint8).reshape(-1, self.record_size)
+        result = self.codec.decode_batch(rows_to_words(rows))
+        return result.status.tolist(), result.code.tolist()
+
+
+class InterleavedBank(MemoryBank):
+    """Kayıtları ``depth`` kelimelik serpiştirilmiş çerçevelerde tutan bellek bankası
+
+    ``data`` art arda çerçevelerdir (``interleave`` yerleşimi); bir kaydın
+    bitleri çerçevede ``depth`` hücre arayla durur, bu yüzden en fazla
+    ``depth`` hücrelik bir patlama (``flip_burst``) her kayıtta tek bit
+    hatası olur ve tarama ile düzeltilir. Okuma ve yazma tek çerçeveyi,
+    tarama ve silme bütün aralığı tek seferde serpiştirir. ``save``
+    kayıtları serpiştirmeden yazar; dosya ``MappedBank`` ile açılabilir.
+    """
+
+    def __init__(self, width, family=HAMMING, depth=8):
+        super().__init__(width, family)
+        check_depth(depth)
+        self.depth = depth
+        self.frame_size = frame_size(self.length, depth)
+        self.pad = self.frame_size * 8 - self.length * depth  # Çerçeve sonundaki dolgu bitleri
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _frame_bits(self, index):
+        """Kaydın çerçevesinin byte ofseti ve çerçeve bitleri ("0"/"1" dizisi)"""
+        frame, slot = divmod(self._index(index), self.depth)
+        offset = frame * self.frame_size
+        bits = int.from_bytes(self.data[offset:offset + self.frame_size], "big") >> self.pad
+        return offset, slot, format(bits, f"0{self.length * self.depth}b")
+
+    def _records(self, start, stop):
+        first = start // self.depth
+        last = -(-stop // self.depth)
+        raw = deinterleave_bytes(self.data[first * self.frame_size:last * self.frame_size], self.length, self.depth)
+        skip = first * self.depth
+        return raw[(start - skip) * self.record_size:(stop - skip) * self.record_size]
+
+    def read(self, index):
+        with self.lock:
+            _, slot, bits = self._frame_bits(index)
+            return int(bits[slot::self.depth], 2)
+
+    def write(self, index, word):
+        self._check_word(word)
+        with self.lock:
+            offset, slot, bits = self._frame_bits(index)
+            words = [int(bits[i::self.depth], 2) for i in range(self.depth)]
+            words[slot] = word
+            frame = interleave(words, self.length) << self.pad
+            self.data[offset:offset + self.frame_size] = frame.to_bytes(self.frame_size, "big")
+            self._track(self._index(index), word)
+
+    def append(self, word):
+        self._check_word(word)
+        with self.lock:
+            if self.count % self.depth == 0:
+                self.data += bytes(self.frame_size)
+            self.count += 1
+            self.write(self.count - 1, word)
+            return self.count - 1
+
+    def cell(self, index, position):
+        frame, slot = divmod(self._index(index), self.depth)
+        return frame * self.length * self.depth + (position - 1) * self.depth + slot
+
+    def cell_record(self, cell):
+        frame, offset = divmod(cell, self.length * self.depth)
+        slot, position = interleave_cell(offset, self.depth)
+        return frame * self.depth + slot, position
+
+    def cell_count(self):
+        return -(-self.count // self.depth) * self.depth * self.length
+
+    def flip(self, index, position):
+        if not 1 <= position <= self.length:
+            raise ValueError(f"Pozisyon 1 ile {self.length} arasında olmalı!")
+        with self.lock:
+            frame, offset = divmod(self.cell(index, position), self.length * self.depth)
+            self.data[frame * self.frame_size + offset // 8] ^= 0x80 >> (offset % 8)
+            self._track(self._index(index))
+
+    def delete(self, index):
+        with self.lock:
+            index = self._index(index)
+            first = index // self.depth * self.depth
+            raw = self._records(first, self.count)
+            raw = raw[:(index - first) * self.record_size] + raw[(index - first + 1) * self.record_size:]
+            self.count -= 1
+            self.data[first // self.depth * self.frame_size:] = interleave_bytes(raw, self.length, self.depth)
+            self._track_delete(index)
+
+    def clear(self):
+        with self.lock:
+            self.data = bytearray()
+            self.count = 0
+            self._track_clear()
+
+    def save(self, path):
+        with self.lock, open(path, "wb") as f:
+            f.write(bank_header(self.codec, self.count))
+            f.write(self._records(0, self.count))
+
+
+def bank_header(codec, count):
+    return BANK_HEADER.pack(BANK_MAGIC, BANK_VERSION, FAMILIES.index(codec.family), codec.width, count)
+
+
+class MappedBank(MemoryBank):
+    """Banka dosyası üzerinde ``mmap`` ile çalışan bellek bankası
+
+    Okuma, yazma, bit çevirme ve tarama doğrudan eşlenmiş sayfalarda
+    yapılır; açılış süresi dosya boyutundan bağımsızdır. Ekleme dosyanın
+    sonuna yazar ve başlıktaki kayıt sayısını günceller (dosya gerektikçe
+    geometrik olarak büyütülür, sayıdan sonraki alan kullanılmaz). Salt
+    okunur açılan bankada değiştiren işlemler ``TypeError`` verir.
+    """
+
+    def __init__(self, path, writable=True):
+        self.path = path
+        self.writable = writable
+        self.file = open(path, "r+b" if writable else "rb")
+        try:
+            header = self.file.read(BANK_HEADER.size)
+            if len(header) != BANK_HEADER.size:
+                raise ValueError(f"{path}: banka başlığı eksik")
+            magic, version, family, width, count = BANK_HEADER.unpack(header)
+            if magic != BANK_MAGIC or version != BANK_VERSION or family >= len(FAMILIES):
+                raise ValueError(f"{path}: desteklenmeyen banka dosyası")
+            super().__init__(width, FAMILIES[family])
+            size = os.fstat(self.file.fileno()).st_size
+            if size < BANK_HEADER.size + count * self.record_size:
+                raise ValueError(f"{path}: dosya {count} kayıt için kısa")
+            self.count = count
+            self._map(size)
+        except BaseException:
+            self.file.close()
+            raise
+
+    @classmethod
+    def create(cls, path, width, family=HAMMING):
+        """Boş banka dosyası oluşturup açma"""
+        with open(path, "wb") as f:
+            f.write(bank_header(Codec(width, family), 0))
+        return cls(path)
+
+    @classmethod
+    def open(cls, path, writable=True):
+        return cls(path, writable)
+
+    def _map(self, size):
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self.mm = mmap.mmap(self.file.fileno(), size, access=access)
+        self.view = memoryview(self.mm)
+        self._set_count(self.count)
+
+    def _unmap(self):
+        self.data.release()
+        self.view.release()
+        self.mm.close()
+
+    def _set_count(self, count):
+        self.count = count
+        self.data = self.view[BANK_HEADER.size:BANK_HEADER.size + count * self.record_size]
+        if self.writable:
+            self.view[:BANK_HEADER.size] = bank_header(self.codec, count)
+
+    def _check_writable(self):
+        if not self.writable:
+            raise TypeError(f"{self.path}: banka salt okunur açıldı")
+
+    def _reserve(self, count):
+        """Dosyayı en az ``count`` kayıt alacak şekilde büyütme"""
+        needed = BANK_HEADER.size + count * self.record_size
+        if needed <= len(self.mm):
+            return
+        capacity = max(count, 2 * (len(self.mm) - BANK_HEADER.size) // self.record_size, MIN_CAPACITY)
+        self._unmap()
+        self.file.truncate(BANK_HEADER.size + capacity * self.record_size)
+        self._map(BANK_HEADER.size + capacity * self.record_size)
+
+    def append(self, word):
+        """Kod kelimesini dosyanın sonuna ekleme; kaydın indeksini döndürür"""
+        self._check_word(word)
+        self._check_writable()
+        with self.lock:
+            self._reserve(self.count + 1)
+            offset = BANK_HEADER.size + self.count * self.record_size
+            self.view[offset:offset + self.record_size] = word.to_bytes(self.record_size, "big")
+            self._set_count(self.count + 1)
+            self._track(self.count - 1, word)
+            return self.count - 1
+
+    def delete(self, index):
+        """Kaydı silme (sonraki kayıtlar yerinde öne kaydırılır)"""
+        with self.lock:
+            offset = self._offset(index)
+            end = len(self.data)
+            self.data[offset:end - self.record_size] = self.data[offset + self.record_size:end]
+            self._set_count(self.count - 1)
+            self._track_delete(offset // self.record_size)
+
+    def clear(self):
+        """Tüm kayıtları silme"""
+        self._check_writable()
+        with self.lock:
+            self._set_count(0)
+            self._track_clear()
+
+    def save(self, path):
+        """Bankayı dosyaya kopyalama (kendi dosyasına kaydetmek yalnızca ``flush`` yapar)"""
+        if os.path.exists(path) and os.path.samefile(path, self.path):
+            self.flush()
+        else:
+            super().save(path)
+
+    def flush(self):
+        """Değişiklikleri diske yazma"""
+        if self.writable:
+            self.mm.flush()
+
+    def close(self):
+        """Dosyayı kapatma; fazla kapasite kesilir"""
+        with self.lock:
+            if self.file.closed:
+                return
+            self.flush()
+            self._unmap()
+            if self.writable:
+                self.file.truncate(BANK_HEADER.size + self.count * self.record_size)
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedBank(MemoryBank):
+    """``multiprocessing.shared_memory`` üzerinde sabit kapasiteli bellek bankası
+
+    Kayıtlar banka dosyasıyla aynı yerleşimde (başlık + paketli kod
+    kelimeleri) paylaşılan bellekte durur; süreçler okuma, yazma, bit
+    çevirme ve taramayı kopyasız yapar. Her ``SHARD_RECORDS`` kayıtlık parça
+    ``shard_locks`` kilitlerinden birine bağlıdır: yazıcılar yalnızca
+    dokundukları parçayı kilitler, tarama parça parça ilerler. Ekleme ve
+    silme ayrıca ``lock`` başlık kilidini alır; kilitler her zaman önce
+    başlık, sonra artan parça sırasıyla alınır.
+
+    Banka ``multiprocessing.Process`` argümanı veya havuz ``initializer``
+    argümanı olarak çocuk süreçlere aktarılır (kilitler yalnızca süreç
+    oluşturulurken devredilebilir). Paylaşılan belleği oluşturan süreç
+    işi bitince ``unlink`` çağırmalıdır.
+    """
+
+    def __init__(self, width, family=HAMMING, capacity=1 << 20, shards=DEFAULT_SHARDS, context=None):
+        super().__init__(width, family)
+        if capacity < 1 or shards < 1:
+            raise ValueError(f"Kapasite ve kilit sayısı pozitif olmalı (Mevcut: {capacity}, {shards})")
+        import multiprocessing  # Yalnızca paylaşılan bankada yüklenir (başlangıç süresi)
+        from multiprocessing import shared_memory
+        context = context or multiprocessing.get_context()
+        self.capacity = capacity
+        self.lock = context.RLock()
+        self.shard_locks = [context.RLock() for _ in range(shards)]
+        self.shm = shared_memory.SharedMemory(create=True, size=BANK_HEADER.size + capacity * self.record_size)
+        self.owner = True
+        self._attach()
+        self._set_count(0)
+
+    def __getstate__(self):
+        return self.shm.name, self.width, self.family, self.capacity, self.lock, self.shard_locks
+
+    def __setstate__(self, state):
+        name, width, family, self.capacity, lock, self.shard_locks = state
+        MemoryBank.__init__(self, width, family)
+        self.lock = lock
+        from multiprocessing import shared_memory
+        self.shm = shared_memory.SharedMemory(name)
+        self.owner = False
+        self._attach()
+
+    def _attach(self):
+        self.data = self.shm.buf[BANK_HEADER.size:BANK_HEADER.size + self.capacity * self.record_size]
+
+    def _set_count(self, count):
+        self.shm.buf[:BANK_HEADER.size] = bank_header(self.codec, count)
+
+    def __len__(self):
+        return BANK_COUNT.unpack_from(self.shm.buf, COUNT_OFFSET)[0]
+
+    @property
+    def name(self):
+        """Paylaşılan bellek bloğunun adı"""
+        return self.shm.name
+
+    def record_lock(self, index):
+        if index < 0:
+            index += len(self)
+        return self.shard_locks[index // SHARD_RECORDS % len(self.shard_locks)]
+
+    def status_index(self, build=True):
+        """Desteklenmez: diğer süreçlerin yazdıkları bu süreçteki dizine yansımaz"""
+        if build:
+            raise TypeError("Paylaşılan bankada durum dizini tutulmaz")
+        return None
+
+    def append(self, word):
+        """Kod kelimesini sona ekleme; kaydın indeksini döndürür"""
+        self._check_word(word)
+        with self.lock:
+            count = len(self)
+            if count == self.capacity:
+                raise IndexError(f"Paylaşılan banka dolu ({self.capacity} kayıt)")
+            offset = count * self.record_size
+            self.data[offset:offset + self.record_size] = word.to_bytes(self.record_size, "big")
+            self._set_count(count + 1)
+            return count
+
+    def delete(self, index):
+        """Kaydı silme (bütün parça kilitleri alınır)"""
+        with self.lock:
+            for shard_lock in self.shard_locks:
+                shard_lock.acquire()
+            try:
+                offset = self._offset(index)
+                end = len(self) * self.record_size
+                self.data[offset:end - self.record_size] = self.data[offset + self.record_size:end]
+                self._set_count(len(self) - 1)
+            finally:
+                for shard_lock in reversed(self.shard_locks):
+                    shard_lock.release()
+
+    def clear(self):
+        """Tüm kayıtları silme"""
+        with self.lock:
+            self._set_count(0)
+
+    def scrub(self, start=0, stop=None):
+        """Aralığı parça parça, her parçayı kendi kilidi altında tarama"""
+        stop = len(self) if stop is None else stop
+        corrected, uncorrectable = [], []
+        while start < stop:
+            end = min(stop, (start // SHARD_RECORDS + 1) * SHARD_RECORDS)
+            fixed, flagged = super().scrub(start, end)
+            corrected += fixed
+            uncorrectable += flagged
+            start = end
+        return corrected, uncorrectable
+
+    def close(self):
+        """Bu süreçteki eşlemeyi kapatma"""
+        self.data.release()
+        self.shm.close()
+
+    def __del__(self):
+        # Dilim serbest bırakılmazsa SharedMemory kapanırken BufferError verir
+        if isinstance(getattr(self, "data", None), memoryview):
+            self.data.release()
+
+    def unlink(self):
+        """Paylaşılan bellek bloğunu sistemden kaldırma (oluşturan süreç)"""
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
@@ -0,0 +1,291 @@
+"""Kodlayıcı performans ölçümü (grafik arayüz gerektirmez)
+
+Her (işlem, arka uç, genişlik, yığın boyu) için aynı tohumla üretilen
+rastgele kelimeler üzerinde süre ölçülür ve kelime/sn ile ns/kelime olarak
+raporlanır. Bir ölçüm en az ``min_time`` saniye sürecek kadar tekrarlanır;
+``repeat`` ölçümün en hızlısı sonuç olarak alınır (gürültü yalnızca
+yavaşlatır).
+
+İşlemler:
+
+- ``encode``: veri -> kod kelimesi
+- ``syndrome``: kod kelimesi -> sendrom
+- ``decode``: sendrom, sınıflandırma, düzeltme ve veri çıkarma; girdinin
+  her ``ERROR_STRIDE``. kelimesinde tek bit hatası vardır
+- ``scrub``: ``MemoryBank.scrub`` ile bankanın taranması; hatalar her
+  ölçümden önce (süre dışında) yeniden enjekte edilir
+
+Arka uçlar: ``reference`` (sınıftaki maskeli tanımlar), ``generated``
+(genişliğe özel üretilmiş fonksiyonlar), ``sliced`` (byte dilimli
+tablolar), ``bitslice`` / ``bitslice-array`` (bit dilimli kodlama),
+``numpy`` (toplu API, kod 64 bite kadar) ve ``bank`` (tarama). Kurulu
+olmayan veya genişliği desteklemeyen arka uçlar atlanır.
+
+Sonuçlar JSON olarak yazılır; önceki bir sonuç dosyası ``baseline``
+olarak verilirse kelime/sn değeri ``tolerance`` oranından fazla düşen
+ölçümler gerileme olarak raporlanır.
+"""
+import platform
+import random
+import sys
+import time
+from types import MethodType
+from typing import NamedTuple
+
+from .bank import MemoryBank
+from .codec import HAMMING, SLICE_MAX_WIDTH, USE_GENERATED, Codec
+
+DEFAULT_WIDTHS = (8, 16, 32, 64, 128, 4096)
+DEFAULT_BATCHES = (1, 64, 1024)
+OPERATIONS = ("encode", "syndrome", "decode", "scrub")
+BACKENDS = ("reference", "generated", "sliced", "bitslice", "bitslice-array", "numpy", "bank")
+MIN_TIME = 0.05  # Bir ölçümün en kısa süresi (sn)
+REPEAT = 3  # Ölçüm tekrarı (en hızlısı alınır)
+TOLERANCE = 0.2  # İzin verilen en fazla göreli yavaşlama
+ERROR_STRIDE = 8  # decode/scrub girdisinde her kaçıncı kelimede tek bit hatası olduğu
+SEED = 2024
+SCHEMA = 1
+
+
+class BenchResult(NamedTuple):
+    """Bir ölçümün sonucu"""
+    op: str
+    backend: str
+    family: str
+    width: int
+    batch: int
+    ns_per_word: float
+    words_per_sec: float
+
+    @property
+    def key(self):
+        return self.op, self.backend, self.family, self.width, self.batch
+
+
+class Regression(NamedTuple):
+    """Taban ölçüme göre yavaşlayan ölçüm"""
+    key: tuple  # (işlem, arka uç, aile, genişlik, yığın)
+    baseline: float  # Taban kelime/sn
+    current: float  # Ölçülen kelime/sn
+    tolerance: float
+
+    @property
+    def ratio(self):
+        return self.current / self.baseline
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def sample_words(codec, batch, seed=SEED):
+    """(veri kelimeleri, kod kelimeleri, tek hatalı kod kelimeleri)"""
+    rng = random.Random(seed + codec.width)
+    data = [rng.getrandbits(codec.width) for _ in range(batch)]
+    codes = [codec.encode_int(value) for value in data]
+    noisy = [word ^ (1 << rng.randrange(codec.length)) if i % ERROR_STRIDE == 0 else word
+             for i, word in enumerate(codes)]
+    return data, codes, noisy
+
+
+def _encode_case(encode, data):
+    def run():
+        for value in data:
+            encode(value)
+    return run
+
+
+def _decode_case(decode, words):
+    def run():
+        for word in words:
+            decode(word)
+    return run
+
+
+def build_case(op, backend, codec, batch, seed=SEED):
+    """Ölçülecek (çalıştır, hazırla) çifti; desteklenmiyorsa None
+
+    ``hazırla`` None değilse her ölçümden önce süre dışında çağrılır.
+    """
+    np = _numpy()
+    data, codes, noisy = sample_words(codec, batch, seed)
+
+    if backend in ("reference", "generated"):
+        if backend == "reference":
+            encode = MethodType(Codec.encode_int, codec)
+            syndrome = MethodType(Codec.syndrome_int, codec)
+            decode = MethodType(Codec.decode_int, codec)
+        else:
+            generated = codec.tables.generated
+            encode, syndrome, decode = generated["encode"], generated["syndrome"], generated["decode"]
+        if op == "encode":
+            return _encode_case(encode, data), None
+        if op == "syndrome":
+            return _decode_case(syndrome, noisy), None
+        if op == "decode":
+            return _decode_case(decode, noisy), None
+        return None
+
+    if backend == "sliced":
+        if op != "encode" or codec.width > SLICE_MAX_WIDTH:
+            return None
+        return _encode_case(codec.encode_sliced, data), None
+
+    if backend == "bitslice":
+        if op != "encode":
+            return None
+        from .bitslice import encode_bitsliced
+        return (lambda: encode_bitsliced(data, codec)), None
+
+    if backend == "bitslice-array":
+        if op != "encode" or np is None:
+            return None
+        from .bitslice import encode_bitsliced_array
+        size = (codec.width + 7) // 8
+        rows = np.frombuffer(b"".join(value.to_bytes(size, "big") for value in data), dtype=np.uint8)
+        rows = rows.reshape(batch, size)
+        return (lambda: encode_bitsliced_array(rows, codec)), None
+
+    if backend == "numpy":
+        if np is None or codec.length > 64 or op not in ("encode", "decode"):
+            return None
+        if op == "encode":
+            values = np.array(data, dtype=np.uint64)
+            return (lambda: codec.encode_batch(values)), None
+        words = np.array(noisy, dtype=np.uint64)
+        return (lambda: codec.decode_batch(words)), None
+
+    if backend == "bank" and op == "scrub":
+        bank = MemoryBank(codec.width, codec.family)
+        for word in noisy:
+            bank.append(word)
+        errors = [(i, noisy[i] ^ codes[i]) for i in range(0, batch, ERROR_STRIDE)]
+
+        def inject():
+            for index, error in errors:
+                bank.write(index, codes[index] ^ error)
+        return bank.scrub, inject
+    return None
+
+
+def measure(run, setup=None, min_time=MIN_TIME, repeat=REPEAT):
+    """Bir çağrının en kısa süresi (sn)"""
+    if setup is not None:
+        # Her çağrıdan önce durum yenilenir; çağrılar tek tek ölçülür
+        best = float("inf")
+        for _ in range(repeat):
+            spent = 0.0
+            while True:
+                setup()
+                began = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - began
+                best = min(best, elapsed)
+                spent += elapsed
+                if spent >= min_time:
+                    break
+        return best
+
+    loops = 1
+    while True:
+        began = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - began
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        began = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, (time.perf_counter() - began) / loops)
+    return best
+
+
+def run_benchmarks(widths=DEFAULT_WIDTHS, batches=DEFAULT_BATCHES, ops=OPERATIONS, backends=BACKENDS,
+                   family=HAMMING, min_time=MIN_TIME, repeat=REPEAT, progress=None):
+    """Bütün desteklenen bileşimleri ölçme; ``BenchResult`` listesi
+
+    ``progress`` verilirse her ölçümden sonra sonuçla çağrılır.
+    """
+    results = []
+    for width in widths:
+        codec = Codec(width, family)
+        for batch in batches:
+            for op in ops:
+                for backend in backends:
+                    case = build_case(op, backend, codec, batch)
+                    if case is None:
+                        continue
+                    seconds = measure(*case, min_time=min_time, repeat=repeat)
+                    ns = seconds / batch * 1e9
+                    result = BenchResult(op, backend, codec.family, width, batch, ns, 1e9 / ns)
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+    return results
+
+
+def environment():
+    """Sonuçların karşılaştırılabilirliği için ortam bilgisi"""
+    np = _numpy()
+    return {
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": np.__version__ if np is not None else None,
+        "use_generated": USE_GENERATED,
+    }
+
+
+def to_json(results, min_time=MIN_TIME, repeat=REPEAT, tolerance=TOLERANCE):
+    """Sonuç dosyasının JSON nesnesi (``compare`` için taban olarak kullanılabilir)"""
+    return {
+        "schema": SCHEMA,
+        "environment": environment(),
+        "config": {"min_time": min_time, "repeat": repeat, "seed": SEED, "tolerance": tolerance},
+        "results": [result._asdict() for result in results],
+    }
+
+
+def compare(results, baseline, tolerance=None):
+    """Tabana göre gerileyen ölçümler
+
+    ``baseline`` ``to_json`` çıktısıdır; tolerans sırasıyla sonuç
+    kaydındaki ``tolerance`` alanından, ``tolerance`` argümanından ve
+    tabanın ``config.tolerance`` değerinden alınır. Tabanda olmayan
+    ölçümler karşılaştırılmaz.
+    """
+    if baseline.get("schema") != SCHEMA:
+        raise ValueError(f"Desteklenmeyen taban dosyası şeması: {baseline.get('schema')}")
+    default = tolerance if tolerance is not None else baseline.get("config", {}).get("tolerance", TOLERANCE)
+    entries = {}
+    for entry in baseline["results"]:
+        key = (entry["op"], entry["backend"], entry["family"], entry["width"], entry["batch"])
+        entries[key] = entry
+
+    regressions = []
+    for result in results:
+        entry = entries.get(result.key)
+        if entry is None:
+            continue
+        allowed = entry.get("tolerance", default)
+        if result.words_per_sec < entry["words_per_sec"] * (1 - allowed):
+            regressions.append(Regression(result.key, entry["words_per_sec"], result.words_per_sec, allowed))
+    return regressions
+
+
+def format_result(result):
+    """Tek satırlık tablo satırı"""
+    return (f"{result.op:<9}{result.backend:<16}{result.family:<9}{result.width:>9}{result.batch:>7}"
+            f"{result.ns_per_word:>14.1f}{result.words_per_sec:>16,.0f}")
+
+
+HEADER_LINE = f"{'işlem':<9}{'arka uç':<16}{'aile':<9}{'genişlik':>9}{'yığın':>7}{'ns/kelime':>14}{'kelime/sn':>16}"
@@ -0,0 +1,251 @@
+"""Monte Carlo hata enjeksiyonu kampanyası (NumPy gerektirir)
+
+Kod doğrusal olduğundan bir denemenin sonucu veri kelimesine değil
+yalnızca hata desenine bağlıdır: hatalı kodun sendromu, desendeki
+pozisyonların sendrom sütunlarının XOR'u, genel parity'si ise desenin
+ağırlığının parity'sidir. Bu yüzden denemeler kod kelimesi kurmadan,
+yalnızca hata pozisyonları üzerinden vektörel olarak çalıştırılır ve
+``CodecTables.classify`` (GUI'deki ``correct_errors`` ile aynı karar)
+ile sınıflandırılır.
+
+Denemeler ``SHARD_TRIALS``'lık parçalara bölünür; parça i'nin rastgele
+sayı akışı ``SeedSequence(seed, spawn_key=(i,))``'dir. Sonuç bu yüzden
+işçi sayısından bağımsızdır ve parçalar süreçler arasında yalnızca
+sayaç dizisi taşır.
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from . import telemetry
+from .codec import CLEAN, CORRECTED, SECDED_BIT, DOUBLE, HAMMING, TABLE_CACHE_SIZE, get_tables
+
+SHARD_TRIALS = 1 << 22  # Bir parçadaki deneme sayısı
+MAX_BLOCK = 1 << 16  # Bir vektörel adımdaki en fazla deneme
+CELL_BUDGET = 1 << 22  # Yoğun desenlerde bir adımdaki en fazla (deneme x bit) hücre
+DENSE_WEIGHT = 16  # BER modelinde beklenen ağırlık bunu aşınca yoğun örnekleme
+
+# Deneme sonuçları
+NO_ERROR = 0  # Hata enjekte edilmedi
+FIXED = 1  # Tek hata doğru düzeltildi
+DETECTED = 2  # Hata tespit edildi, düzeltilmedi (çift hata)
+MISCORRECTED = 3  # Yanlış bit düzeltildi (sessiz veri bozulması)
+UNDETECTED = 4  # Hatalı kod temiz göründü (sessiz veri bozulması)
+
+OUTCOME_NAMES = {
+    NO_ERROR: "no-error",
+    FIXED: "corrected",
+    DETECTED: "detected",
+    MISCORRECTED: "miscorrected",
+    UNDETECTED: "undetected",
+}
+
+MODELS = ("ber", "flips", "burst")
+
+
+class ErrorModel(NamedTuple):
+    """Hata modeli
+
+    - ``ber``: her bit ``value`` olasılığıyla bağımsız ters çevrilir
+    - ``flips``: tam olarak ``value`` farklı bit ters çevrilir
+    - ``burst``: ``value`` uzunluğunda bir patlama; ilk ve son bit çevrilir,
+      aradakiler 1/2 olasılıkla
+    """
+    kind: str
+    value: float
+
+
+class ShardResult(NamedTuple):
+    """Bir parçanın sonucu"""
+    counts: list  # Sonuç başına deneme sayısı
+    syndromes: list  # Sendrom başına deneme sayısı (istenmediyse None)
+    seconds: float  # Parçanın çalışma süresi
+
+
+class CampaignResult(NamedTuple):
+    """Kampanya sonucu"""
+    family: str
+    width: int
+    trials: int
+    model: ErrorModel
+    seed: int
+    counts: dict  # Sonuç -> deneme sayısı
+
+    def rates(self):
+        """Sonuç -> oran"""
+        return {outcome: count / self.trials for outcome, count in self.counts.items()}
+
+
+def check_model(model, length):
+    """Model parametresini kod uzunluğuna göre doğrulama"""
+    kind, value = model
+    if kind == "ber":
+        if not 0 <= value <= 1:
+            raise ValueError(f"BER 0 ile 1 arasında olmalı (Mevcut: {value})")
+    elif kind in ("flips", "burst"):
+        if value != int(value) or not 1 <= value <= length:
+            raise ValueError(f"{kind} için 1 ile {length} arasında tamsayı bekleniyordu (Mevcut: {value})")
+    else:
+        raise ValueError(f"Bilinmeyen hata modeli: {kind} ({', '.join(MODELS)})")
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def campaign_tables(tables):
+    """(sendrom sütunları, sonuç tablosu)
+
+    Sonuç tablosunun indeksi ``(syndrome | parity << r) * 3 + min(ağırlık, 2)``
+    şeklindedir; düzeltme ancak desen tek bitse doğrudur.
+    """
+    columns = np.array(tables.columns, dtype=np.intp)
+    by_status = {
+        CLEAN: (NO_ERROR, UNDETECTED, UNDETECTED),
+        CORRECTED: (MISCORRECTED, FIXED, MISCORRECTED),
+        SECDED_BIT: (MISCORRECTED, FIXED, MISCORRECTED),  # Tarama genel parity bitini yeniden yazar
+        DOUBLE: (DETECTED, DETECTED, DETECTED),
+    }
+    size = 1 << (tables.r + 1)
+    outcome = np.empty(size * 3, dtype=np.uint8)
+    for index in range(size):
+        status = tables.classify(index & ((1 << tables.r) - 1), index >> tables.r)
+        outcome[index * 3:index * 3 + 3] = by_status[status]
+    return columns, outcome
+
+
+def distinct_positions(rng, count, k, length):
+    """``count`` deneme için k farklı pozisyon (1-indexed), (count, k) dizisi"""
+    if k * k > length:
+        # Yoğun: rastgele anahtarların en küçük k tanesi
+        keys = rng.random((count, length))
+        return keys.argpartition(k - 1, axis=1)[:, :k] + 1
+
+    # Seyrek: bağımsız çek, tekrar içeren satırları yeniden çek
+    positions = rng.integers(1, length + 1, size=(count, k))
+    rows = np.arange(count)
+    while k > 1 and rows.size:
+        ordered = np.sort(positions[rows], axis=1)
+        rows = rows[(ordered[:, 1:] == ordered[:, :-1]).any(axis=1)]
+        positions[rows] = rng.integers(1, length + 1, size=(rows.size, k))
+    return positions
+
+
+def inject(rng, count, model, tables, columns):
+    """``count`` deneme için (sendrom, ağırlık) dizileri"""
+    kind, value = model
+    length = tables.length
+
+    if kind == "flips":
+        k = int(value)
+        positions = distinct_positions(rng, count, k, length)
+        syndrome = np.bitwise_xor.reduce(columns[positions], axis=1)
+        return syndrome, np.full(count, k)
+
+    if kind == "burst":
+        size = int(value)
+        start = rng.integers(1, length - size + 2, size=count)
+        flips = rng.integers(0, 2, size=(count, size), dtype=np.uint8).astype(bool)
+        flips[:, 0] = flips[:, -1] = True
+        positions = start[:, None] + np.arange(size)
+        syndrome = np.bitwise_xor.reduce(np.where(flips, columns[positions], 0), axis=1)
+        return syndrome, flips.sum(axis=1)
+
+    # BER
+    if value * length > DENSE_WEIGHT:
+        flips = rng.random((count, length)) < value
+        syndrome = np.bitwise_xor.reduce(np.where(flips, columns[1:], 0), axis=1)
+        return syndrome, flips.sum(axis=1)
+
+    weight = rng.binomial(length, value, size=count)
+    syndrome = np.zeros(count, dtype=np.intp)
+    for k in np.unique(weight[weight > 0]):
+        rows = np.flatnonzero(weight == k)
+        positions = distinct_positions(rng, rows.size, int(k), length)
+        syndrome[rows] = np.bitwise_xor.reduce(columns[positions], axis=1)
+    return syndrome, weight
+
+
+def block_trials(model, length):
+    """Bir vektörel adımda çalıştırılacak deneme sayısı"""
+    kind, value = model
+    if kind == "ber":
+        cells = length if value * length > DENSE_WEIGHT else 1
+    elif kind == "flips":
+        cells = length if value * value > length else value
+    else:
+        cells = value
+    return max(1, min(MAX_BLOCK, CELL_BUDGET // int(cells)))
+
+
+def run_shard(width, family, model, seed, index, trials, syndromes=False):
+    """Bir parçayı çalıştırma; ``ShardResult`` döndürür
+
+    ``syndromes`` açıksa hatalı kodların sendrom dağılımı da sayılır.
+    """
+    began = time.perf_counter()
+    tables = get_tables(width, family)
+    columns, outcome_table = campaign_tables(tables)
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    parity_shift = tables.r
+    block = block_trials(model, tables.length)
+
+    counts = np.zeros(len(OUTCOME_NAMES), dtype=np.int64)
+    syndrome_counts = np.zeros(1 << tables.r, dtype=np.int64) if syndromes else None
+    for start in range(0, trials, block):
+        count = min(block, trials - start)
+        syndrome, weight = inject(rng, count, model, tables, columns)
+        key = (syndrome | (weight & 1) << parity_shift) * 3 + np.minimum(weight, 2)
+        counts += np.bincount(outcome_table[key], minlength=len(OUTCOME_NAMES))
+        if syndromes:
+            syndrome_counts += np.bincount(syndrome, minlength=syndrome_counts.size)
+    return ShardResult(counts.tolist(), syndrome_counts.tolist() if syndromes else None,
+                       time.perf_counter() - began)
+
+
+def record_shard(shard):
+    """Parça sonucunu telemetriye ekleme"""
+    metrics = telemetry.METRICS
+    metrics.observe("campaign_shard", shard.seconds)
+    for outcome, count in zip(OUTCOME_NAMES.values(), shard.counts):
+        if count:
+            metrics.inc("campaign_trials_total", count, outcome=outcome)
+    metrics.add_syndromes(shard.syndromes)
+
+
+def run_campaign(width, trials, model, seed=None, workers=None, shard_trials=SHARD_TRIALS, family=HAMMING):
+    """Monte Carlo kampanyasını çalıştırma
+
+    ``workers`` 1 ise parçalar bu süreçte, aksi halde bir
+    ``ProcessPoolExecutor`` üzerinde (None: çekirdek sayısı kadar işçi)
+    çalıştırılır. ``seed`` verilmezse rastgele seçilir ve sonuçta döner.
+    """
+    tables = get_tables(width, family)
+    model = ErrorModel(*model)
+    check_model(model, tables.length)
+    if trials < 1:
+        raise ValueError(f"Deneme sayısı pozitif olmalı (Mevcut: {trials})")
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+
+    collect = telemetry.enabled
+    shards = [(width, family, model, seed, index, min(shard_trials, trials - start), collect)
+              for index, start in enumerate(range(0, trials, shard_trials))]
+
+    totals = [0] * len(OUTCOME_NAMES)
+
+    def add(shard):
+        nonlocal totals
+        totals = [a + b for a, b in zip(totals, shard.counts)]
+        if collect:
+            record_shard(shard)
+
+    if workers == 1 or len(shards) == 1:
+        for shard in shards:
+            add(run_shard(*shard))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for shard in executor.map(run_shard, *zip(*shards)):
+                add(shard)
+
+    return CampaignResult(family, width, trials, model, seed, dict(zip(OUTCOME_NAMES, totals)))
@@ -0,0 +1,425 @@
+"""Komut satırı: dosya/akış kodlama ve kod çözme
+
+Kullanım::
+
+    python -m hamming_secded encode --width 64 girdi.bin cikti.ecc
+    python -m hamming_secded decode cikti.ecc geri.bin --report hata.txt
+    python -m hamming_secded campaign --width 64 --trials 1e9 --ber 1e-4
+    python -m hamming_secded verify 8 16 32 64 1-128 4096
+    python -m hamming_secded serve --port 7878
+    python -m hamming_secded bench --output sonuc.json --baseline taban.json
+
+Girdi sabit boyutlu parçalar halinde okunur ve üreteç (generator) hattı
+ile işlenir; dosyanın tamamı belleğe alınmaz. 8 veri kelimesi tam olarak
+``width`` byte, 8 kod kelimesi tam olarak ``length`` byte eder; bu yüzden
+kodlar her genişlikte boşluksuz paketlenir.
+
+.ecc dosya biçimi: 8 byte başlık (``HSEC``, sürüm, kod ailesi, genişlik),
+8'li kod grupları, ve 8 byte kuyruk (orijinal veri uzunluğu, byte). Kod
+ailesi ``FAMILIES`` içindeki sırasıdır (0: Hamming, 1: Hsiao).
+
+``--interleave D`` ile kodlanan dosyalarda sürüm 2'dir ve başlıktan sonra
+2 byte serpiştirme derinliği gelir; kodlar D kelimelik serpiştirilmiş
+çerçeveler halinde yazılır (``interleave`` modülü), böylece dosyadaki D
+bitten kısa patlamalar kelime başına tek bit hatası olarak düzeltilir. D
+8'in katı olmalıdır (çerçeve tam byte ve tam veri grubu olsun diye).
+"""
+import argparse
+import struct
+import sys
+
+from . import telemetry
+from .codec import Codec, CLEAN, DOUBLE, FAMILIES, HAMMING, STATUS_NAMES, SLICE_MAX_WIDTH
+from .interleave import MAX_DEPTH, deinterleave_bytes, interleave_bytes
+from .bench import BACKENDS as BENCH_BACKENDS, DEFAULT_BATCHES as DEFAULT_BENCH_BATCHES, \
+    DEFAULT_WIDTHS as DEFAULT_BENCH_WIDTHS, OPERATIONS as BENCH_OPERATIONS
+
+MAGIC = b"HSEC"
+VERSION = 1
+INTERLEAVED_VERSION = 2
+HEADER = struct.Struct(">4sBBH")  # sihirli değer, sürüm, kod ailesi, genişlik
+DEPTH = struct.Struct(">H")  # serpiştirme derinliği (yalnızca sürüm 2)
+TRAILER = struct.Struct(">Q")  # orijinal veri uzunluğu (byte)
+
+GROUP = 8  # Bir grupta kelime sayısı (8 kelime = width byte)
+CHUNK_BYTES = 1 << 20  # Bir parçada okunan yaklaşık byte sayısı
+
+
+def read_chunks(stream, size):
+    """Akışı ``size`` byte'lık parçalar halinde okuma (son parça kısa olabilir)"""
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def split_trailer(chunks, size, trailer):
+    """Parçaları ``size``'ın katları halinde geçirme, son ``trailer.size`` byte'ı ayırma
+
+    Kuyruk byte'ları ``trailer`` listesine eklenir.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        usable = (len(buffer) - TRAILER.size) // size * size
+        if usable > 0:
+            yield bytes(buffer[:usable])
+            del buffer[:usable]
+    if len(buffer) < TRAILER.size:
+        raise ValueError("Kod dosyası eksik: kuyruk bulunamadı")
+    if len(buffer) > TRAILER.size:
+        if (len(buffer) - TRAILER.size) % size:
+            raise ValueError("Kod dosyası bozuk: eksik kod grubu")
+        yield bytes(buffer[:-TRAILER.size])
+    trailer.append(bytes(buffer[-TRAILER.size:]))
+
+
+def split_group(block, bits):
+    """8 kelimelik byte grubunu ``bits`` bitlik tamsayılara ayırma"""
+    big = int.from_bytes(block, "big")
+    mask = (1 << bits) - 1
+    return [(big >> (bits * (GROUP - 1 - i))) & mask for i in range(GROUP)]
+
+
+def join_group(words, bits):
+    """8 adet ``bits`` bitlik tamsayıyı ``bits`` byte'lık gruba birleştirme"""
+    big = 0
+    for word in words:
+        big = (big << bits) | word
+    return big.to_bytes(bits, "big")
+
+
+def check_stream_depth(depth):
+    if not 1 <= depth <= MAX_DEPTH or depth > 1 and depth % GROUP:
+        raise ValueError(f"Serpiştirme derinliği 1 veya en fazla {MAX_DEPTH} olan {GROUP}'in katı olmalı "
+                         f"(Mevcut: {depth})")
+
+
+def encode_stream(src, dst, codec, chunk_bytes=CHUNK_BYTES, depth=1):
+    """Veri akışını kodlayıp .ecc akışına yazma; veri uzunluğunu döndürür
+
+    ``depth`` 1'den büyükse her parçanın kodları ``interleave_bytes`` ile
+    ``depth`` kelimelik çerçevelere serpiştirilir.
+    """
+    check_stream_depth(depth)
+    width, length = codec.width, codec.length
+    encode = codec.encode_sliced if width <= SLICE_MAX_WIDTH else codec.encode_int
+    frame = max(depth, GROUP) // GROUP * width  # Bir çerçevenin veri byte'ları
+    chunk_size = max(1, chunk_bytes // frame) * frame
+
+    family = FAMILIES.index(codec.family)
+    if depth == 1:
+        dst.write(HEADER.pack(MAGIC, VERSION, family, width))
+    else:
+        dst.write(HEADER.pack(MAGIC, INTERLEAVED_VERSION, family, width) + DEPTH.pack(depth))
+    total = 0
+    for chunk in read_chunks(src, chunk_size):
+        total += len(chunk)
+        if len(chunk) % frame:
+            chunk += bytes(frame - len(chunk) % frame)  # Son çerçeveyi sıfırla tamamla
+        out = bytearray()
+        if depth == 1:
+            for start in range(0, len(chunk), width):
+                words = split_group(chunk[start:start + width], width)
+                out += join_group(map(encode, words), length)
+        else:
+            size = (length + 7) // 8
+            for start in range(0, len(chunk), width):
+                for word in split_group(chunk[start:start + width], width):
+                    out += encode(word).to_bytes(size, "big")
+            out = interleave_bytes(out, length, depth)
+        dst.write(out)
+    dst.write(TRAILER.pack(total))
+    return total
+
+
+def decode_stream(src, dst, report=None, width=None, chunk_bytes=CHUNK_BYTES):
+    """.ecc akışını çözüp veriyi yazma; durum sayılarını döndürür
+
+    ``report`` verilirse hatalı her kelime için bir satır yazılır.
+    """
+    header = src.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError("Kod dosyası eksik: başlık bulunamadı")
+    magic, version, family, file_width = HEADER.unpack(header)
+    if magic != MAGIC or version not in (VERSION, INTERLEAVED_VERSION) or family >= len(FAMILIES):
+        raise ValueError("Geçersiz kod dosyası")
+    if width is not None and width != file_width:
+        raise ValueError(f"Dosya {file_width} bitlik veri için kodlanmış (istenen: {width})")
+    depth = 1
+    if version == INTERLEAVED_VERSION:
+        field = src.read(DEPTH.size)
+        if len(field) != DEPTH.size:
+            raise ValueError("Kod dosyası eksik: başlık bulunamadı")
+        (depth,) = DEPTH.unpack(field)
+        if depth < 2 or depth % GROUP:
+            raise ValueError("Geçersiz kod dosyası")
+
+    codec = Codec(file_width, FAMILIES[family])
+    length = codec.length
+    words_per_frame = max(depth, GROUP)
+    frame = words_per_frame // GROUP * length  # Bir çerçevenin kod byte'ları
+    frame_data = words_per_frame // GROUP * file_width
+    size = (length + 7) // 8  # deinterleave_bytes kayıt boyu
+    chunk_size = max(1, chunk_bytes // frame) * frame
+    counts = dict.fromkeys(STATUS_NAMES, 0)
+
+    if report is not None:
+        report.write("# kelime\tdurum\tpozisyon\tsendrom\n")
+
+    trailer = []
+    index = 0
+    written = 0
+    pending = b""  # Son çerçeve: dolgusu kuyruk okununca atılır
+    for chunk in split_trailer(read_chunks(src, chunk_size), frame, trailer):
+        out = bytearray(pending)
+        if depth == 1:
+            words = [word for start in range(0, len(chunk), length)
+                     for word in split_group(chunk[start:start + length], length)]
+        else:
+            records = deinterleave_bytes(chunk, length, depth)
+            words = [int.from_bytes(records[i:i + size], "big") for i in range(0, len(records), size)]
+        data = []
+        for word in words:
+            result = codec.decode_int(word)
+            counts[result.status] += 1
+            if result.status != CLEAN and report is not None:
+                report.write(f"{index}\t{STATUS_NAMES[result.status]}\t{result.position}\t{result.syndrome}\n")
+            data.append(result.data)
+            index += 1
+        for group in range(0, len(data), GROUP):
+            out += join_group(data[group:group + GROUP], file_width)
+        dst.write(out[:-frame_data])
+        written += len(out) - frame_data
+        pending = bytes(out[-frame_data:])
+
+    # Son grubun dolgu byte'larını atma
+    (total,) = TRAILER.unpack(trailer[0])
+    if not written <= total <= written + len(pending) or (pending and total == written):
+        raise ValueError("Kod dosyası bozuk: veri uzunluğu tutmuyor")
+    dst.write(pending[:total - written])
+    return counts
+
+
+def _open(path, mode):
+    if path == "-":
+        return (sys.stdin if "r" in mode else sys.stdout).buffer
+    return open(path, mode)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="hamming-secded",
+        description="Hamming SEC-DED dosya/akış kodlayıcı",
+    )
+    parser.add_argument("--metrics", help="Çıkışta telemetri anlık görüntüsünü yaz (.prom: Prometheus metni, aksi halde JSON)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    enc = sub.add_parser("encode", help="Veriyi SEC-DED kodlarına çevir")
+    enc.add_argument("--width", type=int, required=True, help="Veri kelimesi genişliği (bit)")
+    enc.add_argument("--family", choices=FAMILIES, default=HAMMING, help="Kod ailesi (varsayılan: hamming)")
+    enc.add_argument("--interleave", type=int, default=1, metavar="D",
+                     help="D kelimelik serpiştirme; D bitten kısa patlamalar düzeltilir (1 veya 8'in katı, en fazla 65528, varsayılan: 1)")
+    enc.add_argument("input", help="Girdi dosyası ('-' = stdin)")
+    enc.add_argument("output", help="Çıktı .ecc dosyası ('-' = stdout)")
+
+    dec = sub.add_parser("decode", help="SEC-DED kodlarını çöz ve tek bit hatalarını düzelt")
+    dec.add_argument("--width", type=int, help="Beklenen veri genişliği (dosya başlığı ile kontrol edilir)")
+    dec.add_argument("--report", help="Hata raporu dosyası (varsayılan: <output>.report)")
+    dec.add_argument("input", help="Girdi .ecc dosyası ('-' = stdin)")
+    dec.add_argument("output", help="Çıktı veri dosyası ('-' = stdout)")
+
+    camp = sub.add_parser("campaign", help="Monte Carlo hata enjeksiyonu kampanyası (NumPy gerektirir)")
+    camp.add_argument("--width", type=int, required=True, help="Veri kelimesi genişliği (bit)")
+    camp.add_argument("--family", choices=FAMILIES, default=HAMMING, help="Kod ailesi (varsayılan: hamming)")
+    camp.add_argument("--trials", type=lambda s: int(float(s)), required=True, help="Deneme sayısı (örn. 1e9)")
+    model = camp.add_mutually_exclusive_group(required=True)
+    model.add_argument("--ber", type=float, help="Bağımsız bit hata oranı")
+    model.add_argument("--flips", type=int, help="Her denemede çevrilen farklı bit sayısı")
+    model.add_argument("--burst", type=int, help="Patlama hatası uzunluğu (bit)")
+    camp.add_argument("--seed", type=int, help="Tohum (verilmezse rastgele, çıktıda yazılır)")
+    camp.add_argument("--workers", type=int, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+
+    ver = sub.add_parser("verify", help="Bütün tek ve çift bit hatalarını doğrula (NumPy gerektirir)")
+    ver.add_argument("widths", nargs="+", help="Veri genişlikleri: N veya A-B aralığı")
+    ver.add_argument("--family", choices=FAMILIES, default=HAMMING, help="Kod ailesi (varsayılan: hamming)")
+    ver.add_argument("--workers", type=int, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+
+    srv = sub.add_parser("serve", help="asyncio ECC servisi (NumPy gerektirir)")
+    srv.add_argument("--host", default="127.0.0.1", help="Dinlenecek adres (varsayılan: 127.0.0.1)")
+    srv.add_argument("--port", type=int, default=7878, help="TCP portu (varsayılan: 7878)")
+    srv.add_argument("--unix", help="TCP yerine bu Unix soketini dinle")
+    srv.add_argument("--window", type=float, default=1.0, help="İsteklerin toplandığı süre (ms)")
+
+    bench = sub.add_parser("bench", help="Genişlik, arka uç ve yığın boyuna göre performans ölçümü")
+    bench.add_argument("--widths", nargs="+", default=[str(w) for w in DEFAULT_BENCH_WIDTHS],
+                       help="Veri genişlikleri: N veya A-B aralığı (varsayılan: 8 16 32 64 128 4096)")
+    bench.add_argument("--batch", type=int, nargs="+", default=list(DEFAULT_BENCH_BATCHES),
+                       help="Yığın boyları (varsayılan: 1 64 1024)")
+    bench.add_argument("--ops", nargs="+", choices=BENCH_OPERATIONS, default=list(BENCH_OPERATIONS),
+                       help="Ölçülecek işlemler")
+    bench.add_argument("--backends", nargs="+", choices=BENCH_BACKENDS, default=list(BENCH_BACKENDS),
+                       help="Ölçülecek arka uçlar (kurulu olmayanlar atlanır)")
+    bench.add_argument("--family", choices=FAMILIES, default=HAMMING, help="Kod ailesi (varsayılan: hamming)")
+    bench.add_argument("--min-time", type=float, default=0.05, help="Bir ölçümün en kısa süresi (sn)")
+    bench.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrarı, en hızlısı alınır")
+    bench.add_argument("--output", help="JSON sonuç dosyası (varsayılan: stdout)")
+    bench.add_argument("--baseline", help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    bench.add_argument("--tolerance", type=float,
+                       help="İzin verilen göreli yavaşlama (varsayılan: tabandaki değer veya 0.2)")
+    return parser
+
+
+def run_bench_command(args):
+    """``bench`` alt komutu: tabloyu stderr'e, JSON'u dosyaya/stdout'a yazma"""
+    import json
+    from .bench import HEADER_LINE, TOLERANCE, compare, format_result, run_benchmarks, to_json
+
+    widths = parse_widths(args.widths)
+    for width in widths:
+        Codec(width, args.family)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(HEADER_LINE, file=sys.stderr)
+    results = run_benchmarks(widths, args.batch, args.ops, args.backends, args.family, args.min_time, args.repeat,
+                             progress=lambda result: print(format_result(result), file=sys.stderr))
+    document = to_json(results, args.min_time, args.repeat,
+                       args.tolerance if args.tolerance is not None else TOLERANCE)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        op, backend, family, width, batch = regression.key
+        print(f"GERİLEME: {op} {backend} {family} {width} bit, yığın {batch}: "
+              f"{regression.current:,.0f} < {regression.baseline:,.0f} kelime/sn "
+              f"(%{(1 - regression.ratio) * 100:.0f} yavaş, izin %{regression.tolerance * 100:.0f})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def run_serve_command(args):
+    """``serve`` alt komutu: servis kapatılana kadar çalışır"""
+    import asyncio
+    from .service import start_server
+
+    async def serve():
+        server = await start_server(args.host, args.port, args.unix, args.window / 1000)
+        where = args.unix or f"{args.host}:{args.port}"
+        print(f"ECC servisi dinleniyor: {where}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def parse_widths(items):
+    """``N`` ve ``A-B`` ifadelerinden sıralı genişlik listesi"""
+    widths = set()
+    for item in items:
+        first, _, last = item.partition("-")
+        try:
+            first = int(first)
+            last = int(last) if last else first
+        except ValueError:
+            raise ValueError(f"Geçersiz genişlik: {item}") from None
+        widths.update(range(first, last + 1))
+    return sorted(widths)
+
+
+def run_verify_command(args):
+    """``verify`` alt komutu: genişlik başına özet ve bulunan hatalar"""
+    from .verify import describe, verify_widths
+
+    widths = parse_widths(args.widths)
+    for width in widths:
+        Codec(width, args.family)  # Genişlikleri işçilere dağıtmadan önce doğrula
+    failed = 0
+    for result in verify_widths(widths, args.workers, args.family):
+        state = "OK" if result.ok else "HATA"
+        print(f"({result.length},{result.width})\t{state}\ttek={result.singles}\tçift={result.pairs}\tçözülen={result.decoded}")
+        for mismatch in result.mismatches:
+            print(f"    {describe(mismatch)}")
+        failed += not result.ok
+    return 1 if failed else 0
+
+
+def run_campaign_command(args):
+    """``campaign`` alt komutu: sonuç sayılarını ve oranlarını yazdırma"""
+    from .campaign import OUTCOME_NAMES, run_campaign
+
+    kind = next(k for k in ("ber", "flips", "burst") if getattr(args, k) is not None)
+    result = run_campaign(args.width, args.trials, (kind, getattr(args, kind)), args.seed, args.workers,
+                          family=args.family)
+    print(f"# family={result.family} width={result.width} trials={result.trials} model={kind}:{result.model.value} seed={result.seed}")
+    rates = result.rates()
+    for outcome, name in OUTCOME_NAMES.items():
+        print(f"{name}\t{result.counts[outcome]}\t{rates[outcome]:.6e}")
+    return 0
+
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    args = build_parser().parse_args(argv)
+    if args.metrics is None:
+        return run_command(args)
+
+    telemetry.enable()
+    try:
+        return run_command(args)
+    finally:
+        try:
+            telemetry.write_snapshot(args.metrics)
+        except OSError as e:
+            print(f"Hata: telemetri yazılamadı: {e}", file=sys.stderr)
+
+
+def run_command(args):
+    """Alt komutu çalıştırma; çıkış kodunu döndürür"""
+    try:
+        if args.command == "encode":
+            codec = Codec(args.width, args.family)
+            check_stream_depth(args.interleave)
+            with _open(args.input, "rb") as src, _open(args.output, "wb") as dst:
+                total = encode_stream(src, dst, codec, depth=args.interleave)
+            print(f"{total} byte veri {args.width} bitlik kelimelerle kodlandı", file=sys.stderr)
+            return 0
+        if args.command == "campaign":
+            return run_campaign_command(args)
+        if args.command == "verify":
+            return run_verify_command(args)
+        if args.command == "serve":
+            return run_serve_command(args)
+        if args.command == "bench":
+            return run_bench_command(args)
+
+        report_path = args.report
+        if report_path is None and args.output != "-":
+            report_path = f"{args.output}.report"
+        report = open(report_path, "w", encoding="utf-8") if report_path else None
+        try:
+            with _open(args.input, "rb") as src, _open(args.output, "wb") as dst:
+                counts = decode_stream(src, dst, report, args.width)
+        finally:
+            if report is not None:
+                report.close()
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+
+    summary = ", ".join(f"{STATUS_NAMES[s]}={n}" for s, n in counts.items())
+    print(f"Kod çözme tamamlandı: {summary}", file=sys.stderr)
+    return 1 if counts[DOUBLE] else 0
@@ -0,0 +1,487 @@
+"""Hamming SEC-DED kodlayıcı çekirdeği (arayüzden bağımsız)"""
+from functools import cached_property, lru_cache
+from itertools import combinations
+from typing import NamedTuple
+
+from . import telemetry
+
+MAX_WIDTH = 4096  # Desteklenen en büyük veri genişliği
+TABLE_CACHE_SIZE = 64  # Önbellekte tutulan genişlik sayısı
+SLICE_MAX_WIDTH = 256  # Byte dilimli tabloların kurulduğu (ve maskelerden hızlı olduğu) en büyük genişlik
+USE_GENERATED = True  # Codec tamsayı API'sinde üretilmiş düz fonksiyonları kullansın mı
+
+# Kod aileleri
+HAMMING = "hamming"  # Klasik Hamming düzeni + ayrı SEC-DED genel parity biti
+HSIAO = "hsiao"  # Tek ağırlıklı sütunlu (odd-weight-column) Hsiao kodu
+FAMILIES = (HAMMING, HSIAO)
+
+# Hata sınıfları
+CLEAN = 0  # Hata yok
+CORRECTED = 1  # Tek bit hatası - düzeltilebilir
+SECDED_BIT = 2  # Sendrom 0, genel parity 1 - SEC-DED (genel parity) biti hatası, düzeltilebilir
+DOUBLE = 3  # Çift hata - düzeltilemez
+
+STATUS_NAMES = {
+    CLEAN: "clean",
+    CORRECTED: "corrected",
+    SECDED_BIT: "secded-bit",
+    DOUBLE: "double",
+}
+
+
+class DecodeResult(NamedTuple):
+    """Kod çözme sonucu (liste API'sinde str/list, tamsayı API'sinde int)"""
+    data: object  # Düzeltilmiş (veya düzeltilemediyse ham) veri
+    code: object  # Düzeltilmiş kod
+    status: int  # CLEAN / CORRECTED / SECDED_BIT / DOUBLE
+    syndrome: int
+    position: int  # Düzeltilen bitin pozisyonu (1-indexed), yoksa 0
+
+
+def parity_bit_count(k):
+    """Gerekli parity bit sayısını bulma: 2^r >= k + r + 1"""
+    r = 0
+    while (1 << r) < k + r + 1:
+        r += 1
+    return r
+
+
+def clean_bits(text):
+    """Boşlukları temizle"""
+    return text.replace(" ", "").replace("\t", "").replace("\n", "")
+
+
+def pack(bits):
+    """Bit listesini/dizisini tamsayıya paketleme (ilk bit en anlamlı bit)"""
+    if not isinstance(bits, str):
+        bits = ''.join(map(str, bits))
+    if not bits or bits.strip("01"):
+        raise ValueError("Sadece 0 ve 1 girilebilir!")
+    return int(bits, 2)
+
+
+def unpack(word, length):
+    """Tamsayıyı bit listesine açma"""
+    return list(map(int, format(word, f"0{length}b")))
+
+
+def check_width(width):
+    if not 1 <= width <= MAX_WIDTH:
+        raise ValueError(f"Geçersiz veri genişliği: {width} (1-{MAX_WIDTH} bit)")
+
+
+class CodecTables:
+    """Bir veri genişliği için önceden hesaplanmış kodlama tabloları
+
+    Doğrudan oluşturmak yerine genişlik başına önbelleğe alınan
+    ``get_tables`` kullanılmalıdır.
+    """
+
+    family = HAMMING
+    secded_bit = True  # Ayrı genel parity biti (bit 0) var mı
+
+    def __init__(self, width):
+        check_width(width)
+        self.width = width  # Veri uzunluğu (k)
+        self.r = parity_bit_count(width)  # Parity bit sayısı
+        self.n = width + self.r  # Toplam bit sayısı (SEC-DED hariç)
+        self.length = self.n + 1  # SEC-DED dahil kod uzunluğu
+        n, length = self.n, self.length
+
+        # Parity bit pozisyonları (0-indexed, SEC-DED dahil)
+        self.parity_positions = frozenset([(1 << i) - 1 for i in range(self.r)] + [length - 1])
+
+        # Veri bitlerinin pozisyonları (1-indexed, 2'nin kuvveti olmayanlar)
+        self.data_positions = tuple(j for j in range(1, n + 1) if j & (j - 1))
+
+        # Parity maskesi i: i. biti 1 olan tüm pozisyonlar (parity biti dahil)
+        masks = [0] * self.r
+        for j in range(1, n + 1):
+            bit = 1 << (length - j)
+            for i in range(self.r):
+                if j >> i & 1:
+                    masks[i] |= bit
+        self.parity_masks = tuple(masks)
+        self.parity_bits = tuple(1 << (length - (1 << i)) for i in range(self.r))
+
+        # Veri bitleri iki kuvvet arasındaki bloklara sırayla yerleşir:
+        # (veriden kaydırma, blok maskesi, koda kaydırma)
+        runs = []
+        used = 0
+        i = 1
+        while (1 << i) < n:
+            first = (1 << i) + 1
+            last = min((1 << (i + 1)) - 1, n)
+            size = last - first + 1
+            runs.append((width - used - size, (1 << size) - 1, length - last))
+            used += size
+            i += 1
+        self.data_runs = tuple(runs)
+
+        # Pozisyon -> sendrom sütunu (1-indexed; SEC-DED biti sendroma katılmaz)
+        self.columns = tuple(range(n + 1)) + (0,)
+
+        # Sendrom -> düzeltme maskesi (kod dışını gösteren sendromlar için 0)
+        self.syndrome_table = tuple(
+            1 << (length - s) if 1 <= s <= n else 0 for s in range(1 << self.r)
+        )
+
+        # Sendrom -> düzeltilecek pozisyon (Hamming düzeninde sendromun kendisi)
+        self.syndrome_positions = tuple(s if s <= n else 0 for s in range(1 << self.r))
+
+    @cached_property
+    def slice_tables(self):
+        """Byte dilimli (CRC tarzı) kodlama tabloları
+
+        Kod doğrusal olduğundan her veri byte'ının (en düşük byte ilk) 256
+        olası değerinin koda katkısı (yerleşmiş veri bitleri, parity bitleri
+        ve SEC-DED biti) önceden hesaplanır; kodlama byte başına bir tablo
+        okuması ve XOR'dur. Tablolar ilk kullanımda kurulur.
+        """
+        if self.width > SLICE_MAX_WIDTH:
+            raise ValueError(f"Byte dilimli kodlama en fazla {SLICE_MAX_WIDTH} bit destekler (Mevcut: {self.width})")
+
+        # Tek bitlik verilerin kodları, maskeli kodlayıcı ile aynı tanım
+        codec = Codec(self.width, self.family)
+        tables = []
+        for lane in range((self.width + 7) // 8):
+            basis = [Codec.encode_int(codec, 1 << (8 * lane + j)) if 8 * lane + j < self.width else 0 for j in range(8)]
+            table = [0] * 256
+            for byte in range(1, 256):
+                low = byte & -byte
+                table[byte] = table[byte ^ low] ^ basis[low.bit_length() - 1]
+            tables.append(tuple(table))
+        return tuple(tables)
+
+    @cached_property
+    def generated(self):
+        """Bu tablolar için üretilip derlenmiş düz fonksiyonlar (bkz. ``generated``)"""
+        from .generated import compile_tables
+        return compile_tables(self)
+
+    def classify(self, syndrome, overall_parity):
+        """Sendrom ve genel parity'den hata sınıfını belirleme"""
+        if syndrome == 0:
+            return CLEAN if overall_parity == 0 else SECDED_BIT
+        if overall_parity == 1 and syndrome <= self.n:
+            return CORRECTED
+        # Sendrom > 0 ve parity 0 (veya kod dışını gösteren sendrom)
+        return DOUBLE
+
+
+def hsiao_columns(k, r):
+    """k veri biti için r bitlik, satırları dengeli tek ağırlıklı sütunlar
+
+    Sütunlar ağırlık 3'ten başlayarak seçilir. Bir ağırlık sınıfı r bitlik
+    döndürme yörüngelerine ayrılır; tam bir yörünge her satıra aynı sayıda
+    1 ekler. Sığmayan son sütunlar en az yüklü satırlara göre seçilir.
+    """
+    columns = []
+    rows = [0] * r
+    full = (1 << r) - 1
+
+    def take(column):
+        columns.append(column)
+        for i in range(r):
+            rows[i] += column >> i & 1
+
+    weight = 3
+    while len(columns) < k:
+        if weight > r:
+            raise ValueError(f"{k} bit veri için {r} kontrol biti yetersiz")
+        rest = set(sum(1 << b for b in bits) for bits in combinations(range(r), weight))
+        while rest and len(columns) < k:
+            # Sınıfın en küçük elemanının döndürme yörüngesi
+            orbit = []
+            column = min(rest)
+            while column not in orbit:
+                orbit.append(column)
+                column = ((column << 1) | (column >> (r - 1))) & full
+            if len(orbit) > k - len(columns):
+                break
+            for column in orbit:
+                take(column)
+            rest.difference_update(orbit)
+
+        # Kalan sütunlar: en az yüklü satırlara düşenler
+        while rest and len(columns) < k:
+            column = min(rest, key=lambda c: (sum(rows[i] for i in range(r) if c >> i & 1), c))
+            take(column)
+            rest.discard(column)
+        weight += 2
+    return columns
+
+
+class HsiaoTables(CodecTables):
+    """Hsiao (tek ağırlıklı sütunlu) SEC-DED kodunun tabloları
+
+    Kod kelimesi önce k veri biti, sonra r kontrol bitidir (kontrol biti i
+    pozisyon k + 1 + i). H matrisinde kontrol bitlerinin sütunları birim,
+    veri sütunları farklı tek ağırlıklı (>= 3) değerlerdir; r Hamming
+    düzenindeki parity sayısından bir fazladır, bu yüzden kod uzunluğu
+    aynıdır: (72,64), (39,32). Tek hatanın sendromu tek ağırlıklı, çift
+    hatanınki sıfır olmayan çift ağırlıklı olduğundan ayrı genel parity
+    biti ve kod çözmede ikinci popcount gerekmez.
+    """
+
+    family = HSIAO
+    secded_bit = False
+
+    def __init__(self, width):
+        check_width(width)
+        self.width = width  # Veri uzunluğu (k)
+        self.r = parity_bit_count(width) + 1  # Kontrol bit sayısı
+        self.n = width + self.r  # Toplam bit sayısı
+        self.length = self.n
+        r, length = self.r, self.length
+
+        # Kontrol bit pozisyonları (0-indexed) ve veri pozisyonları (1-indexed)
+        self.parity_positions = frozenset(range(width, length))
+        self.data_positions = tuple(range(1, width + 1))
+
+        # Pozisyon -> sendrom sütunu (1-indexed)
+        self.columns = (0,) + tuple(hsiao_columns(width, r)) + tuple(1 << i for i in range(r))
+
+        # Kontrol maskesi i: sütununun i. biti 1 olan tüm pozisyonlar
+        masks = [0] * r
+        for p in range(1, length + 1):
+            for i in range(r):
+                if self.columns[p] >> i & 1:
+                    masks[i] |= 1 << (length - p)
+        self.parity_masks = tuple(masks)
+        self.parity_bits = tuple(1 << (r - 1 - i) for i in range(r))
+
+        # Veri tek blok halinde kontrol bitlerinin üstünde durur
+        self.data_runs = ((0, (1 << width) - 1, r),)
+
+        # Sendrom -> düzeltme maskesi ve pozisyon (sütun olmayan sendromlar için 0)
+        table = [0] * (1 << r)
+        positions = [0] * (1 << r)
+        for p in range(1, length + 1):
+            table[self.columns[p]] = 1 << (length - p)
+            positions[self.columns[p]] = p
+        self.syndrome_table = tuple(table)
+        self.syndrome_positions = tuple(positions)
+
+    def classify(self, syndrome, overall_parity=0):
+        """Sendromdan hata sınıfını belirleme (genel parity kullanılmaz)"""
+        if syndrome == 0:
+            return CLEAN
+        if self.syndrome_positions[syndrome]:
+            return CORRECTED
+        # Çift ağırlıklı veya hiçbir sütuna uymayan tek ağırlıklı sendrom
+        return DOUBLE
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def get_tables(width, family=HAMMING):
+    """Genişlik ve kod ailesi başına önbelleğe alınmış kodlama tabloları"""
+    if family == HAMMING:
+        return CodecTables(width)
+    if family == HSIAO:
+        return HsiaoTables(width)
+    raise ValueError(f"Bilinmeyen kod ailesi: {family} ({', '.join(FAMILIES)})")
+
+
+class Codec:
+    """Belirli bir veri genişliği için Hamming SEC-DED kodlayıcı/çözücü
+
+    Kod kelimeleri tamsayı olarak paketlenir: pozisyon p (1-indexed) bit
+    ``length - p``'de durur, yani kelime kod dizisinin binary okunuşudur ve
+    SEC-DED biti en düşük bittir. Veri de aynı şekilde ilk bit en anlamlı
+    bit olacak şekilde tutulur. ``family`` kod ailesini (``HAMMING`` veya
+    ``HSIAO``) seçer.
+
+    ``USE_GENERATED`` açıkken ``encode_int``, ``syndrome_int``,
+    ``extract_int`` ve ``decode_int`` örnek üzerinde genişliğe özel
+    üretilmiş fonksiyonlarla değiştirilir; sınıftaki maskeli tanımlar
+    referans olarak kalır (``Codec.encode_int(codec, value)``).
+    """
+
+    def __init__(self, width, family=HAMMING):
+        tables = get_tables(width, family)
+        self.tables = tables
+        self.family = tables.family
+        self.secded_bit = tables.secded_bit
+        self.width = tables.width
+        self.r = tables.r
+        self.n = tables.n
+        self.length = tables.length
+        self.parity_positions = tables.parity_positions
+        self.parity_masks = tables.parity_masks
+        self.parity_bits = tables.parity_bits
+        self.data_runs = tables.data_runs
+        self.syndrome_table = tables.syndrome_table
+        self.syndrome_positions = tables.syndrome_positions
+        self.columns = tables.columns
+        self.classify = tables.classify
+
+        if USE_GENERATED:
+            generated = tables.generated
+            self.encode_int = generated["encode"]
+            self.syndrome_int = generated["syndrome"]
+            self.extract_int = generated["extract"]
+            self.decode_int = generated["decode"]
+        if telemetry.enabled:
+            telemetry.instrument(self)
+
+    @classmethod
+    def for_code_length(cls, length, family=HAMMING):
+        """Kod uzunluğundan (SEC-DED dahil) kodlayıcıyı bulma
+
+        Hsiao kodunda kontrol biti sayısı Hamming parity sayısından bir
+        fazla olduğundan aynı uzunluk aynı veri genişliğine karşılık gelir.
+        """
+        n = length - 1
+        r = 0
+        while (1 << r) < n + 1:
+            r += 1
+        k = n - r
+        if k < 1 or parity_bit_count(k) != r:
+            raise ValueError(f"Geçersiz kod uzunluğu: {length} bit")
+        return cls(k, family)
+
+    # Tamsayı API'si
+
+    def encode_int(self, value):
+        """Paketli veriden paketli SEC-DED kodu hesaplama"""
+        word = 0
+        for data_shift, mask, code_shift in self.data_runs:
+            word |= ((value >> data_shift) & mask) << code_shift
+
+        for mask, bit in zip(self.parity_masks, self.parity_bits):
+            if (word & mask).bit_count() & 1:
+                word |= bit
+
+        if self.secded_bit:
+            word |= word.bit_count() & 1
+        return word
+
+    def encode_sliced(self, value):
+        """Byte dilimli tablolarla paketli SEC-DED kodu hesaplama"""
+        tables = self.tables.slice_tables
+        word = 0
+        for table, byte in zip(tables, value.to_bytes(len(tables), "little")):
+            word ^= table[byte]
+        return word
+
+    def syndrome_int(self, word):
+        """Paketli koddan sendrom hesaplama"""
+        syndrome = 0
+        for i, mask in enumerate(self.parity_masks):
+            syndrome |= ((word & mask).bit_count() & 1) << i
+        return syndrome
+
+    def extract_int(self, word):
+        """Paketli koddan paketli veriyi çıkarma"""
+        value = 0
+        for data_shift, mask, code_shift in self.data_runs:
+            value |= ((word >> code_shift) & mask) << data_shift
+        return value
+
+    def decode_int(self, word):
+        """Paketli kodu çözme"""
+        syndrome = self.syndrome_int(word)
+        status = self.classify(syndrome, word.bit_count() & 1 if self.secded_bit else 0)
+
+        position = 0
+        if status == CORRECTED:
+            position = self.syndrome_positions[syndrome]
+            word ^= self.syndrome_table[syndrome]
+        elif status == SECDED_BIT:
+            position = self.length  # Genel parity biti son pozisyondadır (bit 0)
+            word ^= 1
+
+        return DecodeResult(self.extract_int(word), word, status, syndrome, position)
+
+    # Toplu (NumPy) API
+
+    def encode_batch(self, data):
+        """Veri dizisini toplu kodlama (NumPy gerektirir)"""
+        from .batch import encode_batch
+        return encode_batch(data, self)
+
+    def decode_batch(self, codewords):
+        """Kod dizisini toplu çözme ve düzeltme (NumPy gerektirir)"""
+        from .batch import decode_batch
+        return decode_batch(codewords, self)
+
+    # Liste API'si (tamsayı API'si üzerinde ince adaptör)
+
+    def encode(self, data):
+        """Hamming SEC-DED kodu hesaplama"""
+        if len(data) != self.width:
+            raise ValueError(f"{self.width} bitlik veri bekleniyordu (Mevcut: {len(data)} bit)")
+        return unpack(self.encode_int(pack(data)), self.length)
+
+    def syndrome(self, code):
+        """Sendrom hesaplama"""
+        self._check_length(code)
+        return self.syndrome_int(pack(code))
+
+    @staticmethod
+    def overall_parity(code):
+        """Genel parity hesaplama"""
+        return sum(code) & 1
+
+    def extract(self, code):
+        """Koddan orijinal veriyi çıkarma"""
+        self._check_length(code)
+        return format(self.extract_int(pack(code)), f"0{self.width}b")
+
+    def decode(self, code):
+        """Kodu çözme: sendrom, hata sınıfı ve tek bit düzeltmesi"""
+        self._check_length(code)
+        result = self.decode_int(pack(code))
+        return result._replace(
+            data=format(result.data, f"0{self.width}b"),
+            code=unpack(result.code, self.length),
+        )
+
+    def _check_length(self, code):
+        if len(code) != self.length:
+            raise ValueError(f"{self.length} bitlik kod bekleniyordu (Mevcut: {len(code)} bit)")
+
+
+class CodeState:
+    """Sendromu ve genel parity'si artımlı olarak tutulan kod kelimesi
+
+    Pozisyon p'deki bir bit çevrildiğinde sendroma p'nin sütunu (Hamming
+    düzeninde p'nin kendisi) XOR'lanır ve genel parity ters çevrilir;
+    böylece hata ekleme ve sınıflandırma kod uzunluğundan bağımsızdır.
+    Hsiao kodunda genel parity sınıflandırmada kullanılmaz.
+    """
+
+    def __init__(self, codec, word):
+        self.codec = codec
+        self.word = word
+        self.syndrome = codec.syndrome_int(word)
+        self.overall_parity = word.bit_count() & 1
+
+    def flip(self, position):
+        """``position``. biti (1-indexed) ters çevirme"""
+        codec = self.codec
+        if not 1 <= position <= codec.length:
+            raise ValueError(f"Pozisyon 1 ile {codec.length} arasında olmalı!")
+        self.word ^= 1 << (codec.length - position)
+        self.syndrome ^= codec.columns[position]
+        self.overall_parity ^= 1
+
+    @property
+    def status(self):
+        return self.codec.classify(self.syndrome, self.overall_parity)
+
+    def correct(self):
+        """Kodu mevcut sendromdan çözme ve tek bit hatasını (SEC-DED biti dahil) düzeltme"""
+        syndrome = self.syndrome
+        status = self.status
+        position = 0
+        if status == CORRECTED:
+            position = self.codec.syndrome_positions[syndrome]
+            self.flip(position)
+        elif status == SECDED_BIT:
+            position = self.codec.length  # Genel parity biti son pozisyondadır
+            self.flip(position)
+        if telemetry.enabled:
+            telemetry.METRICS.record_decode(status, syndrome)
+        return DecodeResult(self.codec.extract_int(self.word), self.word, status, syndrome, position)
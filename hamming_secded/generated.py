@@ -0,0 +1,177 @@
+"""Genişlik başına üretilen düz (döngüsüz) kodlayıcı/çözücü fonksiyonları
+
+Her genişlik ve kod ailesi için kaynak kod üretilir ve ``compile`` ile
+derlenir: maskeler ve kaydırmalar sabit olarak gömülür, her kontrol biti
+tek bir ``(value & MASK).bit_count() & 1`` terimidir. Kontrol bitleri
+doğrudan veri üzerinden hesaplanır (veri maskesi i: sütununun i. biti 1
+olan veri bitleri); SEC-DED biti de doğrusal olduğundan veri bitleri ile
+kontrol bitlerinin parity'si tek bir veri maskesine indirgenir. Kod
+çözme düz bir sendrom ifadesi ve tek tablo okumasıdır.
+
+CPython'da bit başına kaydırma-XOR zinciri, aynı bitleri kapsayan tek bir
+maskeli ``bit_count`` çağrısından yavaştır; bu yüzden açılım kontrol biti
+başına bir popcount terimi düzeyinde yapılır.
+
+``HAMMING_SECDED_CACHE`` ortam değişkeni bir dizin gösteriyorsa derlenen
+kod nesneleri ``marshal`` ile orada önbelleğe alınır; dosya adı Python
+sürüm etiketini ve tabloların özetini içerir, böylece farklı bir yerleşim
+eski kodu yüklemez. Değişken yoksa (varsayılan) veya önbelleğe
+yazılamazsa kod yalnızca bellekte derlenir.
+"""
+import hashlib
+import marshal
+import os
+import sys
+
+from .codec import CORRECTED, SECDED_BIT, DecodeResult
+
+GENERATOR_VERSION = 1  # Üretilen kaynağın biçimi değişince artırılır
+
+
+def cache_dir():
+    """Derlenmiş kod önbelleğinin dizini (önbellek kapalıysa None)"""
+    return os.environ.get("HAMMING_SECDED_CACHE") or None
+
+
+def data_masks(tables):
+    """Her kontrol biti için veri maskesi (veri bit indeksi ``width - 1 - c``)"""
+    width = tables.width
+    masks = [0] * tables.r
+    for c, pos in enumerate(tables.data_positions):
+        column = tables.columns[pos]
+        for i in range(tables.r):
+            if column >> i & 1:
+                masks[i] |= 1 << (width - 1 - c)
+    return masks
+
+
+def _parity(expr, mask):
+    return f"(({expr} & {mask:#x}).bit_count() & 1)"
+
+
+def _shifted(term, shift):
+    if shift > 0:
+        return f"{term} << {shift}"
+    if shift < 0:
+        return f"{term} >> {-shift}"
+    return term
+
+
+def _runs(source, runs, reverse):
+    """Veri bloklarını yerleştiren (veya geri çıkaran) terimler"""
+    terms = []
+    for data_shift, mask, code_shift in runs:
+        if reverse:
+            terms.append(_shifted(f"({source} >> {code_shift} & {mask:#x})", data_shift))
+        else:
+            terms.append(_shifted(f"({source} >> {data_shift} & {mask:#x})", code_shift))
+    return terms
+
+
+def generate_source(tables):
+    """``encode``, ``syndrome``, ``extract`` ve ``decode`` fonksiyonlarının kaynağı"""
+    masks = data_masks(tables)
+
+    # Kodlama: veri yerleşimi + veri üzerinden kontrol bitleri (+ SEC-DED)
+    encode = _runs("value", tables.data_runs, reverse=False)
+    for mask, bit in zip(masks, tables.parity_bits):
+        if mask:
+            encode.append(_shifted(_parity("value", mask), bit.bit_length() - 1))
+    if tables.secded_bit:
+        overall = (1 << tables.width) - 1
+        for mask in masks:
+            overall ^= mask
+        encode.append(_parity("value", overall))
+
+    syndrome = [_shifted(_parity("word", mask), i) for i, mask in enumerate(tables.parity_masks)]
+    extract = _runs("word", tables.data_runs, reverse=True)
+    index = f"syndrome | (word.bit_count() & 1) << {tables.r}" if tables.secded_bit else "syndrome"
+
+    def body(terms):
+        return "\n        | ".join(terms) or "0"
+
+    return f'''\
+# {tables.family} SEC-DED, {tables.width} bit veri, {tables.length} bit kod (üretilmiş kod)
+
+def encode(value):
+    return (
+        {body(encode)}
+    )
+
+
+def syndrome(word):
+    return (
+        {body(syndrome)}
+    )
+
+
+def extract(word):
+    return (
+        {body(extract)}
+    )
+
+
+def decode(word):
+    syndrome = (
+        {body(syndrome)}
+    )
+    status, flip, position = DECODE_TABLE[{index}]
+    word ^= flip
+    return DecodeResult(
+        {body(extract)},
+        word, status, syndrome, position,
+    )
+'''
+
+
+def decode_table(tables):
+    """Tablo indeksinden (durum, düzeltme maskesi, pozisyon)"""
+    r = tables.r
+    size = 1 << (r + 1) if tables.secded_bit else 1 << r
+    entries = []
+    for index in range(size):
+        syndrome = index & ((1 << r) - 1)
+        status = tables.classify(syndrome, index >> r)
+        if status == CORRECTED:
+            entries.append((status, tables.syndrome_table[syndrome], tables.syndrome_positions[syndrome]))
+        elif status == SECDED_BIT:
+            entries.append((status, 1, tables.length))
+        else:
+            entries.append((status, 0, 0))
+    return tuple(entries)
+
+
+def _cache_path(tables):
+    layout = repr((tables.parity_masks, tables.parity_bits, tables.data_runs, tables.secded_bit))
+    digest = hashlib.sha1(layout.encode()).hexdigest()[:16]
+    name = f"{tables.family}-{tables.width}-v{GENERATOR_VERSION}-{digest}.{sys.implementation.cache_tag}.bin"
+    directory = cache_dir()
+    return os.path.join(directory, name) if directory is not None else None
+
+
+def compile_tables(tables, use_cache=True):
+    """Üretilen fonksiyonların isim alanı (``encode``, ``syndrome``, ``extract``, ``decode``)"""
+    code = None
+    path = _cache_path(tables) if use_cache and sys.implementation.cache_tag else None
+    if path is not None:
+        try:
+            with open(path, "rb") as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            code = None
+
+    if code is None:
+        code = compile(generate_source(tables), f"<hamming_secded {tables.family} {tables.width}>", "exec")
+        if path is not None:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp = f"{path}.{os.getpid()}.tmp"
+                with open(temp, "wb") as f:
+                    marshal.dump(code, f)
+                os.replace(temp, path)
+            except OSError:
+                pass
+
+    namespace = {"DecodeResult": DecodeResult, "DECODE_TABLE": decode_table(tables)}
+    exec(code, namespace)
+    return namespace
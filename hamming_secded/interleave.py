@@ -0,0 +1,150 @@
+"""Kod kelimeleri arası serpiştirme (interleaving)
+
+Komşu bellek hücrelerindeki çok bitlik patlama hataları tek bir kelimede
+çift hata olarak görünür ve düzeltilemez. Serpiştirmede ``depth`` (D)
+kod kelimesi bir çerçeve oluşturur ve bitleri fiziksel olarak sırayla
+dağıtılır: çerçevenin k. biti (en anlamlı bitten, 0'dan) ``k % D``.
+kelimenin ``k // D + 1``. pozisyonudur. Böylece D bitten kısa bir
+patlama her kelimede en fazla bir biti bozar ve kelime başına kod çözme
+(``Codec.decode_int``, GUI'deki ``correct_errors`` ile aynı karar) onu
+düzeltir.
+
+Çerçeve ``D * length`` bit tutar ve ``frame_size`` byte'a (sonu sıfırla
+tamamlanarak) yazılır. ``interleave``/``deinterleave`` tek çerçeveyi
+tamsayılarla, ``interleave_bytes``/``deinterleave_bytes`` ise art arda
+big-endian kayıtlardan (``MemoryBank`` yerleşimi) oluşan bütün bir
+tamponu işler; NumPy varsa tampon tek seferde bit matrisi olarak devrik
+alınır.
+"""
+
+MAX_DEPTH = 65528  # En büyük derinlik (.ecc başlığındaki 16 bitlik alana sığan 8'in en büyük katı)
+
+
+def frame_size(length, depth):
+    """``depth`` adet ``length`` bitlik kelimenin çerçevesi (byte)"""
+    return (length * depth + 7) // 8
+
+
+def check_depth(depth):
+    if not 1 <= depth <= MAX_DEPTH:
+        raise ValueError(f"Serpiştirme derinliği 1 ile {MAX_DEPTH} arasında olmalı (Mevcut: {depth})")
+
+
+def interleave(words, length):
+    """Kod kelimelerini tek bir çerçeve tamsayısına serpiştirme (``len(words) * length`` bit)"""
+    columns = [format(word, f"0{length}b") for word in words]
+    return int("".join(map("".join, zip(*columns))) or "0", 2)
+
+
+def deinterleave(frame, length, depth):
+    """Çerçeve tamsayısından ``depth`` kod kelimesini geri çıkarma"""
+    bits = format(frame, f"0{length * depth}b")
+    return [int(bits[i::depth], 2) for i in range(depth)]
+
+
+def cell(offset, depth):
+    """Çerçevedeki fiziksel bit (0'dan) -> (çerçeve içi kelime, pozisyon 1-indexed)"""
+    return offset % depth, offset // depth + 1
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def interleave_rows(rows, length, depth):
+    """(N, kayıt byte) big-endian kod satırları -> (N / depth, çerçeve byte) (NumPy)
+
+    N ``depth``'in katı olmalıdır.
+    """
+    import numpy as np
+    pad = rows.shape[1] * 8 - length
+    bits = np.unpackbits(rows, axis=1)[:, pad:]
+    bits = bits.reshape(-1, depth, length).transpose(0, 2, 1).reshape(-1, length * depth)
+    return np.packbits(bits, axis=1)
+
+
+def deinterleave_rows(frames, length, depth):
+    """(F, çerçeve byte) -> (F * depth, kayıt byte) big-endian kod satırları (NumPy)"""
+    import numpy as np
+    size = (length + 7) // 8
+    bits = np.unpackbits(frames, axis=1)[:, :length * depth]
+    bits = bits.reshape(-1, length, depth).transpose(0, 2, 1).reshape(-1, length)
+    padded = np.zeros((bits.shape[0], size * 8), dtype=np.uint8)
+    padded[:, size * 8 - length:] = bits
+    return np.packbits(padded, axis=1)
+
+
+def interleave_bytes(raw, length, depth):
+    """Art arda kayıtlardan oluşan tamponu çerçevelere serpiştirme
+
+    Kayıt sayısı ``depth``'in katı değilse son çerçeve sıfır kelimelerle
+    tamamlanır.
+    """
+    check_depth(depth)
+    size = (length + 7) // 8
+    count = len(raw) // size
+    missing = -count % depth
+    raw = bytes(raw) + bytes(missing * size)
+    np = _numpy()
+    if np is not None:
+        rows = np.frombuffer(raw, dtype=np.uint8).reshape(-1, size)
+        return interleave_rows(rows, length, depth).tobytes()
+
+    fsize = frame_size(length, depth)
+    pad = fsize * 8 - length * depth
+    out = bytearray()
+    for start in range(0, len(raw), size * depth):
+        words = [int.from_bytes(raw[i:i + size], "big") for i in range(start, start + size * depth, size)]
+        out += (interleave(words, length) << pad).to_bytes(fsize, "big")
+    return bytes(out)
+
+
+def deinterleave_bytes(raw, length, depth):
+    """Çerçeve tamponunu art arda big-endian kayıtlara geri çevirme"""
+    check_depth(depth)
+    fsize = frame_size(length, depth)
+    if len(raw) % fsize:
+        raise ValueError(f"Tampon {fsize} byte'lık çerçevelerin katı değil ({len(raw)} byte)")
+    np = _numpy()
+    if np is not None:
+        frames = np.frombuffer(bytes(raw), dtype=np.uint8).reshape(-1, fsize)
+        return deinterleave_rows(frames, length, depth).tobytes()
+
+    size = (length + 7) // 8
+    pad = fsize * 8 - length * depth
+    out = bytearray()
+    for start in range(0, len(raw), fsize):
+        frame = int.from_bytes(raw[start:start + fsize], "big") >> pad
+        for word in deinterleave(frame, length, depth):
+            out += word.to_bytes(size, "big")
+    return bytes(out)
+
+
+class Interleaver:
+    """Kodlayıcı üzerinde serpiştirme katmanı
+
+    Çerçeve başına ``depth`` veri kelimesini kodlayıp serpiştirir; kod
+    çözme çerçeveyi ayırıp her kelimeyi ayrı ayrı ``decode_int`` ile çözer
+    (sonuçlar ``DecodeResult`` listesidir).
+    """
+
+    def __init__(self, codec, depth):
+        check_depth(depth)
+        self.codec = codec
+        self.depth = depth
+        self.length = codec.length
+        self.frame_size = frame_size(codec.length, depth)
+
+    def encode(self, values):
+        """``depth`` veri kelimesini çerçeve tamsayısına kodlama"""
+        if len(values) != self.depth:
+            raise ValueError(f"Çerçevede {self.depth} kelime olmalı (Mevcut: {len(values)})")
+        return interleave([self.codec.encode_int(value) for value in values], self.length)
+
+    def decode(self, frame):
+        """Çerçeveyi kelime başına çözme"""
+        return [self.codec.decode_int(word) for word in deinterleave(frame, self.length, self.depth)]
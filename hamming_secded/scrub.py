@@ -0,0 +1,101 @@
+"""Bellek bankasının arka planda taranması (scrubbing)
+
+Tarayıcı bankayı ``CHUNK`` kayıtlık parçalar halinde baştan sona dolaşır;
+her parça ``MemoryBank.scrub`` ile kilit altında çözülür, tek bit hataları
+yerinde düzeltilir ve düzeltilemeyen kayıtlar raporlanır. Parçalar
+arasında kilit bırakılır, böylece arayüz taramayı beklemeden yazabilir.
+
+Hız iki şekilde sınırlanabilir:
+
+- ``rate``: saniyede en fazla bu kadar kelime
+- ``cpu_share``: (0, 1] arası; her parçadan sonra parçanın süresinin
+  ``(1 - cpu_share) / cpu_share`` katı kadar uyunur
+
+Modül Qt'ye bağlı değildir; GUI bunu bir ``QThread`` içinde çalıştırır.
+"""
+import threading
+import time
+from typing import NamedTuple
+
+CHUNK = 4096  # Bir kilit alımında taranan en fazla kayıt
+DEFAULT_CPU_SHARE = 0.25  # Hız verilmezse kullanılan CPU payı
+
+
+class ScrubProgress(NamedTuple):
+    """Bir parçanın tarama sonucu"""
+    start: int  # Parçanın ilk kaydı
+    stop: int  # Parçanın son kaydından sonraki indeks
+    total: int  # Geçişin başındaki kayıt sayısı
+    corrected: list  # Düzeltilen kayıt indeksleri
+    uncorrectable: list  # Düzeltilemeyen kayıt indeksleri
+
+
+class Throttle:
+    """Kelime/sn veya CPU payı sınırını uyku süresine çevirme"""
+
+    def __init__(self, rate=None, cpu_share=None):
+        if rate is not None and rate <= 0:
+            raise ValueError(f"Tarama hızı pozitif olmalı (Mevcut: {rate})")
+        if cpu_share is not None and not 0 < cpu_share <= 1:
+            raise ValueError(f"CPU payı 0 ile 1 arasında olmalı (Mevcut: {cpu_share})")
+        if rate is None and cpu_share is None:
+            cpu_share = DEFAULT_CPU_SHARE
+        self.rate = rate
+        self.cpu_share = cpu_share
+
+    def chunk_size(self):
+        """Bir adımda taranacak kayıt sayısı (düşük hızlarda küçük parçalar)"""
+        if self.rate is None:
+            return CHUNK
+        return max(1, min(CHUNK, int(self.rate // 10)))
+
+    def delay(self, words, elapsed):
+        """``words`` kayıt ``elapsed`` saniyede tarandıktan sonra uyunacak süre"""
+        if self.rate is not None:
+            return max(0.0, words / self.rate - elapsed)
+        return elapsed * (1 - self.cpu_share) / self.cpu_share
+
+
+class Scrubber:
+    """Bankayı sınırlı hızla tarayan döngü
+
+    ``run`` çağıran iş parçacığında çalışır ve ``stop`` çağrılana kadar (veya
+    ``passes`` geçiş tamamlanana kadar) geçiş yapar; her parçadan sonra
+    ``callback(ScrubProgress)`` çağrılır.
+    """
+
+    def __init__(self, bank, rate=None, cpu_share=None):
+        self.bank = bank
+        self.throttle = Throttle(rate, cpu_share)
+        self.stopped = threading.Event()
+        self.passes = 0  # Tamamlanan geçiş sayısı
+
+    def stop(self):
+        """Taramayı durdurma (bekleyen uyku hemen kesilir)"""
+        self.stopped.set()
+
+    def scrub_pass(self, callback=None):
+        """Bankayı bir kez baştan sona tarama; durdurulmadan biterse True"""
+        total = len(self.bank)
+        start = 0
+        while start < total and not self.stopped.is_set():
+            stop = min(start + self.throttle.chunk_size(), total)
+            began = time.perf_counter()
+            corrected, uncorrectable = self.bank.scrub(start, stop)
+            elapsed = time.perf_counter() - began
+            if callback is not None:
+                callback(ScrubProgress(start, stop, total, corrected, uncorrectable))
+            self.stopped.wait(self.throttle.delay(stop - start, elapsed))
+            start = stop
+        if self.stopped.is_set():
+            return False
+        self.passes += 1
+        return True
+
+    def run(self, callback=None, passes=None, idle=1.0):
+        """Geçişleri ``stop`` çağrılana kadar tekrarlama; boş bankada ``idle`` sn beklenir"""
+        while not self.stopped.is_set() and (passes is None or self.passes < passes):
+            if not len(self.bank):
+                self.stopped.wait(idle)
+                continue
+            self.scrub_pass(callback)
@@ -0,0 +1,334 @@
+"""asyncio üzerinde ECC kodlama/çözme servisi (NumPy gerektirir)
+
+TCP veya Unix soketi üzerinden uzunluk önekli ikili protokol::
+
+    istek:  >IBBHI  gövde uzunluğu, işlem, kod ailesi, genişlik, istek no
+            gövde   kelimeler art arda, her biri big-endian sabit boyutlu
+    yanıt:  >IBBHI  gövde uzunluğu, durum, işlem, 0, istek no
+            gövde   sonuç (durum ERROR ise UTF-8 hata mesajı)
+
+İşlemler (N kelime):
+
+- ``ENCODE``: N veri kelimesi (``ceil(width / 8)`` byte) -> N kod kelimesi
+  (``ceil(length / 8)`` byte)
+- ``DECODE``: N kod kelimesi -> N veri kelimesi + N durum byte'ı
+- ``SCRUB``: N kod kelimesi -> N düzeltilmiş kod kelimesi + N durum byte'ı
+
+Kod ailesi ``FAMILIES`` içindeki sırasıdır. Aynı işlem, aile ve genişlik
+için ``window`` saniye içinde gelen istekler (farklı bağlantılardan da
+olsa) tek bir vektörel çağrıda işlenir: kod 64 bite sığıyorsa
+``encode_batch``/``decode_batch``, daha geniş kodlamada bit dilimli
+kodlayıcı, daha geniş kod çözmede üretilmiş ``decode_int``. Her bağlantıda
+en fazla ``max_inflight`` istek bekleyebilir; sınır dolunca soketten
+okuma durur ve TCP akış denetimi istemciyi yavaşlatır. Yanıtlar
+tamamlanma sırasıyla, istek numarasıyla yazılır.
+"""
+import asyncio
+import logging
+import struct
+
+import numpy as np
+
+from .batch import MAX_CODE_LENGTH, rows_to_words, words_to_rows
+from .bitslice import encode_bitsliced_array
+from .codec import Codec, FAMILIES, HAMMING
+
+REQUEST = struct.Struct(">IBBHI")  # gövde uzunluğu, işlem, kod ailesi, genişlik, istek no
+RESPONSE = struct.Struct(">IBBHI")  # gövde uzunluğu, durum, işlem, 0, istek no
+
+# İşlemler
+ENCODE = 1
+DECODE = 2
+SCRUB = 3
+OPERATIONS = {ENCODE: "encode", DECODE: "decode", SCRUB: "scrub"}
+
+# Yanıt durumları
+OK = 0
+ERROR = 1
+
+BATCH_WINDOW = 0.001  # İsteklerin toplandığı süre (saniye)
+MAX_BATCH_WORDS = 1 << 16  # Bu kadar kelime birikince pencere beklenmez
+MAX_INFLIGHT = 32  # Bağlantı başına bekleyen en fazla istek
+MAX_BODY = 1 << 24  # Bir isteğin en büyük gövdesi (byte)
+DEFAULT_PORT = 7878
+
+log = logging.getLogger(__name__)
+
+
+class ServiceError(Exception):
+    """Servisin hata yanıtı"""
+
+
+def word_sizes(codec):
+    """(veri kelimesi, kod kelimesi) byte boyutları"""
+    return (codec.width + 7) // 8, (codec.length + 7) // 8
+
+
+def to_rows(raw, size, bits):
+    """Byte dizisini (N, size) uint8 satırlarına ayırma; fazla bitleri reddetme"""
+    if len(raw) % size:
+        raise ValueError(f"Gövde {size} byte'lık kelimelerin katı değil ({len(raw)} byte)")
+    rows = np.frombuffer(raw, dtype=np.uint8).reshape(-1, size)
+    if bits % 8 and rows.size and (rows[:, 0] >> (bits % 8)).any():
+        raise ValueError(f"Kelime {bits} bitten uzun")
+    return rows
+
+
+def process(op, codec, raw):
+    """Birleştirilmiş gövdeyi işleme: (kelime başına sonuç satırları, durumlar veya None)"""
+    data_size, code_size = word_sizes(codec)
+    if op == ENCODE:
+        rows = to_rows(raw, data_size, codec.width)
+        if codec.length <= MAX_CODE_LENGTH:
+            return words_to_rows(codec.encode_batch(rows_to_words(rows)), code_size), None
+        return encode_bitsliced_array(rows, codec), None
+
+    rows = to_rows(raw, code_size, codec.length)
+    if codec.length <= MAX_CODE_LENGTH:
+        result = codec.decode_batch(rows_to_words(rows))
+        if op == DECODE:
+            return words_to_rows(result.data, data_size), result.status
+        return words_to_rows(result.code, code_size), result.status
+
+    # Geniş kodlar: kelime başına üretilmiş kod çözücü
+    out_size = data_size if op == DECODE else code_size
+    out = bytearray()
+    status = np.empty(rows.shape[0], dtype=np.uint8)
+    for i in range(rows.shape[0]):
+        result = codec.decode_int(int.from_bytes(raw[i * code_size:(i + 1) * code_size], "big"))
+        out += (result.data if op == DECODE else result.code).to_bytes(out_size, "big")
+        status[i] = result.status
+    return np.frombuffer(bytes(out), dtype=np.uint8).reshape(-1, out_size), status
+
+
+class Batcher:
+    """Aynı (işlem, aile, genişlik) isteklerini kısa bir pencerede toplama"""
+
+    def __init__(self, window=BATCH_WINDOW, max_words=MAX_BATCH_WORDS):
+        self.window = window
+        self.max_words = max_words
+        self.pending = {}  # anahtar -> [(gövde, future), ...]
+        self.words = {}  # anahtar -> bekleyen kelime sayısı
+        self.timers = {}  # anahtar -> pencere sonu zamanlayıcısı
+        self.batches = 0  # İşlenen toplu çağrı sayısı
+
+    def submit(self, op, codec, body):
+        """İsteği kuyruğa alma; yanıt gövdesini veren future döndürür
+
+        Gövde burada doğrulanır, böylece hatalı bir istek toplu çağrıyı
+        bozmaz (``ValueError`` doğrudan çağırana yükselir).
+        """
+        size = word_sizes(codec)[op != ENCODE]
+        to_rows(body, size, codec.width if op == ENCODE else codec.length)
+
+        loop = asyncio.get_running_loop()
+        key = (op, codec.family, codec.width)
+        future = loop.create_future()
+        if key not in self.pending:
+            self.pending[key] = []
+            self.words[key] = 0
+            self.timers[key] = loop.call_later(self.window, self.flush, key, codec)
+        self.pending[key].append((body, future))
+        self.words[key] += len(body) // size
+        if self.words[key] >= self.max_words:
+            self.flush(key, codec)
+        return future
+
+    def flush(self, key, codec):
+        # Erken boşaltılan toplunun zamanlayıcısı sonraki toplunun penceresini kısaltmasın
+        timer = self.timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self.pending.pop(key, None)
+        self.words.pop(key, None)
+        if items:
+            asyncio.ensure_future(self.run(key[0], codec, items))
+
+    async def run(self, op, codec, items):
+        loop = asyncio.get_running_loop()
+        raw = b"".join(body for body, _ in items)
+        self.batches += 1
+        try:
+            rows, status = await loop.run_in_executor(None, process, op, codec, raw)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        size = word_sizes(codec)[op != ENCODE]
+        start = 0
+        for body, future in items:
+            stop = start + len(body) // size
+            reply = rows[start:stop].tobytes()
+            if status is not None:
+                reply += status[start:stop].tobytes()
+            if not future.done():
+                future.set_result(reply)
+            start = stop
+
+
+class EccServer:
+    """Bağlantıları karşılayan servis; istekleri ortak bir ``Batcher``'a verir"""
+
+    def __init__(self, window=BATCH_WINDOW, max_inflight=MAX_INFLIGHT):
+        self.batcher = Batcher(window)
+        self.max_inflight = max_inflight
+        self.requests = 0
+
+    async def handle(self, reader, writer):
+        """Tek bağlantının istek döngüsü"""
+        inflight = asyncio.Semaphore(self.max_inflight)
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(REQUEST.size)
+                except asyncio.IncompleteReadError:
+                    break
+                size, op, family, width, request_id = REQUEST.unpack(header)
+                if size > MAX_BODY:
+                    await self.reply(writer, write_lock, ERROR, op, request_id,
+                                     f"Gövde çok büyük: {size} byte (en fazla {MAX_BODY})".encode())
+                    break
+                body = await reader.readexactly(size)
+
+                # Geri basınç: sınır doluyken yeni istek okunmaz
+                await inflight.acquire()
+                task = asyncio.create_task(self.respond(writer, write_lock, op, family, width, request_id, body))
+                tasks.add(task)
+                task.add_done_callback(lambda t: (tasks.discard(t), inflight.release()))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # Servis kapanıyor: bekleyen istekler iptal edilir, bağlantı sessizce kapanır
+            for task in tasks:
+                task.cancel()
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def respond(self, writer, write_lock, op, family, width, request_id, body):
+        self.requests += 1
+        try:
+            if op not in OPERATIONS:
+                raise ValueError(f"Bilinmeyen işlem: {op}")
+            if family >= len(FAMILIES):
+                raise ValueError(f"Bilinmeyen kod ailesi: {family}")
+            codec = Codec(width, FAMILIES[family])
+            reply = await self.batcher.submit(op, codec, body)
+            status = OK
+        except ValueError as e:
+            status, reply = ERROR, str(e).encode()
+        except Exception as e:
+            # Beklenmeyen hata da istemciye yanıtlanır; aksi halde istemci yanıtı sonsuza dek bekler
+            log.exception("İstek %d işlenemedi (işlem %d)", request_id, op)
+            status, reply = ERROR, f"Sunucu hatası: {type(e).__name__}: {e}".encode()
+        await self.reply(writer, write_lock, status, op, request_id, reply)
+
+    @staticmethod
+    async def reply(writer, write_lock, status, op, request_id, body):
+        async with write_lock:
+            writer.write(RESPONSE.pack(len(body), status, op, 0, request_id) + body)
+            await writer.drain()
+
+
+async def start_server(host=None, port=DEFAULT_PORT, path=None, window=BATCH_WINDOW, max_inflight=MAX_INFLIGHT):
+    """Servisi başlatma; ``path`` verilirse Unix soketi, aksi halde TCP
+
+    ``asyncio.Server`` nesnesini döndürür (``port=0`` ile rastgele port).
+    """
+    service = EccServer(window, max_inflight)
+    if path is not None:
+        server = await asyncio.start_unix_server(service.handle, path)
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+    server.service = service
+    return server
+
+
+class Client:
+    """Servis istemcisi (aynı bağlantı üzerinde eşzamanlı istekler)"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.waiting = {}  # istek no -> future
+        self.receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=DEFAULT_PORT):
+        return cls(*await asyncio.open_connection(host, port))
+
+    @classmethod
+    async def connect_unix(cls, path):
+        return cls(*await asyncio.open_unix_connection(path))
+
+    async def _receive(self):
+        try:
+            while True:
+                size, status, _, _, request_id = RESPONSE.unpack(await self.reader.readexactly(RESPONSE.size))
+                body = await self.reader.readexactly(size)
+                future = self.waiting.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if status == OK:
+                    future.set_result(body)
+                else:
+                    future.set_exception(ServiceError(body.decode(errors="replace")))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Bağlantı kapandı: {e}"))
+            self.waiting.clear()
+
+    async def request(self, op, width, body, family=HAMMING):
+        """Ham istek; yanıt gövdesini döndürür (hata yanıtında ``ServiceError``)"""
+        request_id = self.next_id
+        self.next_id = (self.next_id + 1) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request_id] = future
+        self.writer.write(REQUEST.pack(len(body), op, FAMILIES.index(family), width, request_id) + body)
+        await self.writer.drain()
+        return await future
+
+    async def encode(self, values, width, family=HAMMING):
+        """Paketli veri kelimelerini kodlama"""
+        codec = Codec(width, family)
+        data_size, code_size = word_sizes(codec)
+        body = b"".join(value.to_bytes(data_size, "big") for value in values)
+        reply = await self.request(ENCODE, width, body, family)
+        return [int.from_bytes(reply[i:i + code_size], "big") for i in range(0, len(reply), code_size)]
+
+    async def _decode(self, op, words, width, family):
+        codec = Codec(width, family)
+        data_size, code_size = word_sizes(codec)
+        body = b"".join(word.to_bytes(code_size, "big") for word in words)
+        reply = await self.request(op, width, body, family)
+        size = data_size if op == DECODE else code_size
+        count = len(reply) // (size + 1)
+        values = [int.from_bytes(reply[i * size:(i + 1) * size], "big") for i in range(count)]
+        return values, list(reply[count * size:])
+
+    async def decode(self, words, width, family=HAMMING):
+        """Kod kelimelerini çözme: (veri listesi, durum listesi)"""
+        return await self._decode(DECODE, words, width, family)
+
+    async def scrub(self, words, width, family=HAMMING):
+        """Kod kelimelerini düzeltme: (düzeltilmiş kod listesi, durum listesi)"""
+        return await self._decode(SCRUB, words, width, family)
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        self.receiver.cancel()
@@ -0,0 +1,213 @@
+"""Sayaçlar, histogramlar ve anlık görüntü dışa aktarımı
+
+Toplama varsayılan olarak kapalıdır (``HAMMING_SECDED_TELEMETRY=1`` veya
+``enable()`` ile açılır). Kapalıyken sıcak yollara hiçbir şey eklenmez:
+``Codec`` örnekleri yalnızca toplama açıkken oluşturulursa ölçümlü
+fonksiyonlarla sarılır (``instrument``), toplu çağrılar ve tarama ise
+çağrı başına tek bir ``telemetry.enabled`` kontrolü yapar.
+
+Toplanan değerler:
+
+- ``encodes_total``: kodlanan kelime
+- ``decodes_total{status}``: çözülen kelime, duruma göre (düzeltilen ve
+  düzeltilemeyen sayıları buradan okunur)
+- ``syndromes``: sıfır olmayan sendrom değerlerinin dağılımı
+- ``op_seconds{op}``: işlem başına gecikme histogramı (tekil işlemlerde
+  kelime, toplu işlemlerde çağrı başına)
+- ``campaign_trials_total{outcome}``: kampanya deneme sonuçları
+
+``snapshot`` JSON'a çevrilebilen bir sözlük, ``prometheus`` Prometheus
+metin biçimi döndürür.
+"""
+import bisect
+import os
+import threading
+import time
+
+PREFIX = "hamming_secded"
+# Gecikme kovaları (sn): 100 ns'den 10 sn'ye, onluk başına üç kova
+LATENCY_BUCKETS = tuple(m * 10.0 ** e for e in range(-7, 1) for m in (1, 2.5, 5)) + (10.0,)
+
+enabled = os.environ.get("HAMMING_SECDED_TELEMETRY", "") not in ("", "0")
+
+
+class Histogram:
+    """Sabit kovalı histogram (Prometheus ``le`` kovaları gibi)"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Son kova: +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """(üst sınır, birikimli sayı) listesi; son sınır ``inf``"""
+        total = 0
+        out = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            out.append((bound, total))
+        return out
+
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+
+class Metrics:
+    """İş parçacığı güvenli sayaç ve histogram deposu"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Bütün değerleri sıfırlama"""
+        with self.lock:
+            self.counters = {}  # (ad, ((etiket, değer), ...)) -> sayı
+            self.latency = {}  # işlem -> Histogram
+            self.syndromes = {}  # sendrom -> sayı
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, op, seconds):
+        with self.lock:
+            histogram = self.latency.get(op)
+            if histogram is None:
+                histogram = self.latency[op] = Histogram()
+            histogram.observe(seconds)
+
+    def counter(self, name, **labels):
+        """Sayacın değeri (etiket verilmezse bütün etiketlerin toplamı)"""
+        with self.lock:
+            items = list(self.counters.items())
+        wanted = set(labels.items())
+        return sum(value for (key, key_labels), value in items if key == name and wanted <= set(key_labels))
+
+    def mean_latency(self, op):
+        """İşlemin ortalama gecikmesi (sn), gözlem yoksa 0"""
+        with self.lock:
+            histogram = self.latency.get(op)
+            return histogram.mean() if histogram is not None else 0.0
+
+    def record_decode(self, status, syndrome):
+        """Tek bir kod çözme sonucunu sayma"""
+        from .codec import STATUS_NAMES
+        self.inc("decodes_total", status=STATUS_NAMES[status])
+        if syndrome:
+            with self.lock:
+                self.syndromes[syndrome] = self.syndromes.get(syndrome, 0) + 1
+
+    def record_decodes(self, status_counts, syndrome_counts):
+        """Toplu kod çözme sonuçlarını sayma (durum ve sendrom başına sayı dizileri)"""
+        from .codec import STATUS_NAMES
+        for status, count in enumerate(status_counts):
+            if count:
+                self.inc("decodes_total", int(count), status=STATUS_NAMES[status])
+        self.add_syndromes(syndrome_counts)
+
+    def add_syndromes(self, syndrome_counts):
+        """Sendrom başına sayı dizisini dağılıma ekleme (sendrom 0 sayılmaz)"""
+        with self.lock:
+            for syndrome, count in enumerate(syndrome_counts):
+                if syndrome and count:
+                    self.syndromes[syndrome] = self.syndromes.get(syndrome, 0) + int(count)
+
+    def snapshot(self):
+        """JSON'a çevrilebilen anlık görüntü"""
+        with self.lock:
+            counters = [{"name": name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self.counters.items())]
+            latency = {op: {"count": h.count, "sum": h.sum,
+                            "buckets": [[bound if bound != float("inf") else "+Inf", count]
+                                        for bound, count in h.cumulative()]}
+                       for op, h in sorted(self.latency.items())}
+            syndromes = {str(s): n for s, n in sorted(self.syndromes.items())}
+        return {"timestamp": time.time(), "counters": counters, "op_seconds": latency, "syndromes": syndromes}
+
+    def prometheus(self):
+        """Prometheus metin biçimi"""
+        snapshot = self.snapshot()
+        lines = []
+        seen = set()
+        for counter in snapshot["counters"]:
+            name = f"{PREFIX}_{counter['name']}"
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_labels(counter['labels'])} {counter['value']}")
+
+        name = f"{PREFIX}_syndrome_total"
+        lines.append(f"# TYPE {name} counter")
+        for syndrome, count in snapshot["syndromes"].items():
+            lines.append(f'{name}{{syndrome="{syndrome}"}} {count}')
+
+        name = f"{PREFIX}_op_seconds"
+        lines.append(f"# TYPE {name} histogram")
+        for op, histogram in snapshot["op_seconds"].items():
+            for bound, count in histogram["buckets"]:
+                lines.append(f"{name}_bucket{_labels({'op': op, 'le': bound})} {count}")
+            lines.append(f"{name}_sum{_labels({'op': op})} {histogram['sum']}")
+            lines.append(f"{name}_count{_labels({'op': op})} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+METRICS = Metrics()
+
+
+def enable(flag=True):
+    """Toplamayı açma/kapatma (sonradan oluşturulan ``Codec`` örneklerini etkiler)"""
+    global enabled
+    enabled = flag
+
+
+def instrument(codec):
+    """``Codec`` örneğinin kodlama ve kod çözme fonksiyonlarını ölçümlü sürümlerle sarma"""
+    clock = time.perf_counter
+    metrics = METRICS
+
+    def wrap_encode(encode):
+        def encode_instrumented(value):
+            began = clock()
+            word = encode(value)
+            metrics.observe("encode", clock() - began)
+            metrics.inc("encodes_total")
+            return word
+        return encode_instrumented
+
+    decode = codec.decode_int
+
+    def decode_int(word):
+        began = clock()
+        result = decode(word)
+        metrics.observe("decode", clock() - began)
+        metrics.record_decode(result.status, result.syndrome)
+        return result
+
+    codec.encode_int = wrap_encode(codec.encode_int)
+    codec.encode_sliced = wrap_encode(codec.encode_sliced)
+    codec.decode_int = decode_int
+
+
+def write_snapshot(path):
+    """Anlık görüntüyü dosyaya yazma (``.prom``/``.txt``: Prometheus, aksi halde JSON)"""
+    if path.endswith((".prom", ".txt")):
+        text = METRICS.prometheus()
+    else:
+        import json
+        text = json.dumps(METRICS.snapshot(), indent=2) + "\n"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
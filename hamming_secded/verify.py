@@ -0,0 +1,224 @@
+"""Tek ve çift bit hatalarının kapsamlı doğrulaması (NumPy gerektirir)
+
+Her genişlik için bütün 1 bitlik ve C(length, 2) adet 2 bitlik hata deseni
+denenir. Beklenen sonuç: tek hata düzeltilir (Hamming düzeninde SEC-DED
+biti hatası ``SECDED_BIT`` olarak raporlanır), çift hata ``DOUBLE`` olarak
+tespit edilir.
+
+Sendrom fonksiyonu (maskeli popcount parity'si) GF(2) üzerinde doğrusaldır;
+bu yüzden tek bit sütunları kodlayıcının kendi ``parity_masks``
+maskelerinden okunur ve bir çift desenin sendromu iki sütunun XOR'u olarak
+vektörel bloklarda hesaplanır. Ayrıca temsilci veri kelimeleri üzerinde
+bütün tek hatalar ve (çok fazlaysa örneklenmiş) çift hatalar gerçek
+``decode_int`` ile çözülüp veri geri kazanımı kontrol edilir; tek
+hatalarda üretilmiş fonksiyonlar maskeli referans tanımlarla da
+karşılaştırılır.
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from .codec import CLEAN, CORRECTED, SECDED_BIT, DOUBLE, HAMMING, STATUS_NAMES, Codec
+
+PAIR_BLOCK = 1 << 20  # Bir vektörel adımda denenen çift sayısı
+DECODE_LIMIT = 1 << 12  # Gerçek kod çözme ile denenen en fazla çift (kelime başına)
+MAX_REPORTED = 20  # Genişlik başına raporlanan en fazla hata
+SEED = 2024  # Temsilci kelimeler ve çift örneklemesi için sabit tohum
+
+
+class Mismatch(NamedTuple):
+    """Yanlış sınıflandırılmış hata deseni"""
+    positions: tuple  # Çevrilen pozisyonlar (1-indexed)
+    data: int  # Temsilci veri kelimesi (yalnızca sendrom kontrolünde 0)
+    expected: int  # Beklenen durum
+    status: int  # Kod çözücünün verdiği durum
+    detail: str
+
+
+class VerifyResult(NamedTuple):
+    """Bir genişliğin doğrulama sonucu"""
+    family: str
+    width: int
+    length: int
+    singles: int  # Denenen tek hata deseni
+    pairs: int  # Sendromla denenen çift hata deseni
+    decoded: int  # Gerçek decode_int çağrısı
+    mismatches: list  # İlk MAX_REPORTED hata
+
+    @property
+    def ok(self):
+        return not self.mismatches
+
+
+def representative_words(width, count=4):
+    """Temsilci veri kelimeleri: sıfır, birler, iki alternatif desen ve rastgele kelimeler"""
+    ones = (1 << width) - 1
+    alternating = int("01" * width, 2) & ones
+    rng = random.Random(SEED + width)
+    words = [0, ones, alternating, alternating ^ ones]
+    words += [rng.getrandbits(width) for _ in range(count)]
+    return list(dict.fromkeys(words))
+
+
+def syndrome_columns(codec):
+    """Kodlayıcının maskelerinden her pozisyonun sendromu (indeks 0 kullanılmaz)"""
+    length = codec.length
+    columns = np.zeros(length + 1, dtype=np.int64)
+    for i, mask in enumerate(codec.parity_masks):
+        bits = np.array(list(format(mask, f"0{length}b")), dtype=np.int64)
+        columns[1:] |= bits << i
+    return columns
+
+
+def status_table(codec):
+    """Sendrom + genel parity indeksinden (``syndrome | parity << r``) durum tablosu"""
+    r = codec.r
+    return np.array([codec.classify(index & ((1 << r) - 1), index >> r)
+                     for index in range(1 << (r + 1))], dtype=np.uint8)
+
+
+def expected_single(codec, position):
+    return SECDED_BIT if codec.secded_bit and position == codec.length else CORRECTED
+
+
+def check_singles(codec, columns, words):
+    """Tek hatalar: sendrom sütunu ve gerçek kod çözme"""
+    mismatches = []
+    length = codec.length
+    if not np.array_equal(columns, np.array(codec.tables.columns, dtype=np.int64)):
+        mismatches.append(Mismatch((), 0, CLEAN, CLEAN, "parity maskeleri sendrom sütunlarıyla uyuşmuyor"))
+
+    decoded = 0
+    for data in words:
+        word = codec.encode_int(data)
+        if word != Codec.encode_int(codec, data):
+            mismatches.append(Mismatch((), data, CLEAN, CLEAN, "kodlayıcı referans tanımdan farklı"))
+        if codec.syndrome_int(word) or codec.secded_bit and word.bit_count() & 1:
+            mismatches.append(Mismatch((), data, CLEAN, codec.decode_int(word).status, "kodlanmış kelime temiz değil"))
+        for position in range(1, length + 1):
+            result = codec.decode_int(word ^ (1 << (length - position)))
+            decoded += 1
+            expected = expected_single(codec, position)
+            if result != Codec.decode_int(codec, word ^ (1 << (length - position))):
+                detail = "kod çözücü referans tanımdan farklı"
+            elif result.status != expected:
+                detail = "yanlış durum"
+            elif expected != DOUBLE and (result.position != position or result.code != word):
+                detail = f"pozisyon {result.position} düzeltildi"
+            elif result.data != data:
+                detail = "veri geri kazanılamadı"
+            else:
+                continue
+            mismatches.append(Mismatch((position,), data, expected, result.status, detail))
+    return mismatches, decoded
+
+
+def pair_block(length, first, stop):
+    """``first <= p < stop`` için bütün (p, q), q > p çiftleri"""
+    first_positions = np.arange(first, stop)
+    counts = length - first_positions
+    p = np.repeat(first_positions, counts)
+    offsets = np.arange(p.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    return p, p + 1 + offsets
+
+
+def pair_ranges(length, block=PAIR_BLOCK):
+    """İlk pozisyon aralıklarını her biri yaklaşık ``block`` çift olacak şekilde bölme"""
+    ranges = []
+    first = 1
+    while first < length:
+        stop, pairs = first, 0
+        while stop < length and (pairs == 0 or pairs + length - stop <= block):
+            pairs += length - stop
+            stop += 1
+        ranges.append((first, stop))
+        first = stop
+    return ranges
+
+
+def check_pairs(width, family, first, stop):
+    """Bir ilk pozisyon aralığındaki çift hataları sendrom sütunlarıyla kontrol etme"""
+    codec = Codec(width, family)
+    columns = syndrome_columns(codec)
+    table = status_table(codec)
+    p, q = pair_block(codec.length, first, stop)
+    status = table[columns[p] ^ columns[q]]  # Çift hatada genel parity 0
+    bad = np.flatnonzero(status != DOUBLE)
+    mismatches = [Mismatch((int(p[i]), int(q[i])), 0, DOUBLE, int(status[i]), "sendrom sınıflandırması")
+                  for i in bad[:MAX_REPORTED]]
+    return p.size, mismatches
+
+
+def decode_pairs(codec, words):
+    """Temsilci kelimelerde çift hataları gerçek kod çözme ile kontrol etme"""
+    length = codec.length
+    total = length * (length - 1) // 2
+    if total <= DECODE_LIMIT:
+        pairs = [(p, q) for p in range(1, length) for q in range(p + 1, length + 1)]
+    else:
+        rng = random.Random(SEED + codec.width)
+        pairs = [tuple(sorted(rng.sample(range(1, length + 1), 2))) for _ in range(DECODE_LIMIT)]
+
+    mismatches = []
+    decoded = 0
+    for data in words:
+        word = codec.encode_int(data)
+        for p, q in pairs:
+            result = codec.decode_int(word ^ (1 << (length - p)) ^ (1 << (length - q)))
+            decoded += 1
+            if result.status != DOUBLE:
+                mismatches.append(Mismatch((p, q), data, DOUBLE, result.status, "yanlış durum"))
+    return mismatches, decoded
+
+
+def check_decodes(width, family):
+    """Temsilci kelimelerde tek ve çift hataları gerçek kod çözme ile kontrol etme"""
+    codec = Codec(width, family)
+    words = representative_words(width)
+    mismatches, decoded = check_singles(codec, syndrome_columns(codec), words)
+    more, count = decode_pairs(codec, words)
+    return decoded + count, mismatches + more
+
+
+def verify_widths(widths, workers=None, family=HAMMING):
+    """Genişlikleri doğrulama; genişlik başına ``VerifyResult`` listesi
+
+    Her genişliğin çift blokları ve gerçek kod çözme işi ayrı görevler
+    olarak ``ProcessPoolExecutor`` üzerinde çalıştırılır (``workers`` 1
+    ise bu süreçte).
+    """
+    widths = list(widths)
+    codecs = {width: Codec(width, family) for width in widths}
+    pair_tasks = [(width, family, first, stop)
+                  for width in widths for first, stop in pair_ranges(codecs[width].length)]
+
+    if workers == 1:
+        pair_results = [check_pairs(*task) for task in pair_tasks]
+        decode_results = [check_decodes(width, family) for width in widths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            decode_futures = [executor.submit(check_decodes, width, family) for width in widths]
+            pair_results = list(executor.map(check_pairs, *zip(*pair_tasks)))
+            decode_results = [future.result() for future in decode_futures]
+
+    pairs = dict.fromkeys(widths, 0)
+    mismatches = {width: [] for width in widths}
+    for (width, _, _, _), (count, found) in zip(pair_tasks, pair_results):
+        pairs[width] += count
+        mismatches[width] += found
+
+    results = []
+    for width, (decoded, found) in zip(widths, decode_results):
+        codec = codecs[width]
+        found = found + mismatches[width]
+        results.append(VerifyResult(family, width, codec.length, codec.length, pairs[width], decoded, found[:MAX_REPORTED]))
+    return results
+
+
+def describe(mismatch):
+    """Hatanın tek satırlık açıklaması"""
+    positions = ",".join(map(str, mismatch.positions)) or "-"
+    return (f"pozisyon {positions}, veri {mismatch.data:#x}: beklenen {STATUS_NAMES[mismatch.expected]}, "
+            f"bulunan {STATUS_NAMES[mismatch.status]} ({mismatch.detail})")
@@ -0,0 +1,369 @@
+"""Bellek bankası: kayıt yerleşimi, bit çevirme, düzeltme ve silme"""
+import random
+
+import pytest
+
+from hamming_secded import CLEAN, CORRECTED, DOUBLE, HAMMING, HSIAO, SECDED_BIT
+from hamming_secded import bank as bank_module
+from hamming_secded.bank import BANK_HEADER, ENTRY_CLEAN, ENTRY_CORRECTABLE, ENTRY_NAMES, ENTRY_UNCORRECTABLE, \
+    MIN_CAPACITY, InterleavedBank, MappedBank, MemoryBank, entry_kind
+
+
+def filled(count, width=32, seed=5, family=HAMMING, depth=None):
+    bank = MemoryBank(width, family) if depth is None else InterleavedBank(width, family, depth)
+    rng = random.Random(seed)
+    for _ in range(count):
+        bank.store(rng.getrandbits(width))
+    return bank
+
+
+def test_records_are_packed_big_endian():
+    bank = MemoryBank(32)
+    assert bank.record_size == 5
+    index = bank.store(0xDEADBEEF)
+    word = bank.codec.encode_int(0xDEADBEEF)
+    assert index == 0
+    assert bytes(bank.data) == word.to_bytes(5, "big")
+    assert bank.read(0) == bank.read(-1) == word
+    assert list(bank) == [word]
+
+
+def test_flip_matches_codeword_bits():
+    bank = filled(3)
+    for position in (1, 17, bank.length):
+        word = bank.read(1)
+        bank.flip(1, position)
+        assert bank.read(1) == word ^ 1 << (bank.length - position)
+    with pytest.raises(ValueError):
+        bank.flip(0, bank.length + 1)
+
+
+def test_correct_repairs_single_errors():
+    bank = filled(10)
+    words = list(bank)
+    bank.flip(4, 9)
+    assert bank.decode(4).status == CORRECTED
+    assert bank.read(4) != words[4]  # decode kaydı değiştirmez
+    result = bank.correct(4)
+    assert (result.status, result.position) == (CORRECTED, 9)
+    assert list(bank) == words
+
+    bank.flip(2, 1)
+    bank.flip(2, 2)
+    assert bank.correct(2).status == DOUBLE
+    assert bank.read(2) == words[2] ^ 1 << (bank.length - 1) ^ 1 << (bank.length - 2)
+
+
+def test_hsiao_bank():
+    bank = MemoryBank(32, HSIAO)
+    assert bank.family == HSIAO and bank.record_size == 5
+    word = bank.read(bank.store(0xDEADBEEF))
+    bank.flip(0, bank.length)  # Hsiao kodunda son pozisyon bir kontrol biti
+    result = bank.correct(0)
+    assert (result.status, result.position, result.data) == (CORRECTED, bank.length, 0xDEADBEEF)
+    assert bank.read(0) == word
+
+
+def test_delete_and_clear():
+    bank = filled(5)
+    words = list(bank)
+    bank.delete(1)
+    bank.delete(-1)
+    assert list(bank) == [words[0], words[2], words[3]]
+    assert bank.decode(0).status == CLEAN
+    bank.clear()
+    assert len(bank) == 0
+
+
+def test_rejects_bad_indices_and_words():
+    bank = filled(2)
+    with pytest.raises(IndexError):
+        bank.read(2)
+    with pytest.raises(IndexError):
+        bank.delete(-3)
+    with pytest.raises(ValueError):
+        bank.append(1 << bank.length)
+
+
+def test_save_and_open(tmp_path):
+    path = tmp_path / "bank.bin"
+    bank = filled(20, family=HSIAO)
+    bank.flip(3, 7)
+    bank.save(path)
+    assert path.stat().st_size == BANK_HEADER.size + 20 * bank.record_size
+
+    with MappedBank.open(path) as mapped:
+        assert (mapped.width, mapped.family, len(mapped)) == (32, HSIAO, 20)
+        assert list(mapped) == list(bank)
+        result = mapped.correct(3)
+        assert (result.status, result.position) == (CORRECTED, 7)
+    with MappedBank.open(path, writable=False) as mapped:
+        assert mapped.decode(3).status == CLEAN  # Düzeltme dosyaya yazıldı
+        with pytest.raises(TypeError):
+            mapped.append(0)
+        with pytest.raises(TypeError):
+            mapped.flip(0, 1)
+
+
+def test_mapped_append_grows_and_close_trims(tmp_path):
+    path = tmp_path / "bank.bin"
+    bank = MappedBank.create(path, 16)
+    words = [bank.codec.encode_int(i) for i in range(MIN_CAPACITY + 5)]
+    for i, word in enumerate(words[:10]):
+        assert bank.append(word) == i
+    capacity = len(bank.mm)
+    assert capacity == BANK_HEADER.size + MIN_CAPACITY * bank.record_size
+    for word in words[10:]:
+        bank.append(word)
+    assert len(bank.mm) == BANK_HEADER.size + 2 * MIN_CAPACITY * bank.record_size  # Geometrik büyüme
+    assert list(bank) == words
+
+    bank.delete(0)
+    bank.delete(-1)
+    bank.close()
+    bank.close()  # İkinci kapatma etkisiz
+    assert path.stat().st_size == BANK_HEADER.size + (len(words) - 2) * bank.record_size
+    with MappedBank.open(path) as reopened:
+        assert list(reopened) == words[1:-1]
+        reopened.clear()
+    assert path.stat().st_size == BANK_HEADER.size
+
+
+def test_mapped_bank_rejects_bad_files(tmp_path):
+    path = tmp_path / "bank.bin"
+    filled(4).save(path)
+    raw = path.read_bytes()
+    for bad in (raw[:5], b"XXXX" + raw[4:], raw[:-1]):
+        path.write_bytes(bad)
+        with pytest.raises(ValueError):
+            MappedBank.open(path)
+
+
+def shared_worker(bank, first, second, first_done, second_done):
+    """Çocuk süreç: iki kayıtta bit çevirme, her birinden sonra olay bildirme"""
+    bank.flip(first, 3)
+    first_done.set()
+    bank.flip(second, 3)
+    second_done.set()
+    bank.close()
+
+
+def shared_scrubber(bank):
+    bank.scrub()
+    bank.close()
+
+
+def test_shared_bank_across_processes():
+    import multiprocessing
+    from hamming_secded.bank import SHARD_RECORDS, SharedBank
+    context = multiprocessing.get_context("spawn")
+    with SharedBank(8, capacity=SHARD_RECORDS + 10, shards=2, context=context) as bank:
+        for i in range(SHARD_RECORDS + 1):
+            bank.store(i & 0xFF)
+        words = [bank.read(0), bank.read(-1)]
+        assert bank.record_lock(0) is bank.record_lock(2 * SHARD_RECORDS) is bank.shard_locks[0]
+        assert bank.record_lock(-1) is bank.shard_locks[1]
+
+        # Parça 0 kilitliyken çocuk parça 1'e yazabilir, parça 0'da bekler
+        first_done, second_done = context.Event(), context.Event()
+        with bank.shard_locks[0]:
+            child = context.Process(target=shared_worker, args=(bank, SHARD_RECORDS, 0, first_done, second_done))
+            child.start()
+            assert first_done.wait(20)
+            assert not second_done.wait(0.3)
+        assert second_done.wait(5)
+        child.join(5)
+        assert bank.decode(0).status == bank.decode(-1).status == CORRECTED
+
+        child = context.Process(target=shared_scrubber, args=(bank,))
+        child.start()
+        child.join(20)
+        assert child.exitcode == 0
+        assert [bank.read(0), bank.read(-1)] == words
+
+        bank.delete(0)
+        assert len(bank) == SHARD_RECORDS
+        for _ in range(10):
+            bank.append(words[0])
+        with pytest.raises(IndexError):
+            bank.append(words[0])
+        bank.clear()
+        assert len(bank) == 0
+
+
+@pytest.mark.parametrize("depth", [1, 3, 8])
+def test_interleaved_bank_matches_memory_bank(depth):
+    plain, bank = filled(21), filled(21, depth=depth)
+    assert list(bank) == list(plain)
+    for target in (plain, bank):
+        target.flip(4, 9)
+        target.write(7, target.codec.encode_int(77))
+        target.delete(2)
+        target.delete(-1)
+        target.append(target.codec.encode_int(5))
+    assert list(bank) == list(plain)
+    assert bank.correct(3).position == 9
+    assert bank.scrub() == ([], [])
+    assert bank.cell_record(bank.cell(5, 4)) == (5, 4)
+    bank.clear()
+    assert len(bank) == 0 and list(bank) == []
+
+
+def test_interleaved_burst_up_to_depth_is_corrected():
+    bank = filled(64, width=24, depth=8)
+    data = [bank.decode(i).data for i in range(len(bank))]
+    for start in range(0, len(bank) * bank.length - 8, 97):
+        record, position = bank.cell_record(start)
+        assert len(bank.flip_burst(record, position, 8)) == 8  # Her kayıtta tek bit
+        _, uncorrectable = bank.scrub()
+        assert uncorrectable == []
+    assert [bank.decode(i).data for i in range(len(bank))] == data
+
+    plain = filled(64, width=24)
+    plain.flip_burst(3, 5, 2)
+    assert plain.scrub() == ([], [3])
+
+
+def test_saved_interleaved_bank_opens_as_mapped(tmp_path):
+    bank = filled(11, depth=8)
+    bank.flip(2, 5)
+    path = tmp_path / "bank.bin"
+    bank.save(path)
+    with MappedBank.open(path) as mapped:
+        assert list(mapped) == list(bank)
+        assert mapped.scrub() == ([2], [])
+
+
+def assert_consistent(bank, index):
+    """Dizin her kaydı baştan çözmekle aynı sınıfı, sendromu ve sayıları vermeli"""
+    assert len(index) == len(bank)
+    expected = {kind: [] for kind in range(len(ENTRY_NAMES))}
+    histogram = {}
+    for i in range(len(bank)):
+        result = bank.decode(i)
+        kind = entry_kind(result.status)
+        assert index.kind(i) == kind, i
+        expected[kind].append(i)
+        if kind != ENTRY_CLEAN:
+            assert index.syndrome(i) == result.syndrome
+            histogram[result.syndrome] = histogram.get(result.syndrome, 0) + 1
+    assert index.counts() == {name: len(expected[kind]) for kind, name in enumerate(ENTRY_NAMES)}
+    assert index.find(ENTRY_CORRECTABLE) == expected[ENTRY_CORRECTABLE]
+    assert index.find(ENTRY_UNCORRECTABLE) == expected[ENTRY_UNCORRECTABLE]
+    assert index.histogram() == dict(sorted(histogram.items()))
+
+
+def test_entry_kind():
+    assert entry_kind(CLEAN) == ENTRY_CLEAN
+    assert entry_kind(CORRECTED) == entry_kind(SECDED_BIT) == ENTRY_CORRECTABLE
+    assert entry_kind(DOUBLE) == ENTRY_UNCORRECTABLE
+
+
+@pytest.mark.parametrize("depth", [None, 8])
+def test_secded_bit_is_repaired(depth):
+    bank = filled(20, depth=depth)
+    words = list(bank)
+    index = bank.status_index()
+    for i in (2, 9):
+        bank.flip(i, bank.length)  # Yalnızca genel parity biti
+    assert index.find(ENTRY_CORRECTABLE) == [2, 9]
+    result = bank.correct(2)
+    assert result.status == SECDED_BIT
+    assert bank.read(2) == words[2]
+    assert bank.scrub() == ([9], [])
+    assert list(bank) == words
+    assert_consistent(bank, index)
+
+
+@pytest.mark.parametrize("depth", [None, 3, 8])
+@pytest.mark.parametrize("family", [HAMMING, HSIAO])
+def test_index_after_flips_and_scrub(depth, family):
+    bank = filled(50, family=family, depth=depth)
+    index = bank.status_index()
+    assert index.complete and bank.status_index() is index
+    assert_consistent(bank, index)
+    for i in (3, 10, 20, 29):
+        bank.flip(i, 2)
+    bank.flip(15, 1)
+    bank.flip(15, 5)
+    bank.flip(40, bank.length)
+    assert_consistent(bank, index)
+    assert index.find(syndrome=bank.codec.columns[2]) == [3, 10, 20, 29]
+    bank.delete(10)
+    bank.delete(0)
+    bank.write(5, bank.codec.encode_int(9) ^ 1 << 4)
+    assert_consistent(bank, index)
+    bank.append(bank.codec.encode_int(1) ^ 1 << 3)
+    bank.flip_burst(30, 3, 2)
+    assert_consistent(bank, index)
+    bank.scrub()
+    assert_consistent(bank, index)
+    bank.clear()
+    assert len(index) == 0
+
+
+@pytest.mark.parametrize("depth", [None, 8])
+def test_index_built_after_errors(monkeypatch, depth):
+    monkeypatch.setattr(bank_module, "INDEX_CHUNK", 7)  # Dizin birkaç parçada kurulur
+    bank = filled(40, depth=depth)
+    for i in range(0, 40, 3):
+        bank.flip(i, i % bank.length + 1)
+    bank.flip(1, 1)
+    bank.flip(1, 2)
+    assert bank.status_index(build=False) is None
+    assert_consistent(bank, bank.status_index())
+
+
+def test_partial_range_scrub():
+    bank = filled(20)
+    index = bank.status_index()
+    for i in range(20):
+        bank.flip(i, 3)
+    corrected, uncorrectable = bank.scrub(5, 12)
+    assert corrected == list(range(5, 12)) and uncorrectable == []
+    assert index.find(ENTRY_CORRECTABLE) == list(range(5)) + list(range(12, 20))
+    assert_consistent(bank, index)
+
+
+def test_mapped_bank_index(tmp_path):
+    bank = filled(11, depth=8)
+    bank.flip(2, 5)
+    path = tmp_path / "bank.bin"
+    bank.save(path)
+    with MappedBank.open(path) as mapped:
+        index = mapped.status_index()
+        assert index.find() == [2]
+        for i in range(MIN_CAPACITY):
+            mapped.append(mapped.codec.encode_int(i))
+        mapped.flip(-1, 4)
+        assert_consistent(mapped, index)
+        mapped.scrub()
+        assert index.find() == []
+
+
+def test_shared_bank_has_no_index():
+    from hamming_secded.bank import SharedBank
+    with SharedBank(8, capacity=4) as bank:
+        assert bank.status_index(build=False) is None
+        with pytest.raises(TypeError):
+            bank.status_index()
+
+
+def test_interleaved_burst_on_partial_frame():
+    bank = InterleavedBank(16, depth=8)
+    for value in range(13):  # İkinci çerçevenin 3 yuvası boş
+        bank.store(value)
+    index = bank.status_index()
+    assert bank.cell_count() == 16 * bank.length
+
+    # Son çerçevede 8 hücrelik patlama: boş yuvalar atlanır, sonraki pozisyonun dolu yuvaları yine bozulur
+    assert bank.cell_record(bank.cell(11, 2)) == (11, 2)
+    touched = bank.flip_burst(11, 2, 8)
+    assert touched == list(range(8, 13))
+    assert bank.cell_record(bank.cell(11, 2) + 7) == (10, 3)
+    assert_consistent(bank, index)
+
+    corrected, uncorrectable = bank.scrub()
+    assert corrected == touched and uncorrectable == []
+    assert [bank.decode(i).data for i in range(13)] == list(range(13))
+    assert bank.flip_burst(12, bank.length, 100) == [12]  # Son hücrede durur
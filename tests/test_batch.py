@@ -0,0 +1,106 @@
+"""Toplu (NumPy) kodlama ve kod çözmenin kelime başına sonuçlarla uyumu"""
+import random
+
+import pytest
+
+from hamming_secded import CLEAN, SECDED_BIT, FAMILIES, Codec
+
+np = pytest.importorskip("numpy")
+
+WIDTHS = [1, 8, 13, 32, 57]
+
+
+def noisy_words(codec, count=300, seed=7):
+    """Temiz, tek hatalı, çift hatalı ve rastgele kod kelimeleri"""
+    rng = random.Random(seed)
+    words = []
+    for i in range(count):
+        word = codec.encode_int(rng.getrandbits(codec.width))
+        for position in rng.sample(range(codec.length), min(i % 3, codec.length)):
+            word ^= 1 << position
+        words.append(word)
+    words += [rng.getrandbits(codec.length) for _ in range(count // 3)]
+    return words
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("width", WIDTHS)
+def test_encode_batch_matches_encode_int(width, family):
+    codec = Codec(width, family)
+    rng = random.Random(width)
+    values = [rng.getrandbits(width) for _ in range(500)]
+    encoded = codec.encode_batch(np.array(values, dtype=np.uint64))
+    assert encoded.tolist() == [codec.encode_int(value) for value in values]
+
+
+def test_encode_batch_width_from_dtype():
+    from hamming_secded.batch import encode_batch
+    values = np.array([0, 1, 0xFFFF], dtype=np.uint16)
+    encoded = encode_batch(values)
+    assert encoded.dtype == np.uint32
+    assert encoded.tolist() == [Codec(16).encode_int(int(v)) for v in values]
+
+
+def test_encode_batch_keeps_shape_and_blocks():
+    from hamming_secded import batch
+    codec = Codec(32)
+    values = np.arange(2 * batch.BLOCK_SIZE + 7, dtype=np.uint32).reshape(-1, 1)
+    encoded = codec.encode_batch(values)
+    assert encoded.shape == values.shape
+    assert encoded[-1, 0] == codec.encode_int(int(values[-1, 0]))
+
+
+def test_encode_batch_rejects_bad_input():
+    with pytest.raises(TypeError):
+        Codec(8).encode_batch(np.array([1, 2], dtype=np.int32))
+    with pytest.raises(ValueError):
+        Codec(64).encode_batch(np.array([1], dtype=np.uint64))  # 72 bitlik kod tek kelimeye sığmaz
+
+
+def test_encode_batch_rejects_wide_values():
+    codec = Codec(12)
+    with pytest.raises(ValueError):
+        codec.encode_batch(np.array([1 << 12], dtype=np.uint16))
+    with pytest.raises(ValueError):
+        codec.encode_batch(np.array([1 << 63], dtype=np.uint64))
+    assert codec.encode_batch(np.array([(1 << 12) - 1], dtype=np.uint16)).tolist() == [codec.encode_int(4095)]
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("width", WIDTHS)
+def test_decode_batch_matches_decode_int(width, family):
+    codec = Codec(width, family)
+    words = noisy_words(codec)
+    result = codec.decode_batch(np.array(words, dtype=np.uint64))
+    expected = [codec.decode_int(word) for word in words]
+    assert result.status.tolist() == [r.status for r in expected]
+    assert result.data.tolist() == [r.data for r in expected]
+    assert result.code.tolist() == [r.code for r in expected]
+    assert result.position.tolist() == [r.position for r in expected]
+
+
+def test_decode_batch_repairs_secded_bit():
+    codec = Codec(8)
+    word = codec.encode_int(0x5A)
+    result = codec.decode_batch(np.array([word ^ 1, word], dtype=np.uint16))
+    assert result.status.tolist() == [SECDED_BIT, CLEAN]
+    assert result.code.tolist() == [word, word]
+    assert result.position.tolist() == [codec.length, 0]
+
+
+def test_decode_batch_rejects_wide_codewords():
+    codec = Codec(8)
+    word = codec.encode_int(0x5A)
+    with pytest.raises(ValueError):
+        codec.decode_batch(np.array([word | 1 << 15], dtype=np.uint16))
+    with pytest.raises(ValueError):
+        Codec(50).decode_batch(np.array([1 << 63], dtype=np.uint64))
+    assert codec.decode_batch(np.array([word], dtype=np.uint16)).data.tolist() == [0x5A]
+
+
+def test_decode_batch_width_from_dtype():
+    from hamming_secded.batch import decode_batch, encode_batch
+    values = np.array([0, 1, 0xFFFF], dtype=np.uint16)
+    assert decode_batch(encode_batch(values)).data.tolist() == values.tolist()
+    with pytest.raises(ValueError):
+        decode_batch(np.array([1], dtype=np.uint8))
@@ -0,0 +1,57 @@
+"""Performans ölçüm paketi: ölçüm bileşimleri, JSON çıktısı ve gerileme kontrolü"""
+import json
+
+import pytest
+
+from hamming_secded import bench
+from hamming_secded.bench import BenchResult, compare, run_benchmarks, to_json
+from hamming_secded.cli import main
+
+
+def result(backend, words_per_sec, width=32):
+    return BenchResult("encode", backend, "hamming", width, 64, 1e9 / words_per_sec, words_per_sec)
+
+
+def test_compare_flags_slowdowns_beyond_tolerance():
+    baseline = to_json([result("reference", 1000), result("generated", 2000), result("sliced", 3000)], tolerance=0.2)
+    current = [result("reference", 700), result("generated", 1700), result("sliced", 3500), result("numpy", 1)]
+    regressions = compare(current, baseline)
+    assert [r.key[1] for r in regressions] == ["reference"]  # %30 yavaş; %15 ve hızlanma geçer, tabanda olmayan atlanır
+    assert regressions[0].ratio == pytest.approx(0.7)
+    assert regressions[0].tolerance == 0.2
+
+    # Argüman tabandaki toleransı, kayıttaki tolerans ikisini de geçersiz kılar
+    assert [r.key[1] for r in compare(current, baseline, tolerance=0.1)] == ["reference", "generated"]
+    baseline["results"][0]["tolerance"] = 0.5
+    assert compare(current, baseline, tolerance=0.1)[0].key[1] == "generated"
+
+    baseline["schema"] = bench.SCHEMA + 1
+    with pytest.raises(ValueError):
+        compare(current, baseline)
+
+
+def test_run_benchmarks_covers_backends():
+    seen = []
+    results = run_benchmarks([8, 100], [4], min_time=0.001, repeat=1, progress=seen.append)
+    assert results == seen
+    assert len({r.key for r in results}) == len(results)
+    assert {r.op for r in results} == set(bench.OPERATIONS)
+    assert {"reference", "generated", "bank"} <= {r.backend for r in results}
+    assert all(r.ns_per_word > 0 and r.words_per_sec == pytest.approx(1e9 / r.ns_per_word) for r in results)
+    document = json.loads(json.dumps(to_json(results)))
+    assert compare(results, document, tolerance=1) == []
+
+
+def test_command_line_baseline(tmp_path):
+    output, baseline = tmp_path / "out.json", tmp_path / "base.json"
+    args = ["bench", "--widths", "8", "--batch", "4", "--ops", "encode", "--backends", "reference", "generated",
+            "--min-time", "0.001", "--repeat", "1"]
+    assert main(args + ["--output", str(output)]) == 0
+    document = json.loads(output.read_text())
+    assert [(r["backend"], r["width"], r["batch"]) for r in document["results"]] == [("reference", 8, 4), ("generated", 8, 4)]
+
+    for entry in document["results"]:
+        entry["words_per_sec"] *= 100
+    baseline.write_text(json.dumps(document))
+    assert main(args + ["--output", str(output), "--baseline", str(baseline)]) == 1
+    assert main(args + ["--output", str(output), "--baseline", str(baseline), "--tolerance", "1"]) == 0
@@ -0,0 +1,42 @@
+"""Bit dilimli kodlayıcıların kelime başına ``encode_int`` ile uyumu"""
+import random
+
+import pytest
+
+from hamming_secded import FAMILIES, Codec
+from hamming_secded.bitslice import encode_bitsliced, from_planes, to_planes
+
+
+def random_values(width, count, seed=1):
+    rng = random.Random(seed)
+    return [rng.getrandbits(width) for _ in range(count)]
+
+
+@pytest.mark.parametrize("size", [64, 128])
+def test_planes_round_trip(size):
+    words = random_values(size, 37)
+    assert from_planes(to_planes(words, size), size, len(words)) == words
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("width", [1, 8, 64, 100, 512])
+@pytest.mark.parametrize("count", [0, 1, 63, 64, 200])
+def test_bitsliced_matches_encode_int(width, count, family):
+    codec = Codec(width, family)
+    values = random_values(width, count, seed=width * 1000 + count)
+    assert encode_bitsliced(values, codec) == [codec.encode_int(value) for value in values]
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("width", [8, 64, 100, 512])
+@pytest.mark.parametrize("count", [1, 130])
+def test_bitsliced_array_matches_encode_int(width, count, family):
+    np = pytest.importorskip("numpy")
+    from hamming_secded.bitslice import encode_bitsliced_array
+    codec = Codec(width, family)
+    values = random_values(width, count, seed=width)
+    data_size, code_size = (width + 7) // 8, (codec.length + 7) // 8
+    rows = np.frombuffer(b"".join(v.to_bytes(data_size, "big") for v in values), dtype=np.uint8)
+    out = encode_bitsliced_array(rows.reshape(-1, data_size), codec, block=64)
+    assert out.shape == (count, code_size)
+    assert [int.from_bytes(row.tobytes(), "big") for row in out] == [codec.encode_int(v) for v in values]
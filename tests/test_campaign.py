@@ -0,0 +1,85 @@
+"""Monte Carlo kampanyası: tohum belirlenimi, hata modelleri ve sınıflandırma"""
+import random
+
+import pytest
+
+from hamming_secded import HSIAO, Codec
+
+pytest.importorskip("numpy")
+
+from hamming_secded.campaign import (  # noqa: E402
+    DETECTED, FIXED, MISCORRECTED, NO_ERROR, UNDETECTED, ErrorModel, run_campaign,
+)
+
+
+@pytest.mark.parametrize("model", [("ber", 0.02), ("flips", 3), ("burst", 5)])
+def test_seed_gives_same_counts_for_any_worker_count(model):
+    runs = [run_campaign(16, 5000, model, seed=11, workers=workers, shard_trials=700)
+            for workers in (1, 2, 3)]
+    assert runs[0].counts == runs[1].counts == runs[2].counts
+    assert sum(runs[0].counts.values()) == 5000
+    assert run_campaign(16, 5000, model, seed=12, shard_trials=700, workers=1).counts != runs[0].counts
+
+
+def test_single_and_double_flips():
+    single = run_campaign(32, 2000, ("flips", 1), seed=1, workers=1)
+    assert single.counts[FIXED] == 2000  # Genel parity biti de yeniden yazılır
+    double = run_campaign(32, 2000, ("flips", 2), seed=1, workers=1)
+    assert double.counts[DETECTED] == 2000
+    assert run_campaign(32, 100, ("ber", 0), seed=1, workers=1).counts[NO_ERROR] == 100
+    # İki bitlik patlama her zaman çift hatadır
+    assert run_campaign(32, 500, ("burst", 2), seed=1, workers=1).counts[DETECTED] == 500
+
+
+def test_hsiao_corrects_every_single_flip():
+    result = run_campaign(32, 2000, ("flips", 1), seed=1, workers=1, family=HSIAO)
+    assert result.family == HSIAO
+    assert result.counts[FIXED] == 2000
+    assert run_campaign(32, 2000, ("flips", 2), seed=1, workers=1, family=HSIAO).counts[DETECTED] == 2000
+
+
+def test_outcomes_match_decode_int():
+    """Üç bitlik desenlerin kampanya dağılımı, kelime başına kod çözmeyle bulunan oranlara yakın olmalı"""
+    codec = Codec(8)
+    rng = random.Random(3)
+    word = codec.encode_int(0xA5)
+    expected = {FIXED: 0, DETECTED: 0, MISCORRECTED: 0, UNDETECTED: 0}
+    samples = 20000
+    for _ in range(samples):
+        noisy = word
+        for position in rng.sample(range(codec.length), 3):
+            noisy ^= 1 << position
+        result = codec.decode_int(noisy)
+        if result.status == 0:
+            expected[UNDETECTED] += 1
+        elif result.status in (1, 2):
+            # Üç hatalı kelimede SEC-DED biti onarımı da yanlış düzeltmedir
+            expected[FIXED if result.status == 1 and result.code == word else MISCORRECTED] += 1
+        else:
+            expected[DETECTED] += 1
+
+    result = run_campaign(8, samples, ("flips", 3), seed=5, workers=1)
+    assert result.counts[FIXED] == result.counts[NO_ERROR] == 0
+    for outcome, count in expected.items():
+        assert abs(result.counts[outcome] - count) < 0.05 * samples
+
+
+def test_result_and_rejected_models():
+    result = run_campaign(8, 10, ("flips", 2), seed=2, workers=1)
+    assert result.model == ErrorModel("flips", 2)
+    assert result.rates()[DETECTED] == 1.0
+    for model in (("ber", 1.5), ("flips", 0), ("flips", 14), ("burst", 2.5), ("gauss", 1)):
+        with pytest.raises(ValueError):
+            run_campaign(8, 10, model, seed=1)
+    with pytest.raises(ValueError):
+        run_campaign(8, 0, ("flips", 1))
+
+
+def test_command_line(capsys):
+    from hamming_secded.cli import main
+    assert main(["campaign", "--width", "16", "--trials", "1e3", "--flips", "2", "--seed", "4", "--workers", "1"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "# family=hamming width=16 trials=1000 model=flips:2 seed=4"
+    assert [line.split("\t")[:2] for line in lines[1:]] == [
+        ["no-error", "0"], ["corrected", "0"], ["detected", "1000"], ["miscorrected", "0"], ["undetected", "0"],
+    ]
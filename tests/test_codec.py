@@ -0,0 +1,260 @@
+"""Kodlayıcının referans algoritmaya ve kod çözme kararlarına uyumu"""
+import random
+
+import pytest
+
+from hamming_secded import (
+    CLEAN, CORRECTED, SECDED_BIT, DOUBLE, FAMILIES, HAMMING, HSIAO, MAX_WIDTH, Codec, CodeState, get_tables,
+    pack, unpack,
+)
+
+WIDTHS = [1, 4, 8, 11, 16, 26, 32, 57, 64, 120, 1000, MAX_WIDTH]
+
+
+def reference_encode(bits):
+    """Ders kitabı Hamming SEC-DED: 2'nin kuvvetlerinde parity, sonda genel parity"""
+    k = len(bits)
+    r = 0
+    while 2 ** r < k + r + 1:
+        r += 1
+    n = k + r
+    code = [0] * (n + 1)  # 1-indexed
+    data = iter(bits)
+    for j in range(1, n + 1):
+        if j & (j - 1):
+            code[j] = next(data)
+    for i in range(r):
+        p = 2 ** i
+        code[p] = sum(code[j] for j in range(1, n + 1) if j & p) & 1
+    return code[1:] + [sum(code) & 1]
+
+
+def random_words(width, count=20, seed=1):
+    rng = random.Random(seed)
+    return [0, (1 << width) - 1] + [rng.getrandbits(width) for _ in range(count)]
+
+
+def bits_of(value, width):
+    return [int(bit) for bit in format(value, f"0{width}b")]
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_encode_matches_reference(width):
+    codec = Codec(width)
+    for value in random_words(width):
+        bits = bits_of(value, width)
+        code = codec.encode(bits)
+        assert code == reference_encode(bits)
+        assert codec.extract(code) == format(value, f"0{width}b")
+
+
+@pytest.mark.parametrize("width", [1, 8, 11, 32])
+def test_single_and_double_errors(width):
+    codec = Codec(width)
+    length = codec.length
+    for value in random_words(width, count=4):
+        data = format(value, f"0{width}b")
+        code = codec.encode(bits_of(value, width))
+        result = codec.decode(code)
+        assert (result.data, result.status, result.position) == (data, CLEAN, 0)
+
+        for p in range(1, length + 1):
+            noisy = list(code)
+            noisy[p - 1] ^= 1
+            result = codec.decode(noisy)
+            if p == length:
+                # Yalnızca genel parity biti: veri sağlam, bit onarılır
+                assert (result.status, result.position, result.data, result.code) == (SECDED_BIT, p, data, code)
+            else:
+                assert (result.status, result.position, result.data, result.code) == (CORRECTED, p, data, code)
+
+        for p in range(1, length + 1):
+            for q in range(p + 1, length + 1):
+                noisy = list(code)
+                noisy[p - 1] ^= 1
+                noisy[q - 1] ^= 1
+                assert codec.decode(noisy).status == DOUBLE
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("width", [1, 4, 8, 11, 32, 57, 64, 120, 1000])
+def test_generated_matches_masked_reference(width, family):
+    codec = Codec(width, family)
+    for value in random_words(width):
+        word = codec.encode_int(value)
+        assert word == Codec.encode_int(codec, value)
+        assert codec.extract_int(word) == Codec.extract_int(codec, word) == value
+        for noisy in (word, word ^ 1, word ^ 1 << (codec.length - 1), word ^ 0b110, word ^ 1 << (codec.length // 2)):
+            assert codec.syndrome_int(noisy) == Codec.syndrome_int(codec, noisy)
+            assert codec.decode_int(noisy) == Codec.decode_int(codec, noisy)
+
+
+def test_generated_code_is_cached_on_disk(tmp_path, monkeypatch):
+    from hamming_secded import generated
+    monkeypatch.setenv("HAMMING_SECDED_CACHE", str(tmp_path / "cache"))
+    tables = get_tables(40)
+    first = generated.compile_tables(tables)
+    files = list((tmp_path / "cache").iterdir())
+    assert [f.name.startswith("hamming-40-") for f in files] == [True]
+    second = generated.compile_tables(tables)
+    value = 0x12345678AB
+    assert first["encode"](value) == second["encode"](value) == Codec.encode_int(Codec(40), value)
+
+    # Bozuk önbellek dosyası yeniden derlenir; yazılamayan dizin hata vermez
+    files[0].write_bytes(b"\x00")
+    assert generated.compile_tables(tables)["encode"](value) == first["encode"](value)
+    monkeypatch.setenv("HAMMING_SECDED_CACHE", str(files[0]))
+    assert generated.compile_tables(tables)["encode"](value) == first["encode"](value)
+
+
+def test_generated_code_cache_is_opt_in(tmp_path, monkeypatch):
+    from hamming_secded import generated
+    monkeypatch.delenv("HAMMING_SECDED_CACHE", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert generated.cache_dir() is None
+    assert generated.compile_tables(get_tables(41))["encode"](5) == Codec.encode_int(Codec(41), 5)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_hsiao_satisfies_parity_check(width):
+    codec = Codec(width, HSIAO)
+    assert all(codec.columns[p].bit_count() & 1 for p in range(1, codec.length + 1))
+    assert len(set(codec.columns[1:])) == codec.length
+    assert codec.length == Codec(width).length
+    for value in random_words(width):
+        word = codec.encode_int(value)
+        assert word >> codec.r == value  # Veri kontrol bitlerinin üstünde durur
+        syndrome = 0
+        for p in range(1, codec.length + 1):
+            if word >> (codec.length - p) & 1:
+                syndrome ^= codec.columns[p]
+        assert syndrome == 0
+
+
+@pytest.mark.parametrize("width", [1, 8, 11, 32, 64])
+def test_hsiao_single_and_double_errors(width):
+    codec = Codec(width, HSIAO)
+    length = codec.length
+    for value in random_words(width, count=4):
+        word = codec.encode_int(value)
+        assert codec.decode_int(word).status == CLEAN
+        for p in range(1, length + 1):
+            result = codec.decode_int(word ^ 1 << (length - p))
+            assert (result.status, result.position, result.data, result.code) == (CORRECTED, p, value, word)
+        for p in range(1, length + 1):
+            for q in range(p + 1, length + 1):
+                assert codec.decode_int(word ^ 1 << (length - p) ^ 1 << (length - q)).status == DOUBLE
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("width", WIDTHS)
+def test_int_api_matches_list_api(width, family):
+    codec = Codec(width, family)
+    for value in random_words(width):
+        code = codec.encode(format(value, f"0{width}b"))
+        word = codec.encode_int(value)
+        assert word == pack(code)
+        assert unpack(word, codec.length) == code
+        assert codec.syndrome_int(word) == codec.syndrome(code) == 0
+        assert codec.extract_int(word) == value
+
+        for p in (1, codec.length // 2 + 1, codec.length):
+            noisy = word ^ 1 << (codec.length - p)
+            flipped = list(code)
+            flipped[p - 1] ^= 1
+            assert codec.syndrome_int(noisy) == codec.syndrome(flipped)
+            result = codec.decode_int(noisy)
+            expected = codec.decode(flipped)
+            assert (result.data, result.status, result.position) == (value, expected.status, expected.position)
+            assert unpack(result.code, codec.length) == expected.code
+
+
+def test_pack_rejects_non_binary():
+    assert pack("0101") == 5
+    with pytest.raises(ValueError):
+        pack("012")
+    with pytest.raises(ValueError):
+        pack("")
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("width", [1, 8, 13, 64, 100, 256])
+def test_sliced_matches_encode_int(width, family):
+    codec = Codec(width, family)
+    for value in random_words(width, count=100):
+        assert codec.encode_sliced(value) == codec.encode_int(value)
+
+
+def test_sliced_width_limit():
+    with pytest.raises(ValueError):
+        Codec(257).encode_sliced(1)
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_code_state_tracks_syndrome(family):
+    codec = Codec(32, family)
+    word = codec.encode_int(0xDEADBEEF)
+    state = CodeState(codec, word)
+    rng = random.Random(4)
+    for _ in range(50):
+        state.flip(rng.randrange(1, codec.length + 1))
+        assert state.syndrome == codec.syndrome_int(state.word)
+        if family == HAMMING:
+            assert state.overall_parity == state.word.bit_count() & 1
+        assert state.status == codec.decode_int(state.word).status
+
+    state = CodeState(codec, word)
+    state.flip(5)
+    result = state.correct()
+    assert (result.status, result.position, result.data, state.word) == (CORRECTED, 5, 0xDEADBEEF, word)
+    if family == HAMMING:
+        state.flip(codec.length)
+        result = state.correct()
+        assert (result.status, result.position, state.word) == (SECDED_BIT, codec.length, word)
+    state.flip(5)
+    state.flip(9)
+    assert state.correct().status == DOUBLE
+    with pytest.raises(ValueError):
+        state.flip(0)
+
+
+@pytest.mark.parametrize("width", [8, 57])
+def test_secded_bit_is_repaired_by_decoders(width):
+    codec = Codec(width)
+    word = codec.encode_int(0x5A)
+    state = CodeState(codec, word ^ 1)
+    state.correct()
+    for decode in (codec.decode_int, codec.tables.generated["decode"], lambda w: Codec.decode_int(codec, w)):
+        result = decode(word ^ 1)
+        assert (result.status, result.position, result.code, result.data) == (SECDED_BIT, codec.length, word, 0x5A)
+    assert state.word == word
+
+
+def test_tables_are_cached_per_width():
+    assert get_tables(64) is get_tables(64)
+    assert Codec(64).tables is Codec(64).tables
+    assert get_tables(64) is not get_tables(32)
+    assert get_tables(64, HSIAO) is not get_tables(64)
+
+
+def test_rejects_wrong_lengths():
+    codec = Codec(8)
+    with pytest.raises(ValueError):
+        codec.encode([0] * 7)
+    with pytest.raises(ValueError):
+        codec.decode([0] * 12)
+    for width in (0, MAX_WIDTH + 1):
+        with pytest.raises(ValueError):
+            Codec(width)
+    with pytest.raises(ValueError):
+        Codec(8, "reed-solomon")
+
+
+def test_for_code_length():
+    for family in FAMILIES:
+        for width in WIDTHS:
+            assert Codec.for_code_length(Codec(width, family).length, family).width == width
+    with pytest.raises(ValueError):
+        Codec.for_code_length(3)
@@ -0,0 +1,96 @@
+"""Serpiştirme: çerçeve yerleşimi ve kısmi çerçeveli tamponlar (NumPy'li ve NumPy'siz)"""
+import random
+
+import pytest
+
+from hamming_secded import interleave as il
+from hamming_secded.interleave import MAX_DEPTH, Interleaver, cell, check_depth, deinterleave, \
+    deinterleave_bytes, frame_size, interleave, interleave_bytes
+from hamming_secded import CORRECTED, Codec
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(il, "_numpy", lambda: None)
+    return request.param
+
+
+def records(count, length, seed=3):
+    rng = random.Random(seed)
+    size = (length + 7) // 8
+    return b"".join(rng.getrandbits(length).to_bytes(size, "big") for _ in range(count))
+
+
+@pytest.mark.parametrize("length,depth", [(13, 8), (39, 8), (72, 16), (22, 3), (7, 1)])
+def test_frame_round_trip(length, depth):
+    rng = random.Random(length)
+    words = [rng.getrandbits(length) for _ in range(depth)]
+    frame = interleave(words, length)
+    assert frame.bit_length() <= length * depth
+    assert deinterleave(frame, length, depth) == words
+
+    # Çerçevenin k. biti (en anlamlıdan) k % D. kelimenin k // D + 1. pozisyonu
+    bits = format(frame, f"0{length * depth}b")
+    for k in range(length * depth):
+        slot, position = cell(k, depth)
+        assert int(bits[k]) == words[slot] >> (length - position) & 1
+
+
+@pytest.mark.parametrize("length,depth", [(13, 8), (39, 8), (72, 16), (22, 3)])
+@pytest.mark.parametrize("count", [0, 1, 5, 8, 9, 31])
+def test_partial_frames(backend, length, depth, count):
+    size = (length + 7) // 8
+    raw = records(count, length)
+    frames = interleave_bytes(raw, length, depth)
+    assert len(frames) == -(-count // depth) * frame_size(length, depth)
+
+    restored = deinterleave_bytes(frames, length, depth)
+    assert restored[:len(raw)] == raw
+    assert restored[len(raw):] == bytes(len(restored) - len(raw))  # Son çerçeve sıfırla tamamlanır
+    assert len(restored) == -(-count // depth) * depth * size
+
+
+@pytest.mark.parametrize("length,depth", [(13, 8), (39, 16), (22, 3)])
+def test_backends_agree(monkeypatch, length, depth):
+    pytest.importorskip("numpy")
+    raw = records(21, length)
+    frames = interleave_bytes(raw, length, depth)
+    restored = deinterleave_bytes(frames, length, depth)
+    monkeypatch.setattr(il, "_numpy", lambda: None)
+    assert interleave_bytes(raw, length, depth) == frames
+    assert deinterleave_bytes(frames, length, depth) == restored
+
+
+def test_bytes_match_frame_integers():
+    length, depth = 13, 8
+    raw = records(8, length)
+    words = [int.from_bytes(raw[i:i + 2], "big") for i in range(0, len(raw), 2)]
+    pad = frame_size(length, depth) * 8 - length * depth
+    assert int.from_bytes(interleave_bytes(raw, length, depth), "big") == interleave(words, length) << pad
+
+
+def test_partial_buffer_rejected():
+    with pytest.raises(ValueError):
+        deinterleave_bytes(b"\x00" * 5, 13, 8)
+
+
+@pytest.mark.parametrize("depth", [0, -1, MAX_DEPTH + 1, 70000])
+def test_depth_bounds(depth):
+    with pytest.raises(ValueError):
+        check_depth(depth)
+
+
+def test_interleaver_corrects_burst():
+    codec = Codec(32)
+    layer = Interleaver(codec, 8)
+    values = list(range(100, 108))
+    frame = layer.encode(values)
+    burst = ((1 << 8) - 1) << 40  # 8 komşu hücre
+    results = layer.decode(frame ^ burst)
+    assert [r.data for r in results] == values
+    assert all(r.status == CORRECTED for r in results)
+    with pytest.raises(ValueError):
+        layer.encode(values[:-1])
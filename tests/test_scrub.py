@@ -0,0 +1,86 @@
+"""Bellek taraması: aralık düzeltme, tarayıcı döngüsü ve hız sınırı"""
+import random
+import threading
+import time
+
+import pytest
+
+from hamming_secded.bank import MemoryBank
+from hamming_secded.scrub import CHUNK, DEFAULT_CPU_SHARE, Scrubber, Throttle
+
+
+def damaged(width, count=300, seed=2):
+    """Her 50. kayıtta çift, diğer her 7. kayıtta tek hata olan banka"""
+    bank = MemoryBank(width)
+    rng = random.Random(seed)
+    for _ in range(count):
+        bank.store(rng.getrandbits(width))
+    words = list(bank)
+    singles = [i for i in range(0, count, 7) if i % 50]
+    doubles = list(range(0, count, 50))
+    for index in singles:
+        bank.flip(index, rng.randrange(1, bank.length))
+    for index in doubles:
+        bank.flip(index, 1)
+        bank.flip(index, 2)
+    return bank, words, singles, doubles
+
+
+@pytest.mark.parametrize("width", [32, 100])  # Toplu ve kelime başına kod çözme
+def test_scrub_range(width):
+    bank, words, singles, doubles = damaged(width)
+    corrected, uncorrectable = bank.scrub(100, 200)
+    assert corrected == [i for i in singles if 100 <= i < 200]
+    assert uncorrectable == [100, 150]
+    assert [bank.read(i) for i in corrected] == [words[i] for i in corrected]
+    assert bank.read(7) != words[7]  # Aralık dışı
+
+    corrected, uncorrectable = bank.scrub()
+    assert uncorrectable == doubles
+    assert all(bank.read(i) == words[i] for i in range(300) if i not in doubles)
+    assert bank.scrub(300) == bank.scrub(5, 5) == ([], [])
+
+
+def test_scrubber_pass_reports_progress():
+    bank, _, singles, doubles = damaged(32, count=3 * CHUNK // 2)
+    progress = []
+    scrubber = Scrubber(bank, cpu_share=1)
+    scrubber.run(progress.append, passes=2)
+    assert scrubber.passes == 2
+    assert [(p.start, p.stop, p.total) for p in progress[:2]] == [(0, CHUNK, len(bank)), (CHUNK, len(bank), len(bank))]
+    assert progress[0].corrected + progress[1].corrected == singles
+    assert progress[0].uncorrectable + progress[1].uncorrectable == doubles
+    assert progress[2].corrected == progress[3].corrected == []  # İkinci geçişte düzeltilecek bir şey kalmadı
+    assert progress[2].uncorrectable + progress[3].uncorrectable == doubles
+
+
+def test_rate_limit_and_stop():
+    bank = damaged(16, count=400)[0]
+    scrubber = Scrubber(bank, rate=2000)
+    assert scrubber.throttle.chunk_size() == 200
+    began = time.perf_counter()
+    assert scrubber.scrub_pass()
+    assert time.perf_counter() - began >= 0.15
+
+    slow = Scrubber(bank, rate=20)
+    thread = threading.Thread(target=slow.run)
+    thread.start()
+    time.sleep(0.1)
+    slow.stop()
+    thread.join(2)
+    assert not thread.is_alive() and slow.passes == 0
+
+
+def test_throttle():
+    throttle = Throttle()
+    assert (throttle.rate, throttle.cpu_share) == (None, DEFAULT_CPU_SHARE)
+    assert throttle.chunk_size() == CHUNK
+    assert throttle.delay(100, 0.1) == pytest.approx(0.3)
+    assert Throttle(cpu_share=1).delay(100, 0.1) == 0
+    rate = Throttle(rate=1000)
+    assert rate.delay(100, 0.02) == pytest.approx(0.08)
+    assert rate.delay(100, 0.5) == 0
+    assert Throttle(rate=5).chunk_size() == 1
+    for kwargs in ({"rate": 0}, {"cpu_share": 0}, {"cpu_share": 1.5}):
+        with pytest.raises(ValueError):
+            Throttle(**kwargs)
@@ -0,0 +1,223 @@
+"""asyncio ECC servisi: sonuçların kodlayıcıyla uyumu, toplama, geri basınç ve hata yanıtları"""
+import asyncio
+import random
+
+import pytest
+
+from hamming_secded import CLEAN, CORRECTED, SECDED_BIT, DOUBLE, HAMMING, HSIAO, Codec
+
+pytest.importorskip("numpy")
+
+from hamming_secded import service  # noqa: E402
+from hamming_secded.service import REQUEST, RESPONSE, Client, ServiceError, start_server  # noqa: E402
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 20))
+
+
+async def serving(**kwargs):
+    server = await start_server("127.0.0.1", 0, **kwargs)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def noisy(codec, values, seed=3):
+    """Temiz, tek hatalı ve çift hatalı kod kelimeleri"""
+    rng = random.Random(seed)
+    words = []
+    for i, value in enumerate(values):
+        word = codec.encode_int(value)
+        for position in rng.sample(range(1, codec.length), i % 3):
+            word ^= 1 << position
+        words.append(word)
+    return words
+
+
+@pytest.mark.parametrize("family", [HAMMING, HSIAO])
+@pytest.mark.parametrize("width", [8, 32, 57, 100])
+def test_results_match_codec(width, family):
+    codec = Codec(width, family)
+    rng = random.Random(width)
+    values = [rng.getrandbits(width) for _ in range(60)]
+    words = noisy(codec, values)
+
+    async def main():
+        server, port = await serving()
+        async with server:
+            client = await Client.connect("127.0.0.1", port)
+            assert await client.encode(values, width, family) == [codec.encode_int(v) for v in values]
+            data, status = await client.decode(words, width, family)
+            expected = [codec.decode_int(word) for word in words]
+            assert data == [r.data for r in expected]
+            assert status == [r.status for r in expected]
+            code, status = await client.scrub(words, width, family)
+            assert code == [r.code for r in expected]
+            assert set(status) == {CLEAN, CORRECTED, DOUBLE}
+            await client.close()
+
+    run(main())
+
+
+def test_scrub_repairs_secded_bit():
+    codec = Codec(8)
+    words = [codec.encode_int(v) for v in (1, 2, 3)]
+
+    async def main():
+        server, port = await serving()
+        async with server:
+            client = await Client.connect("127.0.0.1", port)
+            code, status = await client.scrub([words[0], words[1] ^ 1, words[2] ^ 1 << 4], 8)
+            assert code == words
+            assert status == [CLEAN, SECDED_BIT, CORRECTED]
+            await client.close()
+
+    run(main())
+
+
+def test_unix_socket(tmp_path):
+    path = str(tmp_path / "ecc.sock")
+
+    async def main():
+        server = await start_server(path=path)
+        async with server:
+            client = await Client.connect_unix(path)
+            assert await client.encode([0xAB], 8) == [Codec(8).encode_int(0xAB)]
+            await client.close()
+
+    run(main())
+
+
+def test_concurrent_requests_are_batched():
+    codec = Codec(16)
+
+    async def main():
+        server, port = await serving(window=0.05)
+        async with server:
+            clients = [await Client.connect("127.0.0.1", port) for _ in range(8)]
+            jobs = [client.encode([i, i + 1], 16) for i in range(50) for client in clients]
+            replies = await asyncio.gather(*jobs)
+            assert replies == [[codec.encode_int(i), codec.encode_int(i + 1)] for i in range(50) for _ in clients]
+            assert server.service.requests == 400
+            assert server.service.batcher.batches < 40
+            for client in clients:
+                await client.close()
+
+    run(main())
+
+
+def test_backpressure_stops_reading():
+    codec = Codec(8)
+
+    async def main():
+        server, port = await serving(window=0.3, max_inflight=2)
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for request_id in range(6):
+                writer.write(REQUEST.pack(1, service.ENCODE, 0, 8, request_id) + bytes([request_id]))
+            await writer.drain()
+            await asyncio.sleep(0.15)
+            assert server.service.requests == 2  # Sınır dolu: kalan istekler okunmadı
+
+            replies = {}
+            for _ in range(6):
+                size, status, op, _, request_id = RESPONSE.unpack(await reader.readexactly(RESPONSE.size))
+                assert (status, op) == (service.OK, service.ENCODE)
+                replies[request_id] = int.from_bytes(await reader.readexactly(size), "big")
+            assert replies == {i: codec.encode_int(i) for i in range(6)}
+            writer.close()
+            await writer.wait_closed()
+
+    run(main())
+
+
+def test_bad_requests_get_error_replies():
+    async def main():
+        server, port = await serving()
+        async with server:
+            client = await Client.connect("127.0.0.1", port)
+            for op, width, body in [
+                (service.ENCODE, 0, b"\x01"),  # Geçersiz genişlik
+                (9, 8, b"\x01"),  # Bilinmeyen işlem
+                (service.ENCODE, 16, b"\x01\x02\x03"),  # Kelime boyutunun katı değil
+                (service.ENCODE, 12, b"\xff\xff"),  # 12 bitten uzun veri
+                (service.DECODE, 8, b"\xff\xff"),  # 13 bitten uzun kod
+            ]:
+                with pytest.raises(ServiceError):
+                    await client.request(op, width, body)
+
+            # Hatalı istekler bağlantıyı ve aynı anda toplanan istekleri bozmaz
+            good = client.encode([5], 16)
+            bad = client.request(service.ENCODE, 16, b"\x01\x02\x03")
+            replies = await asyncio.gather(good, bad, return_exceptions=True)
+            assert replies[0] == [Codec(16).encode_int(5)]
+            assert isinstance(replies[1], ServiceError)
+            await client.close()
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(REQUEST.pack(1, service.ENCODE, 7, 8, 42) + b"\x01")  # Bilinmeyen aile
+            size, status, _, _, request_id = RESPONSE.unpack(await reader.readexactly(RESPONSE.size))
+            assert (status, request_id) == (service.ERROR, 42)
+            assert "aile" in (await reader.readexactly(size)).decode()
+
+            writer.write(REQUEST.pack(service.MAX_BODY + 1, service.ENCODE, 0, 8, 43))
+            size, status, _, _, request_id = RESPONSE.unpack(await reader.readexactly(RESPONSE.size))
+            assert (status, request_id) == (service.ERROR, 43)
+            await reader.readexactly(size)
+            assert await reader.read() == b""  # Sunucu bağlantıyı kapattı
+            writer.close()
+
+    run(main())
+
+
+def test_early_flush_cancels_window_timer():
+    codec = Codec(8)
+
+    async def main():
+        batcher = service.Batcher(window=0.3, max_words=2)
+        first = batcher.submit(service.ENCODE, codec, b"\x01\x02")  # Sınıra ulaştı: hemen işlenir
+        assert await first == b"".join(codec.encode_int(v).to_bytes(2, "big") for v in (1, 2))
+        await asyncio.sleep(0.2)
+        second = batcher.submit(service.ENCODE, codec, b"\x03")
+        await asyncio.sleep(0.15)  # İlk pencerenin zamanlayıcısı dolmuş olurdu
+        assert not second.done()
+        assert await second == codec.encode_int(3).to_bytes(2, "big")
+        assert batcher.batches == 2
+
+    run(main())
+
+
+def test_unexpected_failure_gets_error_reply(monkeypatch, caplog):
+    def broken(op, codec, raw):
+        raise RuntimeError("bozuk")
+
+    async def main():
+        server, port = await serving()
+        async with server:
+            client = await Client.connect("127.0.0.1", port)
+            with monkeypatch.context() as patch:
+                patch.setattr(service, "process", broken)
+                with pytest.raises(ServiceError, match="RuntimeError: bozuk"):
+                    await client.encode([1], 8)
+            assert await client.encode([1], 8) == [Codec(8).encode_int(1)]  # Bağlantı kullanılabilir kalır
+            await client.close()
+
+    run(main())
+    assert "işlenemedi" in caplog.text
+
+
+def test_cancelled_connection_closes_quietly():
+    async def main():
+        server, port = await serving(window=10)
+        async with server:
+            client = await Client.connect("127.0.0.1", port)
+            pending = asyncio.ensure_future(client.encode([1], 8))
+            await asyncio.sleep(0.1)
+            handler, = [t for t in asyncio.all_tasks() if t.get_coro().__qualname__ == "EccServer.handle"]
+            handler.cancel()
+            await asyncio.wait([handler], timeout=5)
+            assert handler.done() and not handler.cancelled()
+            with pytest.raises(ConnectionError):
+                await pending
+            await client.close()
+
+    run(main())
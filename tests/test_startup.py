@@ -0,0 +1,26 @@
+"""Başlangıç: kütüphane ve komut satırı Qt/multiprocessing yüklemeden çalışır"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, timeout=60)
+
+
+def test_library_import_skips_qt_and_multiprocessing():
+    code = ("import sys, hamming_secded, hamming_secded.bank, hamming_secded.cli, hamming_secded.scrub; "
+            "print(sorted(m for m in ('PyQt5', 'multiprocessing') if m in sys.modules))")
+    assert run_python("-c", code).stdout.strip() == "[]"
+
+
+def test_gui_script_runs_subcommands_without_qt(tmp_path):
+    source, ecc, output = tmp_path / "in.bin", tmp_path / "out.ecc", tmp_path / "out.bin"
+    source.write_bytes(os.urandom(100))
+    for args in (["encode", "--width", "16", str(source), str(ecc)], ["decode", str(ecc), str(output)]):
+        result = run_python("-X", "importtime", "Hamming-SEC-DED.py", *args)
+        assert result.returncode == 0, result.stderr
+        assert "PyQt5" not in result.stderr
+    assert output.read_bytes() == source.read_bytes()
@@ -0,0 +1,167 @@
+""".ecc akış biçimi: kodlama/çözme gidiş-dönüşü, hata raporu ve komut satırı"""
+import io
+import os
+
+import pytest
+
+from hamming_secded import CLEAN, CORRECTED, DOUBLE, HAMMING, HSIAO, Codec
+from hamming_secded.cli import HEADER, INTERLEAVED_VERSION, MAX_DEPTH, VERSION, check_stream_depth, decode_stream, \
+    encode_stream, main
+from hamming_secded.interleave import interleave
+
+SIZES = [0, 1, 7, 8, 100, 1000, 4099]
+
+
+def round_trip(payload, codec, chunk_bytes=256, depth=1):
+    encoded = io.BytesIO()
+    assert encode_stream(io.BytesIO(payload), encoded, codec, chunk_bytes, depth) == len(payload)
+    decoded = io.BytesIO()
+    counts = decode_stream(io.BytesIO(encoded.getvalue()), decoded, chunk_bytes=chunk_bytes)
+    return encoded.getvalue(), decoded.getvalue(), counts
+
+
+@pytest.mark.parametrize("width", [1, 8, 13, 64, 300])
+@pytest.mark.parametrize("size", SIZES)
+def test_round_trip(size, width):
+    payload = os.urandom(size)
+    encoded, decoded, counts = round_trip(payload, Codec(width))
+    assert decoded == payload
+    assert counts[CORRECTED] == counts[DOUBLE] == 0
+    # Başlık + 8 kelimelik gruplar (her grup ``length`` byte) + kuyruk
+    groups = -(-size // width)
+    assert len(encoded) == HEADER.size + groups * Codec(width).length + 8
+    assert HEADER.unpack(encoded[:HEADER.size])[1] == VERSION
+
+
+@pytest.mark.parametrize("depth", [8, 16, 40])
+@pytest.mark.parametrize("size", SIZES)
+def test_interleaved_round_trip(size, depth):
+    payload = os.urandom(size)
+    encoded, decoded, counts = round_trip(payload, Codec(32), depth=depth)
+    assert decoded == payload
+    assert counts[CORRECTED] == counts[DOUBLE] == 0
+    assert HEADER.unpack(encoded[:HEADER.size])[1] == INTERLEAVED_VERSION
+
+
+@pytest.mark.parametrize("depth", [8, 16])
+def test_interleaved_frames_match_word_interleave(depth):
+    codec = Codec(13)
+    payload = os.urandom(13 * depth // 8 * 3)
+    encoded, _, _ = round_trip(payload, codec, chunk_bytes=40, depth=depth)
+    value = int.from_bytes(payload, "big")
+    words = [codec.encode_int(value >> 13 * i & 0x1FFF) for i in reversed(range(len(payload) * 8 // 13))]
+    frames = b"".join(interleave(words[i:i + depth], codec.length).to_bytes(depth * codec.length // 8, "big")
+                      for i in range(0, len(words), depth))
+    assert encoded[HEADER.size + 2:-8] == frames
+
+
+@pytest.mark.parametrize("family", [HAMMING, HSIAO])
+@pytest.mark.parametrize("depth", [8, 24])
+def test_interleaved_burst_is_corrected(depth, family):
+    codec = Codec(16, family)
+    payload = os.urandom(500)
+    encoded, _, _ = round_trip(payload, codec, depth=depth)
+
+    # Her çerçevede depth bitlik bir patlama: her kelimede tek bit hatası
+    header = HEADER.size + 2
+    frame = depth * codec.length // 8
+    corrupted = bytearray(encoded)
+    frames = (len(encoded) - header - 8) // frame
+    for f in range(frames):
+        start = (header + f * frame) * 8 + (f * 5) % (frame * 8 - depth)
+        for bit in range(start, start + depth):
+            corrupted[bit // 8] ^= 0x80 >> (bit % 8)
+
+    decoded = io.BytesIO()
+    counts = decode_stream(io.BytesIO(bytes(corrupted)), decoded, chunk_bytes=100)
+    assert decoded.getvalue() == payload
+    assert counts[CLEAN] == counts[DOUBLE] == 0  # SEC-DED biti isabet eden kelimeler SECDED_BIT sayılır
+    assert sum(counts.values()) == frames * depth
+
+
+@pytest.mark.parametrize("depth", [0, 2, 12, MAX_DEPTH + 8, 70000])
+def test_invalid_depth(depth):
+    with pytest.raises(ValueError):
+        check_stream_depth(depth)
+    with pytest.raises(ValueError):
+        encode_stream(io.BytesIO(b""), io.BytesIO(), Codec(8), depth=depth)
+
+
+def test_max_depth_fits_header(tmp_path):
+    check_stream_depth(MAX_DEPTH)
+    encoded, decoded, _ = round_trip(b"x" * 10, Codec(8), chunk_bytes=1 << 20, depth=MAX_DEPTH)
+    assert decoded == b"x" * 10
+
+    # Geçersiz derinlik çıktı dosyası açılmadan reddedilir
+    source = tmp_path / "in.bin"
+    source.write_bytes(b"abc")
+    assert main(["encode", "--width", "8", "--interleave", "70000", str(source), str(tmp_path / "out.ecc")]) == 2
+    assert not (tmp_path / "out.ecc").exists()
+
+
+def test_header_records_family():
+    payload = os.urandom(288)  # 96 kelime
+    encoded, decoded, counts = round_trip(payload, Codec(24, HSIAO))
+    assert decoded == payload and counts[CLEAN] == 96
+    assert HEADER.unpack(encoded[:HEADER.size])[2:] == (1, 24)
+    corrupted = bytearray(encoded)
+    corrupted[HEADER.size + 5] ^= 0x10
+    output = io.BytesIO()
+    assert decode_stream(io.BytesIO(bytes(corrupted)), output)[CORRECTED] == 1
+    assert output.getvalue() == payload
+
+
+def test_single_errors_are_corrected_and_reported():
+    codec = Codec(16)
+    payload = os.urandom(160)  # 80 kelime
+    encoded, _, _ = round_trip(payload, codec)
+    corrupted = bytearray(encoded)
+    for word in (0, 9, 79):
+        bit = HEADER.size * 8 + word * codec.length + 3
+        corrupted[bit // 8] ^= 0x80 >> (bit % 8)
+
+    decoded, report = io.BytesIO(), io.StringIO()
+    counts = decode_stream(io.BytesIO(bytes(corrupted)), decoded, report)
+    assert decoded.getvalue() == payload
+    assert counts[CORRECTED] == 3 and counts[CLEAN] == 77
+    lines = report.getvalue().splitlines()
+    assert [line.split("\t")[:3] for line in lines[1:]] == [[str(w), "corrected", "4"] for w in (0, 9, 79)]
+
+
+def test_double_error_is_detected():
+    codec = Codec(16)
+    encoded, _, _ = round_trip(bytes(64), codec)
+    corrupted = bytearray(encoded)
+    corrupted[HEADER.size] ^= 0xC0  # İlk kelimede iki komşu bit
+    counts = decode_stream(io.BytesIO(bytes(corrupted)), io.BytesIO())
+    assert counts[DOUBLE] == 1
+    assert counts[CLEAN] == 64 * 8 // codec.width - 1
+
+
+def test_width_mismatch_and_bad_files():
+    encoded, _, _ = round_trip(b"abc", Codec(8))
+    with pytest.raises(ValueError):
+        decode_stream(io.BytesIO(encoded), io.BytesIO(), width=16)
+    with pytest.raises(ValueError):
+        decode_stream(io.BytesIO(b"XXXX" + encoded[4:]), io.BytesIO())
+    with pytest.raises(ValueError):
+        decode_stream(io.BytesIO(encoded[:-1]), io.BytesIO())
+    with pytest.raises(ValueError):
+        decode_stream(io.BytesIO(b""), io.BytesIO())
+    with pytest.raises(ValueError):
+        decode_stream(io.BytesIO(encoded[:6] + b"\x07" + encoded[7:]), io.BytesIO())  # Bilinmeyen aile
+
+
+def test_command_line(tmp_path):
+    source, ecc, output = tmp_path / "in.bin", tmp_path / "out.ecc", tmp_path / "out.bin"
+    source.write_bytes(os.urandom(1000))
+    assert main(["encode", "--width", "32", "--family", "hsiao", str(source), str(ecc)]) == 0
+    assert main(["decode", str(ecc), str(output)]) == 0
+    assert output.read_bytes() == source.read_bytes()
+    assert (tmp_path / "out.bin.report").exists()
+
+    corrupted = bytearray(ecc.read_bytes())
+    corrupted[HEADER.size] ^= 0xC0
+    ecc.write_bytes(bytes(corrupted))
+    assert main(["decode", str(ecc), str(output)]) == 1
+    assert main(["decode", "--width", "16", str(ecc), str(output)]) == 2
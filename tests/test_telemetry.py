@@ -0,0 +1,94 @@
+"""Telemetri: sayaçlar, histogramlar, ölçümlü kodlayıcı ve dışa aktarım"""
+import json
+
+import pytest
+
+from hamming_secded import CLEAN, CORRECTED, DOUBLE, Codec, telemetry
+from hamming_secded.cli import main
+from hamming_secded.telemetry import METRICS, Histogram
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    monkeypatch.setattr(telemetry, "enabled", True)
+    METRICS.reset()
+    yield METRICS
+    METRICS.reset()
+
+
+def test_histogram():
+    histogram = Histogram((1, 10))
+    for value in (0.5, 1, 3, 20):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(1, 2), (10, 3), (float("inf"), 4)]
+    assert histogram.mean() == pytest.approx(6.125)
+    assert Histogram().mean() == 0.0
+
+
+def test_counters_and_labels(metrics):
+    metrics.inc("decodes_total", status="clean")
+    metrics.inc("decodes_total", 4, status="double")
+    assert metrics.counter("decodes_total") == 5
+    assert metrics.counter("decodes_total", status="double") == 4
+    assert metrics.counter("encodes_total") == 0
+
+
+def test_instrumented_codec_counts(metrics):
+    codec = Codec(16)
+    word = codec.encode_int(0xBEEF)
+    codec.encode_sliced(1)
+    codec.decode_int(word)
+    codec.decode_int(word ^ 1 << 5)
+    codec.decode_int(word ^ 0b110000)
+    assert metrics.counter("encodes_total") == 2
+    assert metrics.counter("decodes_total") == 3
+    for status, name in ((CLEAN, "clean"), (CORRECTED, "corrected"), (DOUBLE, "double")):
+        assert metrics.counter("decodes_total", status=name) == 1, status
+    assert sum(metrics.snapshot()["syndromes"].values()) == 2
+    assert metrics.mean_latency("decode") > 0
+
+
+def test_batch_counts(metrics):
+    np = pytest.importorskip("numpy")
+    codec = Codec(16)
+    words = codec.encode_batch(np.arange(100, dtype=np.uint16))
+    words[:10] ^= 1 << 3
+    codec.decode_batch(words)
+    assert metrics.counter("encodes_total") == 100
+    assert metrics.counter("decodes_total", status="corrected") == 10
+    assert metrics.counter("decodes_total", status="clean") == 90
+    assert metrics.snapshot()["syndromes"] == {str(codec.tables.columns[codec.length - 3]): 10}
+    assert set(metrics.snapshot()["op_seconds"]) == {"encode_batch", "decode_batch"}
+
+
+def test_disabled_codec_is_not_wrapped():
+    METRICS.reset()
+    codec = Codec(16)
+    codec.decode_int(codec.encode_int(1))
+    assert METRICS.counter("decodes_total") == METRICS.counter("encodes_total") == 0
+
+
+def test_prometheus_export(metrics):
+    codec = Codec(8)
+    codec.decode_int(codec.encode_int(3) ^ 2)
+    text = metrics.prometheus()
+    lines = text.splitlines()
+    assert "# TYPE hamming_secded_decodes_total counter" in lines
+    assert 'hamming_secded_decodes_total{status="corrected"} 1' in lines
+    assert "# TYPE hamming_secded_op_seconds histogram" in lines
+    assert 'hamming_secded_op_seconds_bucket{op="decode",le="+Inf"} 1' in lines
+    assert 'hamming_secded_op_seconds_count{op="decode"} 1' in lines
+    assert any(line.startswith('hamming_secded_syndrome_total{syndrome="') for line in lines)
+    assert text.endswith("\n")
+
+
+def test_snapshot_files_and_command_line(metrics, tmp_path):
+    source, ecc = tmp_path / "in.bin", tmp_path / "out.ecc"
+    source.write_bytes(bytes(range(64)))
+    assert main(["--metrics", str(tmp_path / "m.json"), "encode", "--width", "8", str(source), str(ecc)]) == 0
+    snapshot = json.loads((tmp_path / "m.json").read_text())
+    encodes = [c for c in snapshot["counters"] if c["name"] == "encodes_total"]
+    assert encodes == [{"name": "encodes_total", "labels": {}, "value": 64}]
+
+    telemetry.write_snapshot(str(tmp_path / "m.prom"))
+    assert (tmp_path / "m.prom").read_text().startswith("# TYPE hamming_secded_encodes_total counter")
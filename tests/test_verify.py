@@ -0,0 +1,60 @@
+"""Kapsamlı tek/çift hata doğrulaması: kapsam, hata raporlama ve komut satırı"""
+import pytest
+
+from hamming_secded import CORRECTED, DOUBLE, FAMILIES
+
+pytest.importorskip("numpy")
+
+from hamming_secded import verify  # noqa: E402
+from hamming_secded.cli import main, parse_widths  # noqa: E402
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_small_widths_pass(family):
+    widths = [1, 2, 8, 13, 64]
+    results = verify.verify_widths(widths, workers=1, family=family)
+    assert [r.width for r in results] == widths
+    for result in results:
+        assert result.ok, [verify.describe(m) for m in result.mismatches]
+        assert result.singles == result.length
+        assert result.pairs == result.length * (result.length - 1) // 2
+        assert result.decoded > 0
+
+
+def test_worker_count_does_not_change_results():
+    assert verify.verify_widths([8, 100], workers=2) == verify.verify_widths([8, 100], workers=1)
+
+
+@pytest.mark.parametrize("length", [2, 13, 72, 300])
+def test_pair_ranges_cover_every_pair_once(length):
+    ranges = verify.pair_ranges(length, block=50)
+    assert ranges[0][0] == 1 and ranges[-1][1] == length
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    pairs = set()
+    for first, stop in ranges:
+        p, q = verify.pair_block(length, first, stop)
+        pairs.update(zip(p.tolist(), q.tolist()))
+    assert pairs == {(p, q) for p in range(1, length) for q in range(p + 1, length + 1)}
+
+
+def test_misclassification_is_reported(monkeypatch):
+    np = verify.np
+    monkeypatch.setattr(verify, "status_table", lambda codec: np.full(1 << (codec.r + 1), CORRECTED, dtype=np.uint8))
+    monkeypatch.setattr(verify, "PAIR_BLOCK", 10)
+    result, = verify.verify_widths([8], workers=1)
+    assert not result.ok
+    assert len(result.mismatches) == verify.MAX_REPORTED
+    mismatch = result.mismatches[0]
+    assert (mismatch.expected, mismatch.status) == (DOUBLE, CORRECTED)
+    assert "beklenen double, bulunan corrected" in verify.describe(mismatch)
+
+
+def test_command_line(capsys):
+    assert parse_widths(["8", "1-3", "2"]) == [1, 2, 3, 8]
+    with pytest.raises(ValueError):
+        parse_widths(["x"])
+    assert main(["verify", "--workers", "1", "4", "1-2"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split("\t")[:2] for line in lines] == [["(4,1)", "OK"], ["(6,2)", "OK"], ["(8,4)", "OK"]]
+    assert main(["verify", "--family", "hsiao", "--workers", "1", "32"]) == 0
+    assert main(["verify", "0"]) == 2